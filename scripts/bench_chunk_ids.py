@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Measure chunk ID hashing cost per scheme across chunk sizes."""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from paperta.ingestion import ID_SCHEMES, _hash_chunk, _section_id_state  # noqa: E402
+
+
+_FILLER = "lexical retrieval over paragraph chunks with stable ids "
+
+
+def _legacy_ids(texts: list[str]) -> None:
+    """Hash chunks the pre-registry way: one f-string payload per chunk.
+
+    Args:
+        texts: Chunk texts.
+    """
+    for text in texts:
+        hashlib.sha256(f"bench|Section 1|{text}".encode("utf-8")).hexdigest()[:16]
+
+
+def _scheme_ids(scheme: str, texts: list[str]) -> None:
+    """Hash chunks from a primed per-section state, as ingestion does.
+
+    Args:
+        scheme: Chunk ID scheme name.
+        texts: Chunk texts.
+    """
+    state = _section_id_state(scheme, "bench", "Section 1")
+    for text in texts:
+        _hash_chunk(state, text)
+
+
+def _timed(fn, *args) -> float:
+    """Time one call.
+
+    Args:
+        fn: Callable to time.
+        *args: Positional arguments.
+
+    Returns:
+        Elapsed seconds.
+    """
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the chunk ID hashing micro-benchmark CLI."""
+    parser = argparse.ArgumentParser(description="Benchmark chunk ID schemes")
+    parser.add_argument("--chunks", type=int, default=50_000)
+    parser.add_argument("--text-lens", type=int, nargs="+", default=[200, 1000, 4000])
+    args = parser.parse_args()
+
+    per_chunk = 1e6 / args.chunks
+    report: dict[str, object] = {"chunks": args.chunks, "us_per_chunk": {}}
+    for text_len in args.text_lens:
+        body = (_FILLER * (text_len // len(_FILLER) + 1))[:text_len]
+        texts = [f"{idx} {body}" for idx in range(args.chunks)]
+        row = {"legacy_sha256": round(_timed(_legacy_ids, texts) * per_chunk, 2)}
+        for scheme in ID_SCHEMES:
+            row[scheme] = round(_timed(_scheme_ids, scheme, texts) * per_chunk, 2)
+        report["us_per_chunk"][f"text_len={text_len}"] = row
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
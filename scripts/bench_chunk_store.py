@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Compare memory retained by ingested papers in tuple and columnar layouts."""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import resource
+import subprocess
+import sys
+import tracemalloc
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from paperta.contracts import SectionInput  # noqa: E402
+from paperta.ingestion import ingest_document  # noqa: E402
+
+
+_PAPER_ID = "bench-paper"
+_SECTIONS = 20
+
+
+def _sections(chunks: int, words: int, vocab: int, seed: int) -> tuple[SectionInput, ...]:
+    """Build synthetic sections of blank-line separated paragraphs.
+
+    Args:
+        chunks: Total number of paragraphs (one chunk each).
+        words: Words per paragraph.
+        vocab: Distinct words to draw from.
+        seed: Random seed.
+
+    Returns:
+        Section inputs.
+    """
+    rng = random.Random(seed)
+    lexicon = [f"w{idx}x" for idx in range(vocab)]
+    paragraphs = [
+        " ".join(rng.choice(lexicon) for _ in range(words)) + "." for _ in range(chunks)
+    ]
+    per_section = -(-chunks // _SECTIONS)
+    return tuple(
+        SectionInput(
+            label=f"Section {idx + 1}",
+            text="\n\n".join(paragraphs[idx * per_section : (idx + 1) * per_section]),
+        )
+        for idx in range(_SECTIONS)
+        if paragraphs[idx * per_section : (idx + 1) * per_section]
+    )
+
+
+def _peak_rss_kib() -> int:
+    """Return peak resident set size of this process.
+
+    Returns:
+        Peak RSS in KiB.
+    """
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage // 1024 if sys.platform == "darwin" else usage
+
+
+def _measure(layout: str, args: argparse.Namespace) -> dict[str, float]:
+    """Ingest the synthetic paper in one layout and measure what it retains.
+
+    Args:
+        layout: `tuple` or `columnar`.
+        args: Parsed CLI arguments.
+
+    Returns:
+        Retained MiB (tracemalloc, excluding the section texts) and peak RSS MiB.
+    """
+    sections = _sections(args.chunks, args.words, args.vocab, args.seed)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    paper = ingest_document(_PAPER_ID, sections, columnar=layout == "columnar")
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    assert len(paper.chunks) == args.chunks
+    return {
+        "retained_mib": round(retained / 2**20, 1),
+        "peak_rss_mib": round(_peak_rss_kib() / 1024, 1),
+    }
+
+
+def main() -> None:
+    """Run the ingested paper memory benchmark CLI."""
+    parser = argparse.ArgumentParser(description="Benchmark memory retained by ingest_document")
+    parser.add_argument("--chunks", type=int, default=50_000)
+    parser.add_argument("--words", type=int, default=60)
+    parser.add_argument("--vocab", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--layout", choices=("tuple", "columnar"), default=None)
+    args = parser.parse_args()
+
+    if args.layout is not None:
+        print(json.dumps(_measure(args.layout, args)))
+        return
+
+    report: dict[str, object] = {"chunks": args.chunks, "words_per_chunk": args.words}
+    for layout in ("tuple", "columnar"):
+        # One process per layout, so peak RSS is not shared between them.
+        out = subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--layout",
+                layout,
+                "--chunks",
+                str(args.chunks),
+                "--words",
+                str(args.words),
+                "--vocab",
+                str(args.vocab),
+                "--seed",
+                str(args.seed),
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        report[layout] = json.loads(out.stdout)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Compare fresh and page-cached extraction of a revised PDF."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from io import BytesIO
+from pathlib import Path
+from typing import Callable
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from paperta.pdf_utils import extract_text_from_pdf, page_digests  # noqa: E402
+
+
+_LINE = "Transformer attention layers scale quadratically with the context length {tag}."
+
+
+def _synthetic_pdf(tags: list[str], lines_per_page: int) -> bytes:
+    """Build a text-layer PDF with one tagged dense page per tag.
+
+    Args:
+        tags: Per-page text tag; equal tags give identical pages.
+        lines_per_page: Text lines per page.
+
+    Returns:
+        PDF bytes.
+    """
+    from pypdf import PdfWriter
+    from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+    font = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/Font"),
+            NameObject("/Subtype"): NameObject("/Type1"),
+            NameObject("/BaseFont"): NameObject("/Helvetica"),
+        }
+    )
+    writer = PdfWriter()
+    for tag in tags:
+        page = writer.add_blank_page(612, 792)
+        ops = ["BT /F1 9 Tf 11 TL 40 760 Td"]
+        ops.extend(f"({_LINE.format(tag=tag)}) Tj T*" for _ in range(lines_per_page))
+        ops.append("ET")
+        stream = DecodedStreamObject()
+        stream.set_data("\n".join(ops).encode("latin-1"))
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+        page.replace_contents(stream)
+    buffer = BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def _best_of(repeats: int, func: Callable[[], object]) -> float:
+    """Time a callable, keeping the fastest run.
+
+    Args:
+        repeats: Number of runs.
+        func: Zero-argument callable.
+
+    Returns:
+        Fastest elapsed seconds.
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Run the incremental extraction benchmark CLI."""
+    parser = argparse.ArgumentParser(description="Benchmark page-cached PDF re-extraction")
+    parser.add_argument("--pages", type=int, default=40)
+    parser.add_argument("--changed", type=int, default=3)
+    parser.add_argument("--lines-per-page", type=int, default=60)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    original = [f"v1 page {idx}" for idx in range(args.pages)]
+    # The revision edits a few pages and inserts a cover, renumbering every object.
+    revised = ["v2 cover"] + [
+        f"v2 page {idx}" if idx % max(1, args.pages // args.changed) == 1 else tag
+        for idx, tag in enumerate(original)
+    ]
+    v1 = _synthetic_pdf(original, args.lines_per_page)
+    v2 = _synthetic_pdf(revised, args.lines_per_page)
+
+    primed: dict[str, str] = {}
+    extract_text_from_pdf(v1, page_texts=primed)
+    fresh = _best_of(args.repeats, lambda: extract_text_from_pdf(v2))
+    cached = _best_of(args.repeats, lambda: extract_text_from_pdf(v2, page_texts=dict(primed)))
+    digests = _best_of(args.repeats, lambda: page_digests(v2))
+    assert extract_text_from_pdf(v2, page_texts=dict(primed)) == extract_text_from_pdf(v2)
+
+    report = {
+        "pages": len(revised),
+        "pages_reextracted": len(set(page_digests(v2)) - set(primed)),
+        "fresh_s": round(fresh, 4),
+        "page_cached_s": round(cached, 4),
+        "digests_only_s": round(digests, 4),
+        "speedup": round(fresh / cached, 2),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Compare per-call overhead of fresh and pooled LLM clients against a local stub server."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from paperta import llm_providers  # noqa: E402
+
+
+_COMPLETION = json.dumps(
+    {
+        "id": "chatcmpl-stub",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "stub",
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": "ok"},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+    }
+).encode("utf-8")
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """OpenAI-compatible chat completion endpoint that counts connections."""
+
+    protocol_version = "HTTP/1.1"
+    connections = 0
+    _lock = threading.Lock()
+
+    def setup(self) -> None:
+        """Count each accepted TCP connection."""
+        with _StubHandler._lock:
+            _StubHandler.connections += 1
+        super().setup()
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        """Answer any POST with a fixed chat completion."""
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(_COMPLETION)))
+        self.end_headers()
+        self.wfile.write(_COMPLETION)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        """Silence per-request logging.
+
+        Args:
+            format: Log format string.
+            *args: Format arguments.
+        """
+
+
+def _run(calls: int, call: Callable[[], object]) -> tuple[float, int]:
+    """Time a number of calls and count the connections they opened.
+
+    Args:
+        calls: Number of calls.
+        call: Zero-argument callable issuing one completion.
+
+    Returns:
+        Tuple of (seconds per call, connections opened).
+    """
+    before = _StubHandler.connections
+    start = time.perf_counter()
+    for _ in range(calls):
+        call()
+    elapsed = time.perf_counter() - start
+    return elapsed / calls, _StubHandler.connections - before
+
+
+def main() -> None:
+    """Run the client pooling benchmark CLI."""
+    parser = argparse.ArgumentParser(description="Benchmark pooled vs per-call LLM clients")
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    from openai import OpenAI
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    os.environ["OPENAI_API_KEY"] = "stub"
+    os.environ["OPENAI_BASE_URL"] = base_url
+    messages = [{"role": "system", "content": "system"}, {"role": "user", "content": "user"}]
+
+    def fresh_call() -> None:
+        # The previous behavior: a new client, and so a new pool, per call.
+        OpenAI(api_key="stub", base_url=base_url).chat.completions.create(
+            model="stub", messages=messages
+        )
+
+    def pooled_call() -> None:
+        llm_providers._call_openai("stub", "system", "user")
+
+    pooled_call()  # build the shared client outside the timed loop
+    fresh_s, fresh_conns = _run(args.calls, fresh_call)
+    pooled_s, pooled_conns = _run(args.calls, pooled_call)
+    llm_providers.close_clients()
+    server.shutdown()
+
+    report = {
+        "calls": args.calls,
+        "fresh_ms_per_call": round(fresh_s * 1000, 3),
+        "pooled_ms_per_call": round(pooled_s * 1000, 3),
+        "fresh_connections": fresh_conns,
+        "pooled_connections": pooled_conns,
+        "speedup": round(fresh_s / pooled_s, 2),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
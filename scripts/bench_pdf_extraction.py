@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Compare sequential and process-pool PDF text extraction across page counts."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from io import BytesIO
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from paperta.pdf_utils import extract_text_from_pdf  # noqa: E402
+
+
+_LINE = "Transformer attention layers scale quadratically with the context length {idx}."
+
+
+def _synthetic_pdf(page_count: int, lines_per_page: int) -> bytes:
+    """Build a text-layer PDF with dense single-column pages.
+
+    Args:
+        page_count: Number of pages.
+        lines_per_page: Text lines per page.
+
+    Returns:
+        PDF bytes.
+    """
+    from pypdf import PdfWriter
+    from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+    font = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/Font"),
+            NameObject("/Subtype"): NameObject("/Type1"),
+            NameObject("/BaseFont"): NameObject("/Helvetica"),
+        }
+    )
+    writer = PdfWriter()
+    for page_idx in range(page_count):
+        page = writer.add_blank_page(612, 792)
+        ops = ["BT /F1 9 Tf 11 TL 40 760 Td"]
+        ops.extend(f"({_LINE.format(idx=page_idx)}) Tj T*" for _ in range(lines_per_page))
+        ops.append("ET")
+        stream = DecodedStreamObject()
+        stream.set_data("\n".join(ops).encode("latin-1"))
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+        page.replace_contents(stream)
+    buffer = BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def _timed(content: bytes, workers: int) -> tuple[float, str]:
+    """Time one extraction.
+
+    Args:
+        content: PDF bytes.
+        workers: Extraction processes.
+
+    Returns:
+        Tuple of (elapsed seconds, extracted text).
+    """
+    start = time.perf_counter()
+    text = extract_text_from_pdf(content, workers=workers)
+    return time.perf_counter() - start, text
+
+
+def main() -> None:
+    """Run the PDF extraction benchmark CLI."""
+    parser = argparse.ArgumentParser(description="Benchmark parallel PDF extraction")
+    parser.add_argument("--pages", type=int, nargs="+", default=[10, 40, 300])
+    parser.add_argument("--lines-per-page", type=int, default=60)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    rows = []
+    for page_count in args.pages:
+        content = _synthetic_pdf(page_count, args.lines_per_page)
+        sequential, expected = _timed(content, 1)
+        parallel, text = _timed(content, args.workers)
+        if text != expected:
+            raise SystemExit(f"parallel output differs at {page_count} pages")
+        rows.append(
+            {
+                "pages": page_count,
+                "sequential_s": round(sequential, 3),
+                "parallel_s": round(parallel, 3),
+                "speedup": round(sequential / parallel, 2),
+            }
+        )
+    print(json.dumps({"workers": args.workers, "runs": rows}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Compare peak RSS of bytes-based and path-based PDF extraction on a large file."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from paperta.pdf_utils import extract_text_from_path, extract_text_from_pdf  # noqa: E402
+
+
+def _write_large_pdf(path: str, pages: int, payload_mb: int) -> None:
+    """Write a text PDF padded with an embedded binary payload.
+
+    The payload stands in for the scanned images of a proceedings volume: it
+    inflates the file without adding text to extract.
+
+    Args:
+        path: Output path.
+        pages: Number of text pages.
+        payload_mb: Size of the embedded payload in MiB.
+    """
+    from pypdf import PdfWriter
+    from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+    font = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/Font"),
+            NameObject("/Subtype"): NameObject("/Type1"),
+            NameObject("/BaseFont"): NameObject("/Helvetica"),
+        }
+    )
+    writer = PdfWriter()
+    for page_idx in range(pages):
+        page = writer.add_blank_page(612, 792)
+        stream = DecodedStreamObject()
+        lines = (f"(Proceedings page {page_idx} line {idx}.) Tj T*" for idx in range(50))
+        stream.set_data(("BT /F1 9 Tf 11 TL 40 760 Td\n" + "\n".join(lines) + "\nET").encode())
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+        page.replace_contents(stream)
+    writer.add_attachment("scans.bin", os.urandom(payload_mb * 1024 * 1024))
+    with open(path, "wb") as handle:
+        writer.write(handle)
+
+
+def _peak_rss_mib() -> float:
+    """Return peak resident set size of this process.
+
+    Returns:
+        Peak RSS in MiB.
+    """
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage / (1024 * 1024) if sys.platform == "darwin" else usage / 1024
+
+
+def _measure(mode: str, path: str) -> float:
+    """Extract one file in this process and report peak RSS.
+
+    Args:
+        mode: `none`, `bytes`, or `path`.
+        path: PDF path.
+
+    Returns:
+        Peak RSS in MiB.
+    """
+    if mode == "bytes":
+        extract_text_from_pdf(Path(path).read_bytes())
+    elif mode == "path":
+        extract_text_from_path(path)
+    return _peak_rss_mib()
+
+
+def main() -> None:
+    """Run the PDF extraction memory benchmark CLI."""
+    parser = argparse.ArgumentParser(description="Benchmark PDF extraction peak RSS")
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--payload-mb", type=int, default=100)
+    parser.add_argument("--mode", choices=("write", "none", "bytes", "path"), default=None)
+    parser.add_argument("--file", default=None)
+    args = parser.parse_args()
+
+    if args.mode == "write":
+        _write_large_pdf(args.file, args.pages, args.payload_mb)
+        return
+    if args.mode is not None:
+        print(_measure(args.mode, args.file))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "large.pdf")
+        # Build the file in a child so this process's peak RSS stays small;
+        # Linux children inherit the parent's high-water mark.
+        subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--mode",
+                "write",
+                "--file",
+                path,
+                "--pages",
+                str(args.pages),
+                "--payload-mb",
+                str(args.payload_mb),
+            ],
+            check=True,
+        )
+        rss = {}
+        for mode in ("none", "bytes", "path"):
+            out = subprocess.run(
+                [sys.executable, __file__, "--mode", mode, "--file", path],
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+            rss[mode] = float(out.stdout.strip())
+        report = {
+            "file_mib": round(os.path.getsize(path) / (1024 * 1024), 1),
+            "pages": args.pages,
+            "peak_rss_mib": {mode: round(value, 1) for mode, value in rss.items()},
+        }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Compare LLM prompt size of indented-JSON and compact evidence encodings per mode."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from paperta.contracts import SectionInput  # noqa: E402
+from paperta.llm_providers import _build_user_prompt, _to_primitive  # noqa: E402
+from paperta.multi_paper_contracts import PaperInput  # noqa: E402
+from paperta.pipeline import (  # noqa: E402
+    run_phase1_pipeline,
+    run_phase2_teach_pipeline,
+    run_phase3_reviewer_pipeline,
+    run_phase4_multi_paper_pipeline,
+)
+
+
+_LABELS = ("Abstract", "Introduction", "Related Work", "Method", "Experiments", "Results")
+_WORDS = (
+    "transformer attention robustness distribution shift dataset baseline accuracy "
+    "ablation training objective loss encoder decoder benchmark evaluation retrieval "
+    "sparse dense latency memory throughput calibration improves outperforms reduces"
+).split()
+_QUERY = "robustness under distribution shift and evaluation results"
+# Fallback token estimate when tiktoken is unavailable: words, punctuation marks, and
+# line breaks with their indentation (BPE vocabularies encode each run as ~1 token).
+_PROXY_TOKEN_RE = re.compile(r"\w+|[^\w\s]|\n[ \t]*")
+
+
+def _sections(rng: random.Random, paragraphs: int) -> tuple[SectionInput, ...]:
+    """Build synthetic sections of varied sentences.
+
+    Args:
+        rng: Seeded random generator.
+        paragraphs: Paragraphs per section.
+
+    Returns:
+        Section inputs.
+    """
+    sections = []
+    for label in _LABELS:
+        paras = []
+        for _ in range(paragraphs):
+            sentences = [
+                " ".join(rng.choice(_WORDS) for _ in range(14)).capitalize() + "."
+                for _ in range(4)
+            ]
+            paras.append(" ".join(sentences))
+        sections.append(SectionInput(label=label, text="\n\n".join(paras)))
+    return tuple(sections)
+
+
+def _legacy_prompt(mode: str, query: str, evidence: Any) -> str:
+    """Build the user prompt the pre-compaction way (indented full JSON).
+
+    Args:
+        mode: Pipeline mode.
+        query: User query.
+        evidence: Pipeline result.
+
+    Returns:
+        User prompt string.
+    """
+    evidence_json = json.dumps(_to_primitive(evidence), indent=2)
+    return (
+        f"Query: {query}\n\n"
+        f"Evidence from deterministic analysis:\n```json\n{evidence_json}\n```\n\n"
+        f"Based on this evidence, provide an enhanced {mode} analysis. "
+        f"Cite chunk IDs from the evidence in your response."
+    )
+
+
+def _token_counter() -> tuple[str, Callable[[str], int]]:
+    """Pick a token counter, preferring tiktoken when installed.
+
+    Returns:
+        Tuple of (counter name, counting function).
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        proxy_name = "proxy(words+punctuation+line breaks)"
+        return proxy_name, lambda text: len(_PROXY_TOKEN_RE.findall(text))
+    encoding = tiktoken.get_encoding("o200k_base")
+    return "tiktoken/o200k_base", lambda text: len(encoding.encode(text))
+
+
+def main() -> None:
+    """Run the prompt token benchmark CLI."""
+    parser = argparse.ArgumentParser(description="Benchmark evidence encoding size per mode")
+    parser.add_argument("--paragraphs", type=int, default=6)
+    parser.add_argument("--top-k", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    paper = _sections(rng, args.paragraphs)
+    other = _sections(rng, args.paragraphs)
+    k = args.top_k
+    results = {
+        "summary": run_phase1_pipeline("paper-a", paper, _QUERY, top_k=k),
+        "teach": run_phase2_teach_pipeline("paper-a", paper, _QUERY, top_k=k),
+        "reviewer": run_phase3_reviewer_pipeline("paper-a", paper, _QUERY, top_k=k),
+        "multi_paper": run_phase4_multi_paper_pipeline(
+            (PaperInput("paper-a", paper), PaperInput("paper-b", other)), _QUERY, top_k=k
+        ),
+    }
+
+    counter_name, count = _token_counter()
+    report: dict[str, Any] = {"token_counter": counter_name, "modes": {}}
+    for mode, result in results.items():
+        legacy = _legacy_prompt(mode, _QUERY, result)
+        start = time.perf_counter()
+        compact = _build_user_prompt(mode, _QUERY, result)
+        encode_s = time.perf_counter() - start
+        legacy_tokens, compact_tokens = count(legacy), count(compact)
+        report["modes"][mode] = {
+            "legacy_tokens": legacy_tokens,
+            "compact_tokens": compact_tokens,
+            "token_reduction": round(1 - compact_tokens / legacy_tokens, 3),
+            "legacy_chars": len(legacy),
+            "compact_chars": len(compact),
+            "compact_encode_ms": round(encode_s * 1000, 3),
+        }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
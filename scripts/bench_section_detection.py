@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""Compare the legacy two-pass section detector with the single-pass detector."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from paperta.contracts import SectionInput  # noqa: E402
+from paperta.pdf_utils import (  # noqa: E402
+    _HEADING_RE,
+    _PAGE_NUM_RE,
+    _fallback_chunking,
+    _normalize_heading,
+    detect_sections,
+)
+
+
+_LEGACY_PROCEEDINGS_RE = re.compile(
+    r"^.*(?:proceedings|conference|journal|volume|pages?\s+\d).*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+_WORDS = (
+    "the model attention layer results we show that training data loss method "
+    "section figure table proposed approach baseline"
+).split()
+
+
+def _legacy_detect_sections(text: str) -> tuple[SectionInput, ...]:
+    """Run the previous clean-then-classify detector.
+
+    Args:
+        text: Extracted paper text.
+
+    Returns:
+        Detected sections.
+    """
+    cleaned_lines = []
+    for line in _PAGE_NUM_RE.sub("", text).splitlines():
+        stripped = line.strip()
+        if not stripped:
+            cleaned_lines.append("")
+        elif not (_LEGACY_PROCEEDINGS_RE.match(stripped) and len(stripped) < 200):
+            cleaned_lines.append(line)
+    cleaned = "\n".join(cleaned_lines)
+
+    sections: list[tuple[str, list[str]]] = []
+    label, lines = "Preamble", []
+    for line in cleaned.splitlines():
+        stripped = line.strip()
+        if stripped and _legacy_is_heading(stripped):
+            if lines and "\n".join(lines).strip():
+                sections.append((label, lines[:]))
+            label, lines = _normalize_heading(stripped), []
+        else:
+            lines.append(line)
+    if lines and "\n".join(lines).strip():
+        sections.append((label, lines))
+
+    seen: dict[str, int] = {}
+    result = []
+    for label, body_lines in sections:
+        body = "\n".join(body_lines).strip()
+        if len(body) < 20:
+            continue
+        if label in seen:
+            seen[label] += 1
+            label = f"{label} ({seen[label]})"
+        else:
+            seen[label] = 1
+        result.append(SectionInput(label=label, text=body))
+    return tuple(result[:20]) if result else _fallback_chunking(cleaned)
+
+
+def _legacy_is_heading(line: str) -> bool:
+    """Classify a heading the previous way, without the first-character filter.
+
+    Args:
+        line: Stripped text line.
+
+    Returns:
+        True if the line matches heading patterns.
+    """
+    if len(line) > 120:
+        return False
+    return bool(_HEADING_RE.match(line)) or (line.isupper() and 3 < len(line) < 60)
+
+
+def _corpus(megabytes: float, heading_rate: float, seed: int = 0) -> str:
+    """Build synthetic extracted text with headings, page numbers and noise.
+
+    Args:
+        megabytes: Approximate size in MB.
+        heading_rate: Probability that a line is a numbered heading.
+        seed: Random seed.
+
+    Returns:
+        Synthetic text.
+    """
+    rng = random.Random(seed)
+    out, size, number = [], 0, 1
+    while size < megabytes * 1_000_000:
+        roll = rng.random()
+        if roll < heading_rate:
+            line = f"{number}. {rng.choice(('Introduction', 'Method', 'Results'))}"
+            number += 1
+        elif roll < 0.02:
+            line = str(rng.randint(1, 400))
+        elif roll < 0.025:
+            line = "Proceedings of the 40th International Conference on Machine Learning"
+        elif roll < 0.08:
+            line = ""
+        else:
+            line = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(5, 14))) + "."
+        out.append(line)
+        size += len(line) + 1
+    return "\n".join(out)
+
+
+def _run(fn, text: str) -> tuple[float, float, tuple[SectionInput, ...]]:
+    """Time one detector, then measure its peak traced allocation.
+
+    Args:
+        fn: Detector function.
+        text: Input text.
+
+    Returns:
+        Tuple of (seconds, peak MiB above the input, sections).
+    """
+    start = time.perf_counter()
+    result = fn(text)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    fn(text)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / (1024 * 1024), result
+
+
+def main() -> None:
+    """Run the section detection benchmark CLI."""
+    parser = argparse.ArgumentParser(description="Benchmark section detection")
+    parser.add_argument("--sizes-mb", type=float, nargs="+", default=[1, 4, 16])
+    args = parser.parse_args()
+
+    rows = []
+    # "sparse" never reaches the 20-section cap, so both detectors scan everything.
+    for corpus, heading_rate in (("sparse", 0.000002), ("dense", 0.01)):
+        for megabytes in args.sizes_mb:
+            text = _corpus(megabytes, heading_rate)
+            legacy_s, legacy_mib, expected = _run(_legacy_detect_sections, text)
+            single_s, single_mib, sections = _run(detect_sections, text)
+            if sections != expected:
+                raise SystemExit(f"output differs: {corpus} {megabytes} MB")
+            rows.append(
+                {
+                    "corpus": corpus,
+                    "mb": megabytes,
+                    "legacy_s": round(legacy_s, 3),
+                    "single_pass_s": round(single_s, 3),
+                    "speedup": round(legacy_s / single_s, 1),
+                    "legacy_peak_mib": round(legacy_mib, 1),
+                    "single_pass_peak_mib": round(single_mib, 1),
+                }
+            )
+    print(json.dumps(rows, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Measure per-chunk text processing with and without the ingest-time token cache."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from paperta.contracts import IngestedPaper, SectionInput  # noqa: E402
+from paperta.ingestion import ingest_document  # noqa: E402
+from paperta.text_utils import scan_text, tokenize  # noqa: E402
+
+
+_SPACE_RE = re.compile(r"\s+")
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_QUERIES = ("transformer attention", "training objective loss", "ablation results", "dataset split")
+
+
+def _sections(chunks: int) -> tuple[SectionInput, ...]:
+    """Build synthetic sections with PDF-style line breaks and ligatures.
+
+    Args:
+        chunks: Total number of paragraphs.
+
+    Returns:
+        Section inputs.
+    """
+    para = (
+        "The eﬃcient trans-\nformer uses attention layers over long\ncontexts, and the "
+        "training objective minimizes cross entropy loss on the held-out dataset split."
+    )
+    per_section = max(1, chunks // 10)
+    body = "\n\n".join([para] * per_section)
+    return tuple(SectionInput(label=f"Section {idx}", text=body) for idx in range(10))
+
+
+def _score_legacy(normalized: list[str], queries: tuple[str, ...]) -> None:
+    """Score chunks the pre-cache way: re-tokenize every chunk for every query.
+
+    Args:
+        normalized: Normalized chunk texts.
+        queries: Queries to score.
+    """
+    for query in queries:
+        q_tokens = set(_TOKEN_RE.findall(query.lower()))
+        for text in normalized:
+            len(q_tokens.intersection(set(_TOKEN_RE.findall(text.lower()))))
+
+
+def _score_cached(paper: IngestedPaper, queries: tuple[str, ...]) -> None:
+    """Score chunks against the ingest-time token index.
+
+    Args:
+        paper: Ingested paper with its token index.
+        queries: Queries to score.
+    """
+    index = paper.token_index
+    for query in queries:
+        scores: dict[int, int] = {}
+        for token in set(tokenize(query)):
+            for pos in index.positions(token):
+                scores[pos] = scores.get(pos, 0) + 1
+
+
+def _timed(fn, *args) -> float:
+    """Time one call.
+
+    Args:
+        fn: Callable to time.
+        *args: Positional arguments.
+
+    Returns:
+        Elapsed seconds.
+    """
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the text scan micro-benchmark CLI."""
+    parser = argparse.ArgumentParser(description="Benchmark per-chunk text processing")
+    parser.add_argument("--chunks", type=int, default=20_000)
+    args = parser.parse_args()
+
+    sections = _sections(args.chunks)
+    texts = [p for s in sections for p in s.text.split("\n\n")]
+    normalized = [_SPACE_RE.sub(" ", text.strip()) for text in texts]
+    paper = ingest_document(paper_id="bench", sections=sections)
+
+    per_chunk = 1e6 / len(texts)
+    per_chunk_query = per_chunk / len(_QUERIES)
+    legacy_ingest = _timed(lambda: [_SPACE_RE.sub(" ", t.strip()) for t in texts])
+    scan_ingest = _timed(lambda: [scan_text(t) for t in texts])
+    legacy_score = _timed(_score_legacy, normalized, _QUERIES)
+    cached_score = _timed(_score_cached, paper, _QUERIES)
+    report = {
+        "chunks": len(texts),
+        "queries": len(_QUERIES),
+        "ingest_us_per_chunk": {
+            "legacy_normalize": round(legacy_ingest * per_chunk, 2),
+            "scan_text": round(scan_ingest * per_chunk, 2),
+        },
+        "score_us_per_chunk_per_query": {
+            "legacy_retokenize": round(legacy_score * per_chunk_query, 2),
+            "cached_tokens": round(cached_score * per_chunk_query, 2),
+        },
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,569 @@
+"""Columnar, memory-compact chunk storage."""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import overload
+
+from paperta.contracts import Chunk, SectionInput
+from paperta.text_utils import normalize_text
+
+
+_ID_WIDTH = 8
+
+
+def _encode_chunk_id(chunk_id: str) -> bytes:
+    """Encode a hex chunk ID into its fixed-width binary form.
+
+    Args:
+        chunk_id: 16-character hex chunk ID.
+
+    Returns:
+        8-byte binary chunk ID.
+
+    Raises:
+        ValueError: If the chunk ID is not 16 hex characters.
+    """
+    if len(chunk_id) != 2 * _ID_WIDTH:
+        raise ValueError("chunk_id must be 16 hex characters")
+    try:
+        return bytes.fromhex(chunk_id)
+    except ValueError as exc:
+        raise ValueError("chunk_id must be 16 hex characters") from exc
+
+
+def _pack_sentences(
+    sentence_ends: Sequence[bytes] | None,
+) -> tuple[bytearray | None, array | None]:
+    """Concatenate per-chunk packed sentence offsets into one column.
+
+    Args:
+        sentence_ends: Per-chunk packed sentence offsets, or None.
+
+    Returns:
+        Tuple of (concatenated offsets, byte offsets per chunk), or Nones.
+    """
+    if sentence_ends is None:
+        return None, None
+    buffer = bytearray()
+    offsets = array("Q", [0])
+    for packed in sentence_ends:
+        buffer += packed
+        offsets.append(len(buffer))
+    return buffer, offsets
+
+
+class ChunkStore(Sequence[Chunk]):
+    """Columnar chunk corpus for one paper.
+
+    Sections are stored as indices into an interned label table and chunk IDs
+    are packed as fixed-width 8-byte binary keys. Chunk text lives either in
+    a single concatenated UTF-8 buffer addressed by an offsets array, or, for
+    span-backed stores, as `(start, end)` offsets into the original section
+    text that are normalized only when a chunk is read. Indexing returns
+    lazily built `Chunk` views, so the store is a drop-in replacement for a
+    tuple of chunks.
+    """
+
+    __slots__ = (
+        "_paper_id",
+        "_labels",
+        "_section_index",
+        "_ids",
+        "_text",
+        "_offsets",
+        "_spans",
+        "_sources",
+        "_aliases",
+        "_sentences",
+        "_sentence_offsets",
+        "_fold_pdf_artifacts",
+    )
+
+    def __init__(
+        self,
+        paper_id: str,
+        labels: tuple[str, ...],
+        section_index: array,
+        ids: bytes | bytearray,
+        text: bytes | bytearray | None = None,
+        offsets: array | None = None,
+        spans: array | None = None,
+        sources: tuple[str, ...] | None = None,
+        aliases: Mapping[int, tuple[str, ...]] | None = None,
+        sentences: bytes | bytearray | None = None,
+        sentence_offsets: array | None = None,
+        fold_pdf_artifacts: bool = False,
+    ) -> None:
+        """Wrap prebuilt columns. Prefer `build`, `from_spans` or `from_chunks`.
+
+        Args:
+            paper_id: Paper identifier shared by every chunk.
+            labels: Interned section label table.
+            section_index: Per-chunk index into `labels`.
+            ids: Concatenated 8-byte binary chunk IDs.
+            text: Concatenated UTF-8 chunk text (buffer-backed stores).
+            offsets: Byte offsets into `text`, one more than the chunk count.
+            spans: Flat `start, end` character offsets per chunk, `-1` if unknown.
+            sources: Original section texts, parallel to `labels` (span-backed stores).
+            aliases: Sparse near-duplicate alias IDs keyed by chunk position.
+            sentences: Concatenated packed sentence end offsets of every chunk.
+            sentence_offsets: Byte offsets into `sentences`, one more than the chunk count.
+            fold_pdf_artifacts: Fold PDF artifacts when normalizing span-backed text.
+
+        Raises:
+            ValueError: If column lengths are inconsistent.
+        """
+        count = len(section_index)
+        if len(ids) != count * _ID_WIDTH:
+            raise ValueError("chunk store columns have inconsistent lengths")
+        if spans is not None and len(spans) != 2 * count:
+            raise ValueError("chunk store columns have inconsistent lengths")
+        if sources is None:
+            if text is None or offsets is None or len(offsets) != count + 1:
+                raise ValueError("chunk store columns have inconsistent lengths")
+        elif spans is None or len(sources) != len(labels):
+            raise ValueError("span-backed chunk store needs spans and one source per label")
+        if (sentences is None) != (sentence_offsets is None) or (
+            sentence_offsets is not None and len(sentence_offsets) != count + 1
+        ):
+            raise ValueError("chunk store columns have inconsistent lengths")
+        self._paper_id = sys.intern(paper_id)
+        self._labels = tuple(sys.intern(label) for label in labels)
+        self._section_index = section_index
+        self._ids = ids
+        self._text = text
+        self._offsets = offsets
+        self._spans = spans
+        self._sources = sources
+        self._aliases = dict(aliases or {})
+        self._sentences = sentences
+        self._sentence_offsets = sentence_offsets
+        self._fold_pdf_artifacts = fold_pdf_artifacts
+
+    @classmethod
+    def build(
+        cls,
+        paper_id: str,
+        labels: Sequence[str],
+        records: Iterable[tuple[str, int, str]],
+        aliases: Mapping[int, tuple[str, ...]] | None = None,
+        spans: Sequence[tuple[int, int] | None] | None = None,
+        sentence_ends: Sequence[bytes] | None = None,
+    ) -> ChunkStore:
+        """Build a buffer-backed store from `(chunk_id, section_index, text)` records.
+
+        Args:
+            paper_id: Paper identifier shared by every chunk.
+            labels: Ordered section label table.
+            records: Chunk records referencing `labels` by index.
+            aliases: Sparse near-duplicate alias IDs keyed by record position.
+            spans: Optional per-record source spans, parallel to `records`.
+            sentence_ends: Optional per-record packed sentence offsets, parallel to `records`.
+
+        Returns:
+            Columnar chunk store.
+
+        Raises:
+            ValueError: If a record has a malformed ID or unknown section index.
+        """
+        text = bytearray()
+        offsets = array("Q", [0])
+        section_index = array("I")
+        ids = bytearray()
+        for chunk_id, label_idx, chunk_text in records:
+            if not 0 <= label_idx < len(labels):
+                raise ValueError("chunk references unknown section index")
+            ids += _encode_chunk_id(chunk_id)
+            section_index.append(label_idx)
+            text += chunk_text.encode("utf-8")
+            offsets.append(len(text))
+        span_column = None
+        if spans is not None:
+            span_column = array("q")
+            for span in spans:
+                span_column.extend(span if span is not None else (-1, -1))
+        sentences, sentence_offsets = _pack_sentences(sentence_ends)
+        return cls(
+            paper_id,
+            tuple(labels),
+            section_index,
+            ids,
+            text=text,
+            offsets=offsets,
+            spans=span_column,
+            aliases=aliases,
+            sentences=sentences,
+            sentence_offsets=sentence_offsets,
+        )
+
+    @classmethod
+    def from_spans(
+        cls,
+        paper_id: str,
+        sections: Sequence[SectionInput],
+        records: Iterable[tuple[str, int, int, int]],
+        aliases: Mapping[int, tuple[str, ...]] | None = None,
+        sentence_ends: Sequence[bytes] | None = None,
+        fold_pdf_artifacts: bool = False,
+    ) -> ChunkStore:
+        """Build a span-backed store from `(chunk_id, section_index, start, end)` records.
+
+        No chunk text is copied: each chunk references a character range of
+        its section's original text and is normalized on access.
+
+        Args:
+            paper_id: Paper identifier shared by every chunk.
+            sections: Ordered source sections; records index into this sequence.
+            records: Chunk records with character offsets into the section text.
+            aliases: Sparse near-duplicate alias IDs keyed by record position.
+            sentence_ends: Optional per-record packed sentence offsets, parallel to `records`.
+            fold_pdf_artifacts: Fold PDF artifacts when normalizing chunk text, as
+                the ingest that produced the chunk IDs did.
+
+        Returns:
+            Span-backed chunk store.
+
+        Raises:
+            ValueError: If a record has a malformed ID, section index or span.
+        """
+        sources = tuple(section.text for section in sections)
+        section_index = array("I")
+        ids = bytearray()
+        spans = array("q")
+        for chunk_id, label_idx, start, end in records:
+            if not 0 <= label_idx < len(sources):
+                raise ValueError("chunk references unknown section index")
+            if not 0 <= start <= end <= len(sources[label_idx]):
+                raise ValueError("chunk span is outside its section text")
+            ids += _encode_chunk_id(chunk_id)
+            section_index.append(label_idx)
+            spans.extend((start, end))
+        sentences, sentence_offsets = _pack_sentences(sentence_ends)
+        return cls(
+            paper_id,
+            tuple(section.label for section in sections),
+            section_index,
+            ids,
+            spans=spans,
+            sources=sources,
+            aliases=aliases,
+            sentences=sentences,
+            sentence_offsets=sentence_offsets,
+            fold_pdf_artifacts=fold_pdf_artifacts,
+        )
+
+    @classmethod
+    def from_chunks(cls, paper_id: str, chunks: Iterable[Chunk]) -> ChunkStore:
+        """Pack existing chunk objects into a buffer-backed store.
+
+        Args:
+            paper_id: Paper identifier shared by every chunk.
+            chunks: Ordered chunks belonging to `paper_id`.
+
+        Returns:
+            Columnar chunk store.
+
+        Raises:
+            ValueError: If a chunk belongs to another paper or has a malformed ID.
+        """
+        label_rank: dict[str, int] = {}
+        records: list[tuple[str, int, str]] = []
+        spans: list[tuple[int, int] | None] = []
+        sentence_ends: list[bytes] = []
+        aliases: dict[int, tuple[str, ...]] = {}
+        for chunk in chunks:
+            if chunk.paper_id != paper_id:
+                raise ValueError("chunk belongs to a different paper")
+            idx = label_rank.setdefault(chunk.section, len(label_rank))
+            if chunk.alias_ids:
+                aliases[len(records)] = chunk.alias_ids
+            records.append((chunk.chunk_id, idx, chunk.text))
+            spans.append(chunk.span)
+            sentence_ends.append(chunk.sentence_ends)
+        return cls.build(
+            paper_id,
+            tuple(label_rank),
+            records,
+            aliases=aliases,
+            spans=spans if any(span is not None for span in spans) else None,
+            sentence_ends=sentence_ends if any(sentence_ends) else None,
+        )
+
+    @property
+    def paper_id(self) -> str:
+        """Paper identifier shared by every chunk.
+
+        Returns:
+            Paper identifier.
+        """
+        return self._paper_id
+
+    @property
+    def labels(self) -> tuple[str, ...]:
+        """Interned section label table.
+
+        Returns:
+            Section labels in first-seen order.
+        """
+        return self._labels
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate payload size of the columnar buffers.
+
+        Span-backed stores exclude the shared section texts they reference.
+
+        Returns:
+            Buffer size in bytes.
+        """
+        return (
+            len(self._ids)
+            + self._section_index.itemsize * len(self._section_index)
+            + (len(self._text) if self._text is not None else 0)
+            + (self._offsets.itemsize * len(self._offsets) if self._offsets is not None else 0)
+            + (self._spans.itemsize * len(self._spans) if self._spans is not None else 0)
+            + (len(self._sentences) if self._sentences is not None else 0)
+            + (
+                self._sentence_offsets.itemsize * len(self._sentence_offsets)
+                if self._sentence_offsets is not None
+                else 0
+            )
+        )
+
+    def chunk_id(self, index: int) -> str:
+        """Return the hex chunk ID at a position.
+
+        Args:
+            index: Chunk position.
+
+        Returns:
+            16-character hex chunk ID.
+        """
+        index = self._check_index(index)
+        return memoryview(self._ids)[index * _ID_WIDTH : (index + 1) * _ID_WIDTH].hex()
+
+    def section(self, index: int) -> str:
+        """Return the section label at a position.
+
+        Args:
+            index: Chunk position.
+
+        Returns:
+            Section label.
+        """
+        return self._labels[self._section_index[self._check_index(index)]]
+
+    def text(self, index: int) -> str:
+        """Decode the chunk text at a position.
+
+        Args:
+            index: Chunk position.
+
+        Returns:
+            Normalized chunk text.
+        """
+        index = self._check_index(index)
+        if self._sources is not None:
+            start, end = self._spans[2 * index], self._spans[2 * index + 1]
+            source = self._sources[self._section_index[index]]
+            return normalize_text(source[start:end], self._fold_pdf_artifacts)
+        start, end = self._offsets[index], self._offsets[index + 1]
+        return str(memoryview(self._text)[start:end], "utf-8")
+
+    def span(self, index: int) -> tuple[int, int] | None:
+        """Return the source span of the chunk at a position.
+
+        Args:
+            index: Chunk position.
+
+        Returns:
+            `(start, end)` character offsets into the section text, or None if unknown.
+        """
+        index = self._check_index(index)
+        if self._spans is None or self._spans[2 * index] < 0:
+            return None
+        return self._spans[2 * index], self._spans[2 * index + 1]
+
+    def sentence_ends(self, index: int) -> bytes:
+        """Return the packed sentence end offsets of the chunk at a position.
+
+        Args:
+            index: Chunk position.
+
+        Returns:
+            Packed offsets (see `text_utils.split_sentence_ends`), empty if not indexed.
+        """
+        index = self._check_index(index)
+        if self._sentences is None:
+            return b""
+        start, end = self._sentence_offsets[index], self._sentence_offsets[index + 1]
+        return bytes(self._sentences[start:end])
+
+    def _check_index(self, index: int) -> int:
+        """Normalize and bounds-check a chunk position.
+
+        Args:
+            index: Possibly negative chunk position.
+
+        Returns:
+            Non-negative in-range position.
+
+        Raises:
+            IndexError: If the position is out of range.
+        """
+        count = len(self._section_index)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("chunk index out of range")
+        return index
+
+    def __len__(self) -> int:
+        return len(self._section_index)
+
+    @overload
+    def __getitem__(self, index: int) -> Chunk: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[Chunk, ...]: ...
+
+    def __getitem__(self, index: int | slice) -> Chunk | tuple[Chunk, ...]:
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(*index.indices(len(self))))
+        index = self._check_index(index)
+        return Chunk(
+            chunk_id=self.chunk_id(index),
+            paper_id=self._paper_id,
+            section=self.section(index),
+            text=self.text(index),
+            alias_ids=self._aliases.get(index, ()),
+            span=self.span(index),
+            sentence_ends=self.sentence_ends(index),
+        )
+
+    def __iter__(self) -> Iterator[Chunk]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ChunkStore):
+            return NotImplemented
+        if self._paper_id != other._paper_id or self._ids != other._ids:
+            return False
+        return tuple(self) == tuple(other)
+
+    def __hash__(self) -> int:
+        return hash((self._paper_id, len(self), bytes(self._ids[: 4 * _ID_WIDTH])))
+
+    def __repr__(self) -> str:
+        return f"ChunkStore(paper_id={self._paper_id!r}, chunks={len(self)}, nbytes={self.nbytes})"
+
+
+class TokenIndex:
+    """Compact inverted index from tokens to the chunk positions containing them.
+
+    Holds one vocabulary (token to id) and a single uint32 column of chunk
+    positions grouped by token id, instead of a Python set per chunk, so the
+    token cache costs about four bytes per distinct token per chunk.
+    """
+
+    __slots__ = ("_vocab", "_postings", "_offsets", "_count")
+
+    def __init__(self, vocab: dict[str, int], postings: array, offsets: array, count: int) -> None:
+        """Wrap prebuilt columns. Prefer `build`.
+
+        Args:
+            vocab: Token to token id.
+            postings: Chunk positions grouped by token id, ascending within a token.
+            offsets: Start of each token id's positions in `postings`, plus the end.
+            count: Number of indexed chunks.
+
+        Raises:
+            ValueError: If column lengths are inconsistent.
+        """
+        if len(offsets) != len(vocab) + 1 or offsets[-1] != len(postings):
+            raise ValueError("token index columns have inconsistent lengths")
+        self._vocab = vocab
+        self._postings = postings
+        self._offsets = offsets
+        self._count = count
+
+    @classmethod
+    def build(cls, chunk_tokens: Iterable[Iterable[str]]) -> TokenIndex:
+        """Index the tokens of each chunk, in chunk order.
+
+        Args:
+            chunk_tokens: Tokens of every chunk; duplicates within a chunk are ignored.
+
+        Returns:
+            Token index over the chunk positions.
+        """
+        vocab: dict[str, int] = {}
+        positions: list[array] = []
+        count = 0
+        for position, tokens in enumerate(chunk_tokens):
+            count = position + 1
+            for token in set(tokens):
+                token_id = vocab.setdefault(sys.intern(token), len(vocab))
+                if token_id == len(positions):
+                    positions.append(array("I"))
+                positions[token_id].append(position)
+        postings = array("I")
+        offsets = array("Q", [0])
+        for column in positions:
+            postings.extend(column)
+            offsets.append(len(postings))
+        return cls(vocab, postings, offsets, count)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate payload size of the position columns.
+
+        Returns:
+            Column size in bytes, excluding the vocabulary.
+        """
+        return (
+            self._postings.itemsize * len(self._postings)
+            + self._offsets.itemsize * len(self._offsets)
+        )
+
+    def positions(self, token: str) -> array:
+        """Return the positions of the chunks containing a token.
+
+        Args:
+            token: Lowercase token.
+
+        Returns:
+            Ascending chunk positions; empty for an unknown token.
+        """
+        token_id = self._vocab.get(token)
+        if token_id is None:
+            return array("I")
+        return self._postings[self._offsets[token_id] : self._offsets[token_id + 1]]
+
+    def tokens(self, position: int) -> frozenset[str]:
+        """Rebuild the token set of one chunk (a full vocabulary scan).
+
+        Args:
+            position: Chunk position.
+
+        Returns:
+            Distinct tokens of the chunk.
+        """
+        found = []
+        for token, token_id in self._vocab.items():
+            end = self._offsets[token_id + 1]
+            idx = bisect_left(self._postings, position, self._offsets[token_id], end)
+            if idx < end and self._postings[idx] == position:
+                found.append(token)
+        return frozenset(found)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        return f"TokenIndex(chunks={self._count}, tokens={len(self._vocab)}, nbytes={self.nbytes})"
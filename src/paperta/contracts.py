@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Mapping, Sequence
+
+if TYPE_CHECKING:
+    from paperta.chunk_store import TokenIndex
 
 
 @dataclass(frozen=True)
@@ -21,15 +25,30 @@ class Chunk:
     paper_id: str
     section: str
     text: str
+    alias_ids: tuple[str, ...] = ()
+    span: tuple[int, int] | None = None
+    sentence_ends: bytes = b""
 
 
 @dataclass(frozen=True)
 class IngestedPaper:
-    """Ingestion output artifact."""
+    """Ingestion output artifact.
+
+    `chunk_index` maps every chunk ID (and near-duplicate alias ID) to its
+    position in `chunks`, so a chunk's neighbours are `position - 1` and
+    `position + 1` without scanning. `token_index`, when set, maps each
+    token to the positions of the chunks containing it. `id_scheme` names the hash
+    scheme that produced the chunk IDs, and `fold_pdf_artifacts` records
+    whether chunk text was folded before hashing.
+    """
 
     paper_id: str
-    chunks: tuple[Chunk, ...]
+    chunks: Sequence[Chunk]
     section_order: tuple[str, ...]
+    chunk_index: Mapping[str, int] = field(default_factory=dict, compare=False, repr=False)
+    token_index: TokenIndex | None = field(default=None, compare=False, repr=False)
+    id_scheme: str = "sha256-v1"
+    fold_pdf_artifacts: bool = False
 
 
 @dataclass(frozen=True)
@@ -40,6 +59,8 @@ class RetrievalHit:
     section: str
     score: int
     text: str
+    span: tuple[int, int] | None = None
+    sentence_span: tuple[int, int] | None = None
 
 
 @dataclass(frozen=True)
@@ -0,0 +1,140 @@
+"""Near-duplicate chunk detection with MinHash and LSH banding."""
+
+from __future__ import annotations
+
+import zlib
+from dataclasses import dataclass
+from typing import Sequence
+
+from paperta.text_utils import tokenize
+
+
+_EMPTY_BIN = 1 << 64
+
+
+@dataclass(frozen=True)
+class NearDuplicateDetector:
+    """MinHash/LSH detector that maps near-identical texts to a canonical text.
+
+    Each text is shingled into lowercase word n-grams and summarized by a
+    `num_perm`-slot one-permutation MinHash signature, so hashing costs one
+    pass over the shingles. Signatures are split into `bands` buckets and
+    only texts sharing a band are compared, which keeps the scan near-linear
+    in the number of texts. A candidate is accepted when the estimated
+    Jaccard similarity reaches `threshold`. With `ignore_digits`, numeric tokens
+    of short texts (at most `digit_fold_max_tokens` tokens) compare equal, so
+    page numbers and running counters in headers and footers do not defeat
+    matching while longer paragraphs that differ only in their numbers stay
+    distinct.
+    """
+
+    threshold: float = 0.85
+    num_perm: int = 64
+    bands: int = 16
+    shingle_size: int = 3
+    ignore_digits: bool = True
+    digit_fold_max_tokens: int = 20
+    seed: int = 1
+
+    def __post_init__(self) -> None:
+        """Validate detector parameters.
+
+        Raises:
+            ValueError: If parameters are out of range.
+        """
+        if not 0.0 < self.threshold <= 1.0:
+            raise ValueError("threshold must be in (0, 1]")
+        if self.num_perm <= 0 or self.bands <= 0 or self.num_perm % self.bands:
+            raise ValueError("num_perm must be a positive multiple of bands")
+        if self.shingle_size <= 0:
+            raise ValueError("shingle_size must be > 0")
+        if self.digit_fold_max_tokens < 0:
+            raise ValueError("digit_fold_max_tokens must be >= 0")
+
+    def canonical_indices(self, texts: Sequence[str]) -> list[int]:
+        """Assign every text to the first earlier text it nearly duplicates.
+
+        Args:
+            texts: Ordered texts, typically normalized chunk texts.
+
+        Returns:
+            Per-text index of its canonical text (its own index when unique).
+        """
+        rows = self.num_perm // self.bands
+
+        exact: dict[str, int] = {}
+        buckets: dict[tuple[int, tuple[int, ...]], list[int]] = {}
+        signatures: dict[int, tuple[int, ...]] = {}
+        canonical: list[int] = []
+        for idx, text in enumerate(texts):
+            if text in exact:
+                canonical.append(exact[text])
+                continue
+            signature = self._signature(text)
+            keys = [(band, signature[band * rows : (band + 1) * rows]) for band in range(self.bands)]
+            match = idx
+            seen: set[int] = set()
+            for key in keys:
+                for candidate in buckets.get(key, ()):
+                    if candidate in seen:
+                        continue
+                    seen.add(candidate)
+                    if candidate > match:
+                        continue
+                    if self._similarity(signature, signatures[candidate]) >= self.threshold:
+                        match = candidate
+            canonical.append(match)
+            if match == idx:
+                # Only canonical texts are indexed, so clusters never chain.
+                exact[text] = idx
+                signatures[idx] = signature
+                for key in keys:
+                    buckets.setdefault(key, []).append(idx)
+        return canonical
+
+    def _signature(self, text: str) -> tuple[int, ...]:
+        """Compute the one-permutation MinHash signature of one text.
+
+        Args:
+            text: Input text.
+
+        Returns:
+            MinHash signature with `num_perm` slots.
+        """
+        tokens = tokenize(text)
+        if self.ignore_digits and len(tokens) <= self.digit_fold_max_tokens:
+            tokens = ["0" if token.isdigit() else token for token in tokens]
+        size = self.shingle_size
+        if len(tokens) <= size:
+            shingles = {" ".join(tokens)}
+        else:
+            shingles = {" ".join(tokens[i : i + size]) for i in range(len(tokens) - size + 1)}
+
+        slots = self.num_perm
+        bins = [_EMPTY_BIN] * slots
+        for shingle in shingles:
+            raw = shingle.encode("utf-8")
+            value = zlib.crc32(raw, self.seed) | (zlib.crc32(raw, self.seed ^ 0x9E3779B9) << 32)
+            slot, rest = value % slots, value // slots
+            if rest < bins[slot]:
+                bins[slot] = rest
+        # Densify empty bins by borrowing the next filled bin, offset by distance.
+        filled = [idx for idx, value in enumerate(bins) if value != _EMPTY_BIN]
+        for idx in range(slots):
+            if bins[idx] == _EMPTY_BIN:
+                donor = next((j for j in filled if j > idx), filled[0])
+                bins[idx] = bins[donor] + ((donor - idx) % slots) * _EMPTY_BIN
+        return tuple(bins)
+
+    @staticmethod
+    def _similarity(left: tuple[int, ...], right: tuple[int, ...]) -> float:
+        """Estimate Jaccard similarity from two signatures.
+
+        Args:
+            left: First signature.
+            right: Second signature.
+
+        Returns:
+            Fraction of matching signature slots.
+        """
+        return sum(1 for a, b in zip(left, right) if a == b) / len(left)
@@ -0,0 +1,279 @@
+"""On-disk, content-addressed cache of extracted text and detected sections."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, Mapping
+
+from paperta.contracts import SectionInput
+
+try:  # POSIX only; without it eviction runs unlocked (writes stay atomic).
+    import fcntl
+except ImportError:  # pragma: no cover - platform dependent
+    fcntl = None  # type: ignore[assignment]
+
+
+CACHE_DIR_ENV = "PAPERTA_EXTRACTION_CACHE_DIR"
+CACHE_MAX_BYTES_ENV = "PAPERTA_EXTRACTION_CACHE_MAX_BYTES"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Bump when extraction or section detection output changes, so old entries miss.
+_FORMAT_VERSION = 4
+_ENTRY_SUFFIX = ".json"
+_PAGE_KEY_SUFFIX = "-page"
+# Running byte total of the entries, so writes under budget skip the scan.
+_USAGE_FILE = ".usage"
+
+
+@dataclass(frozen=True)
+class CachedExtraction:
+    """Extracted text and detected sections of one uploaded file."""
+
+    text: str
+    sections: tuple[SectionInput, ...]
+
+
+class ExtractionCache:
+    """Content-addressed extraction cache with a byte budget and LRU eviction.
+
+    Entries are keyed by the SHA-256 of the file bytes plus the extraction
+    kind, so the same paper uploaded twice (or by different users) is parsed
+    once. Each entry is written to a temporary file and moved into place with
+    `os.replace`, so concurrent readers never see partial entries. Reads bump
+    the entry's mtime. Writes add their size to a running total kept next to
+    the entries; only when it exceeds `max_bytes` is the directory scanned and
+    the least recently used entries removed, under an exclusive `flock`.
+
+    Page texts keyed by `pdf_utils.page_digests` share the same directory and
+    budget, so a revised PDF re-extracts only the pages that changed.
+    """
+
+    def __init__(self, root: str | os.PathLike[str], max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Initialize the cache, creating its directory if needed.
+
+        Args:
+            root: Cache directory.
+            max_bytes: Total byte budget for cached entries.
+
+        Raises:
+            ValueError: If `max_bytes` is not positive.
+        """
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be > 0")
+        self._root = Path(root) / f"v{_FORMAT_VERSION}"
+        self._root.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+
+    @classmethod
+    def from_env(cls) -> ExtractionCache | None:
+        """Build a cache from `PAPERTA_EXTRACTION_CACHE_*` environment variables.
+
+        Returns:
+            Configured cache, or None when no cache directory is set.
+
+        Raises:
+            ValueError: If the byte budget is not a positive integer.
+        """
+        root = os.environ.get(CACHE_DIR_ENV, "").strip()
+        if not root:
+            return None
+        raw_budget = os.environ.get(CACHE_MAX_BYTES_ENV, "").strip()
+        try:
+            max_bytes = int(raw_budget) if raw_budget else DEFAULT_MAX_BYTES
+        except ValueError as exc:
+            raise ValueError(f"{CACHE_MAX_BYTES_ENV} must be an integer") from exc
+        return cls(root, max_bytes=max_bytes)
+
+    @staticmethod
+    def key(name: str, content: bytes, variant: str = "") -> str:
+        """Build the cache key of an uploaded file.
+
+        Args:
+            name: File name; only its extraction kind (PDF or text) matters.
+            content: File bytes.
+            variant: Extraction options tag, e.g. for a partial extraction.
+
+        Returns:
+            Cache key.
+        """
+        kind = "pdf" if name.lower().endswith(".pdf") else "text"
+        suffix = f"-{variant}" if variant else ""
+        return f"{hashlib.sha256(content).hexdigest()}-{kind}{suffix}"
+
+    def get(self, key: str) -> CachedExtraction | None:
+        """Look up an entry and mark it as recently used.
+
+        Args:
+            key: Cache key from `key`.
+
+        Returns:
+            Cached extraction, or None on a miss or unreadable entry.
+        """
+        path = self._path(key)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            entry = CachedExtraction(
+                text=payload["text"],
+                sections=tuple(
+                    SectionInput(label=label, text=text) for label, text in payload["sections"]
+                ),
+            )
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError):
+            # Corrupt or concurrently evicted entry: treat as a miss.
+            return None
+        return entry
+
+    def put(self, key: str, entry: CachedExtraction) -> None:
+        """Store an entry atomically, then evict down to the byte budget.
+
+        Entries larger than the whole budget are not stored.
+
+        Args:
+            key: Cache key from `key`.
+            entry: Extraction to store.
+        """
+        sections = [[section.label, section.text] for section in entry.sections]
+        self._evict(self._write(key, {"text": entry.text, "sections": sections}))
+
+    def get_pages(self, digests: Iterable[str]) -> dict[str, str]:
+        """Look up cached page texts and mark them as recently used.
+
+        Args:
+            digests: Page digests from `pdf_utils.page_digests`.
+
+        Returns:
+            Digest-to-text mapping of the pages found.
+        """
+        found: dict[str, str] = {}
+        for digest in digests:
+            path = self._path(f"{digest}{_PAGE_KEY_SUFFIX}")
+            try:
+                found[digest] = json.loads(path.read_text(encoding="utf-8"))["text"]
+                os.utime(path)
+            except (OSError, ValueError, KeyError, TypeError):
+                continue
+        return found
+
+    def put_pages(self, page_texts: Mapping[str, str]) -> None:
+        """Store page texts atomically, then evict once for the whole batch.
+
+        Args:
+            page_texts: Digest-to-text mapping of newly extracted pages.
+        """
+        if not page_texts:
+            return
+        added = 0
+        for digest, text in page_texts.items():
+            added += self._write(f"{digest}{_PAGE_KEY_SUFFIX}", {"text": text})
+        self._evict(added)
+
+    def _write(self, key: str, record: dict[str, object]) -> int:
+        """Write one entry file atomically, skipping entries over the budget.
+
+        Args:
+            key: Cache key.
+            record: JSON-serializable entry.
+
+        Returns:
+            Change in the cache's total size, in bytes.
+        """
+        payload = json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        if len(payload) > self._max_bytes:
+            return 0
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        try:
+            replaced = path.stat().st_size
+        except FileNotFoundError:
+            replaced = 0
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(payload)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        return len(payload) - replaced
+
+    def _path(self, key: str) -> Path:
+        """Map a key to its entry file, sharded by digest prefix.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Entry path.
+        """
+        return self._root / key[:2] / f"{key}{_ENTRY_SUFFIX}"
+
+    def _evict(self, added: int) -> None:
+        """Update the running total and evict only when it exceeds the budget.
+
+        A missing or unreadable total, or one over the budget, is recomputed
+        from a scan of the entries, so entries removed behind the cache's back
+        only cost one early scan.
+
+        Args:
+            added: Bytes just written, net of the entries they replaced.
+        """
+        usage = self._root / _USAGE_FILE
+        with self._locked():
+            try:
+                total = int(usage.read_text(encoding="ascii")) + added
+            except (OSError, ValueError):
+                total = None
+            if total is None or total > self._max_bytes:
+                total = self._evict_scan()
+            usage.write_text(str(total), encoding="ascii")
+
+    def _evict_scan(self) -> int:
+        """Delete least recently used entries until the budget is met.
+
+        Returns:
+            Total size of the remaining entries, in bytes.
+        """
+        entries = []
+        total = 0
+        for path in self._root.glob(f"*/*{_ENTRY_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+            total += stat.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self._max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+        return total
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the cache-wide exclusive lock.
+
+        Yields:
+            None while the lock is held.
+        """
+        with open(self._root / ".lock", "a") as handle:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
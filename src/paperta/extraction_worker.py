@@ -0,0 +1,426 @@
+"""Supervised PDF extraction in a reusable, resource-limited worker process."""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+import time
+from typing import Any, Callable, Iterator, Mapping, MutableMapping, Sequence
+
+from paperta.contracts import SectionInput
+from paperta.pdf_utils import ExtractionOptions, LoadedPdf, TextLayerReport
+
+try:  # POSIX only; without it the worker runs without a memory cap.
+    import resource
+except ImportError:  # pragma: no cover - platform dependent
+    resource = None  # type: ignore[assignment]
+
+
+TIMEOUT_ENV = "PAPERTA_PDF_TIMEOUT_SECONDS"
+MEMORY_LIMIT_ENV = "PAPERTA_PDF_MEMORY_LIMIT_MB"
+DEFAULT_TIMEOUT_S = 60.0
+DEFAULT_MEMORY_LIMIT_BYTES = 1024 * 1024 * 1024
+
+# How often a waiting call checks for cancellation.
+_POLL_INTERVAL_S = 0.1
+
+# Operations whose last argument is a page-text cache; they also return new pages.
+_PAGE_CACHE_OPS = frozenset({"text", "sections", "pages"})
+
+
+class ExtractionWorker:
+    """Run PDF extraction in a child process with a timeout and memory cap.
+
+    The child is spawned on first use and reused for later documents, so its
+    start-up cost is paid once. Each document gets `timeout_s` of wall-clock
+    time; on timeout, `cancel`, or a crash the child is killed, the call
+    raises `ValueError` like any other parse failure, and the next call
+    starts a fresh child. The child's address space is capped at
+    `memory_limit_bytes` with `RLIMIT_AS`, so runaway allocations fail
+    inside the child instead of exhausting the server. Calls are serialized;
+    pages are extracted sequentially inside the child.
+    """
+
+    def __init__(
+        self,
+        timeout_s: float = DEFAULT_TIMEOUT_S,
+        memory_limit_bytes: int = DEFAULT_MEMORY_LIMIT_BYTES,
+    ) -> None:
+        """Initialize the worker without starting it.
+
+        Args:
+            timeout_s: Wall-clock limit per document, in seconds.
+            memory_limit_bytes: Address-space limit of the child process.
+
+        Raises:
+            ValueError: If a limit is not positive.
+        """
+        if timeout_s <= 0:
+            raise ValueError("timeout_s must be > 0")
+        if memory_limit_bytes <= 0:
+            raise ValueError("memory_limit_bytes must be > 0")
+        self._timeout_s = timeout_s
+        self._memory_limit_bytes = memory_limit_bytes
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._process: Any = None
+        self._conn: Any = None
+
+    @classmethod
+    def from_env(cls) -> ExtractionWorker:
+        """Build a worker from `PAPERTA_PDF_*` environment variables.
+
+        Returns:
+            Configured worker; unset variables use the defaults.
+
+        Raises:
+            ValueError: If a variable is not a positive number.
+        """
+        raw_timeout = os.environ.get(TIMEOUT_ENV, "").strip()
+        raw_memory = os.environ.get(MEMORY_LIMIT_ENV, "").strip()
+        try:
+            timeout_s = float(raw_timeout) if raw_timeout else DEFAULT_TIMEOUT_S
+        except ValueError as exc:
+            raise ValueError(f"{TIMEOUT_ENV} must be a number") from exc
+        try:
+            memory = int(raw_memory) * 1024 * 1024 if raw_memory else DEFAULT_MEMORY_LIMIT_BYTES
+        except ValueError as exc:
+            raise ValueError(f"{MEMORY_LIMIT_ENV} must be an integer") from exc
+        return cls(timeout_s=timeout_s, memory_limit_bytes=memory)
+
+    @property
+    def pid(self) -> int | None:
+        """Process id of the running child.
+
+        Returns:
+            Child pid, or None when no child is running.
+        """
+        process = self._process
+        return process.pid if process is not None and process.is_alive() else None
+
+    def extract_text(
+        self,
+        content: bytes,
+        options: ExtractionOptions | None = None,
+        page_texts: MutableMapping[str, str] | None = None,
+    ) -> str:
+        """Extract text as `extract_text_from_pdf` does, in the child.
+
+        Args:
+            content: Raw PDF file bytes.
+            options: Page selection; all pages by default.
+            page_texts: Digest-to-text page cache; newly extracted pages are added.
+
+        Returns:
+            Extracted text content.
+
+        Raises:
+            ValueError: If parsing fails, times out, is cancelled, or the child dies.
+        """
+        return self._call("text", (content, 1, options), page_texts)
+
+    def extract_sections(
+        self,
+        content: bytes,
+        options: ExtractionOptions | None = None,
+        page_texts: MutableMapping[str, str] | None = None,
+    ) -> tuple[str, tuple[SectionInput, ...]]:
+        """Extract text and sections as `extract_sections_from_pdf` does, in the child.
+
+        Args:
+            content: Raw PDF file bytes.
+            options: Page selection; all pages by default.
+            page_texts: Digest-to-text page cache; newly extracted pages are added.
+
+        Returns:
+            Tuple of (extracted text, sections).
+
+        Raises:
+            ValueError: If parsing fails, times out, is cancelled, or the child dies.
+        """
+        return self._call("sections", (content, 1, options), page_texts)
+
+    def has_outline(self, content: bytes) -> bool:
+        """Check for a usable outline as `has_pdf_outline` does, in the child.
+
+        Args:
+            content: Raw PDF file bytes.
+
+        Returns:
+            True if the PDF has outline entries usable as sections.
+
+        Raises:
+            ValueError: If parsing fails, times out, is cancelled, or the child dies.
+        """
+        return self._call("outline", (content,))
+
+    def scan_text_layer(self, content: bytes) -> TextLayerReport:
+        """Pre-scan the text layer as `scan_text_layer` does, in the child.
+
+        Args:
+            content: Raw PDF file bytes.
+
+        Returns:
+            Text-layer report of the sampled pages.
+
+        Raises:
+            ValueError: If parsing fails, times out, is cancelled, or the child dies.
+        """
+        return self._call("scan", (content,))
+
+    def page_digests(self, content: bytes) -> list[str]:
+        """Compute page digests as `page_digests` does, in the child.
+
+        Args:
+            content: Raw PDF file bytes.
+
+        Returns:
+            Per-page digests in page order.
+
+        Raises:
+            ValueError: If parsing fails, times out, is cancelled, or the child dies.
+        """
+        return self._call("digests", (content,))
+
+    def load_pdf(
+        self,
+        content: bytes,
+        options: ExtractionOptions | None = None,
+        page_lookup: Callable[[Sequence[str]], Mapping[str, str]] | None = None,
+        outlined_only: bool = False,
+    ) -> LoadedPdf:
+        """Scan, digest and extract from one parse as `load_pdf` does, in the child.
+
+        Args:
+            content: Raw PDF file bytes.
+            options: Page selection; all pages by default.
+            page_lookup: Picklable digest-to-text lookup run in the child,
+                e.g. a bound `ExtractionCache.get_pages`.
+            outlined_only: Extract only documents with an outline.
+
+        Returns:
+            Scan report, digests, outline flag and, if extracted, text and sections.
+
+        Raises:
+            ValueError: If parsing fails, times out, is cancelled, or the child dies.
+        """
+        return self._call("load", (content, options, page_lookup, outlined_only))
+
+    def iter_pages(
+        self,
+        content: bytes,
+        options: ExtractionOptions | None = None,
+        page_texts: MutableMapping[str, str] | None = None,
+    ) -> Iterator[str]:
+        """Stream page texts from the child as `iter_pdf_pages` does.
+
+        The timeout covers the whole document, including time the caller
+        spends between pages. Closing the iterator early stops the child.
+
+        Args:
+            content: Raw PDF file bytes.
+            options: Page selection; all pages by default.
+            page_texts: Digest-to-text page cache; new pages are added once all are read.
+
+        Yields:
+            Extracted text of each selected page, in document order.
+
+        Raises:
+            ValueError: If parsing fails, times out, is cancelled, or the child dies.
+        """
+        with self._lock:
+            deadline = self._send("pages", (content, options, _copy(page_texts)))
+            finished = False
+            try:
+                while True:
+                    kind, value = self._receive(deadline)
+                    if kind == "done":
+                        finished = True
+                        if page_texts is not None:
+                            page_texts.update(value)
+                        return
+                    yield value
+            finally:
+                if not finished:
+                    # The child may still be mid-document; never reuse it.
+                    self._stop()
+
+    def cancel(self) -> None:
+        """Abort the call in progress, if any, from another thread."""
+        self._cancelled.set()
+
+    def close(self) -> None:
+        """Stop the child process; the next call starts a new one."""
+        with self._lock:
+            self._stop()
+
+    def _call(
+        self,
+        op: str,
+        args: tuple[Any, ...],
+        page_texts: MutableMapping[str, str] | None = None,
+    ) -> Any:
+        """Run one request in the child and wait for its result.
+
+        Args:
+            op: Operation name understood by `_worker_main`.
+            args: Operation arguments.
+            page_texts: Page-text cache for `_PAGE_CACHE_OPS`, updated in place.
+
+        Returns:
+            Operation result.
+        """
+        if op in _PAGE_CACHE_OPS:
+            args = (*args, _copy(page_texts))
+        with self._lock:
+            deadline = self._send(op, args)
+            _, value = self._receive(deadline)
+        if op in _PAGE_CACHE_OPS:
+            value, fresh = value
+            if page_texts is not None:
+                page_texts.update(fresh)
+        return value
+
+    def _send(self, op: str, args: tuple[Any, ...]) -> float:
+        """Start the child if needed and submit a request.
+
+        Args:
+            op: Operation name.
+            args: Operation arguments.
+
+        Returns:
+            Monotonic deadline of the request.
+
+        Raises:
+            ValueError: If the child cannot accept the request.
+        """
+        self._cancelled.clear()
+        deadline = time.monotonic() + self._timeout_s
+        if self._process is None or not self._process.is_alive():
+            self._start()
+        try:
+            self._conn.send((op, args))
+        except (OSError, ValueError) as exc:
+            self._stop()
+            raise ValueError(f"PDF extraction worker unavailable: {exc}") from exc
+        return deadline
+
+    def _receive(self, deadline: float) -> tuple[str, Any]:
+        """Wait for the next message, enforcing the deadline and cancellation.
+
+        Args:
+            deadline: Monotonic deadline of the request.
+
+        Returns:
+            `(kind, value)` message from the child.
+
+        Raises:
+            ValueError: On a child error, timeout, cancellation, or child exit.
+        """
+        while True:
+            if self._cancelled.is_set():
+                self._stop()
+                raise ValueError("PDF extraction cancelled")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._stop()
+                raise ValueError(f"PDF extraction timed out after {self._timeout_s:g}s")
+            try:
+                if self._conn.poll(min(remaining, _POLL_INTERVAL_S)):
+                    kind, value = self._conn.recv()
+                    break
+            except (EOFError, OSError):
+                self._stop()
+                raise ValueError("PDF extraction worker exited unexpectedly") from None
+        if kind == "error":
+            raise ValueError(value)
+        return kind, value
+
+    def _start(self) -> None:
+        """Spawn a fresh child process."""
+        self._stop()
+        # Spawn rather than fork: the server process may hold threads and locks.
+        context = multiprocessing.get_context("spawn")
+        parent_conn, child_conn = context.Pipe()
+        process = context.Process(
+            target=_worker_main,
+            args=(child_conn, self._memory_limit_bytes),
+            name="paperta-pdf-worker",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        self._process, self._conn = process, parent_conn
+
+    def _stop(self) -> None:
+        """Kill the child process, if any, and drop its pipe."""
+        process, conn = self._process, self._conn
+        self._process = self._conn = None
+        if process is not None:
+            if process.is_alive():
+                process.kill()
+            process.join()
+        if conn is not None:
+            conn.close()
+
+
+def _copy(page_texts: MutableMapping[str, str] | None) -> dict[str, str] | None:
+    """Copy a page-text cache into a picklable dict.
+
+    Args:
+        page_texts: Page-text cache, or None.
+
+    Returns:
+        Plain dict copy, or None.
+    """
+    return None if page_texts is None else dict(page_texts)
+
+
+def _worker_main(conn: Any, memory_limit_bytes: int) -> None:
+    """Serve extraction requests until the pipe closes.
+
+    Args:
+        conn: Child end of the request pipe.
+        memory_limit_bytes: Address-space limit to apply to this process.
+    """
+    if resource is not None:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        soft = memory_limit_bytes
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+
+    from paperta import pdf_utils
+
+    operations = {
+        "text": pdf_utils.extract_text_from_pdf,
+        "sections": pdf_utils.extract_sections_from_pdf,
+        "outline": pdf_utils.has_pdf_outline,
+        "scan": pdf_utils.scan_text_layer,
+        "digests": pdf_utils.page_digests,
+        "load": pdf_utils.load_pdf,
+    }
+    while True:
+        try:
+            op, args = conn.recv()
+        except (EOFError, OSError):
+            return
+        try:
+            if op in _PAGE_CACHE_OPS:
+                page_texts = args[-1]
+                known = set(page_texts or ())
+                if op == "pages":
+                    for page in pdf_utils.iter_pdf_pages(*args):
+                        conn.send(("page", page))
+                else:
+                    result = operations[op](*args)
+                fresh = {k: v for k, v in (page_texts or {}).items() if k not in known}
+                conn.send(("done", fresh) if op == "pages" else ("ok", (result, fresh)))
+            else:
+                conn.send(("ok", operations[op](*args)))
+        except MemoryError:
+            limit_mib = memory_limit_bytes // (1024 * 1024)
+            conn.send(("error", f"PDF extraction exceeded the {limit_mib} MiB memory limit"))
+        except Exception as exc:  # noqa: BLE001 - every failure is reported to the caller
+            conn.send(("error", str(exc)))
@@ -4,49 +4,259 @@ from __future__ import annotations
 
 import hashlib
 import re
-from typing import Sequence
+import sys
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from functools import partial
+from types import MappingProxyType
+from typing import Any, Callable, Sequence
 
+from paperta.chunk_store import ChunkStore, TokenIndex
 from paperta.contracts import Chunk, IngestedPaper, SectionInput
+from paperta.dedup import NearDuplicateDetector
+from paperta.text_utils import scan_text, split_sentence_ends
 
 
-_TOKEN_SPACE_RE = re.compile(r"\s+")
 _PARAGRAPH_SPLIT_RE = re.compile(r"\n\s*\n+")
+_WORD_RE = re.compile(r"\S+")
+_SENTENCE_END_RE = re.compile(r"[.!?][\"')\]]*$")
 
+DEFAULT_ID_SCHEME = "sha256-v1"
+_BLAKE2B_ID_KEY = b"paperta/chunk-id/v2"
 
-def _normalize_text(text: str) -> str:
-    """Normalize whitespace deterministically.
+# Versioned chunk ID schemes: name -> hash factory taking the initial payload.
+# Every scheme yields 8 bytes (16 hex characters); never change an existing
+# entry, add a new version instead so cached IDs stay valid.
+ID_SCHEMES: dict[str, Callable[[bytes], Any]] = {
+    "sha256-v1": hashlib.sha256,
+    "blake2b-v2": partial(hashlib.blake2b, digest_size=8, key=_BLAKE2B_ID_KEY),
+}
+
+Chunker = Callable[[str], Sequence[tuple[int, int]]]
+"""Chunking strategy: maps section text to ordered `(start, end)` character spans."""
+
+_Record = tuple[str, int, str, int, int, tuple[str, ...]]
+"""Chunk record: `(chunk_id, section_index, normalized_text, start, end, tokens)`."""
+
+
+def paragraph_spans(text: str) -> list[tuple[int, int]]:
+    """Split section text at blank lines (the default chunking strategy).
 
     Args:
-        text: Input text segment.
+        text: Raw section text.
 
     Returns:
-        Normalized single-space text.
+        Ordered `(start, end)` spans of non-blank paragraphs.
+    """
+    spans: list[tuple[int, int]] = []
+    start = 0
+    for match in _PARAGRAPH_SPLIT_RE.finditer(text):
+        spans.append((start, match.start()))
+        start = match.end()
+    spans.append((start, len(text)))
+    return [(s, e) for s, e in spans if text[s:e].strip()]
+
+
+@dataclass(frozen=True)
+class SlidingWindowChunker:
+    """Token-budgeted sliding-window chunking strategy.
+
+    Tokens are whitespace-delimited words. Windows hold at most `max_tokens`
+    tokens and consecutive windows share up to `overlap_tokens` tokens. With
+    `snap_to_sentences`, window edges fall on sentence or paragraph
+    boundaries unless a single sentence exceeds the budget.
     """
-    stripped = text.strip()
-    return _TOKEN_SPACE_RE.sub(" ", stripped)
+
+    max_tokens: int = 256
+    overlap_tokens: int = 32
+    snap_to_sentences: bool = True
+
+    def __post_init__(self) -> None:
+        """Validate window parameters.
+
+        Raises:
+            ValueError: If the token budget or overlap is out of range.
+        """
+        if self.max_tokens <= 0:
+            raise ValueError("max_tokens must be > 0")
+        if not 0 <= self.overlap_tokens < self.max_tokens:
+            raise ValueError("overlap_tokens must be >= 0 and < max_tokens")
+
+    def __call__(self, text: str) -> list[tuple[int, int]]:
+        """Split section text into token-budgeted windows.
+
+        Args:
+            text: Raw section text.
+
+        Returns:
+            Ordered `(start, end)` character spans, one per window.
+        """
+        words = [m.span() for m in _WORD_RE.finditer(text)]
+        if not words:
+            return []
+        # Word indices at which a new sentence (or paragraph) starts.
+        starts = [0]
+        if self.snap_to_sentences:
+            for idx in range(1, len(words)):
+                prev_start, prev_end = words[idx - 1]
+                if _SENTENCE_END_RE.search(text, prev_start, prev_end) or _PARAGRAPH_SPLIT_RE.search(
+                    text, prev_end, words[idx][0]
+                ):
+                    starts.append(idx)
+        starts.append(len(words))
+
+        spans: list[tuple[int, int]] = []
+        begin = 0
+        while begin < len(words):
+            limit = begin + self.max_tokens
+            end = begin
+            if self.snap_to_sentences:
+                # Largest sentence start within the budget.
+                end = starts[bisect_right(starts, limit) - 1]
+            snapped = end > begin
+            if not snapped:
+                # A single sentence exceeds the budget: hard split it.
+                end = min(limit, len(words))
+            spans.append((words[begin][0], words[end - 1][1]))
+            if end >= len(words):
+                break
+            nxt = max(begin + 1, end - self.overlap_tokens)
+            if snapped:
+                nxt = min(starts[bisect_left(starts, nxt)], end)
+            begin = nxt
+        return spans
 
 
-def _chunk_id(paper_id: str, section: str, chunk_text: str) -> str:
+def chunk_id_to_int(chunk_id: str) -> int:
+    """Convert a chunk ID to the unsigned 64-bit integer it encodes.
+
+    Every ID scheme emits 16 hex characters (8 bytes), so the integer form is
+    usable as a compact key in arrays and indexes.
+
+    Args:
+        chunk_id: Chunk ID.
+
+    Returns:
+        Integer value of the ID.
+
+    Raises:
+        ValueError: If the ID is not 16 hex characters.
+    """
+    if len(chunk_id) != 16:
+        raise ValueError(f"chunk_id must be 16 hex characters: {chunk_id!r}")
+    return int(chunk_id, 16)
+
+
+def _section_id_state(id_scheme: str, paper_id: str, section: str) -> Any:
+    """Build a hash state primed with the `paper_id|section|` ID prefix.
+
+    Args:
+        id_scheme: Chunk ID scheme name.
+        paper_id: Paper identifier.
+        section: Section label.
+
+    Returns:
+        Hash object to `copy()` per chunk of the section.
+
+    Raises:
+        ValueError: If the scheme is unknown.
+    """
+    factory = ID_SCHEMES.get(id_scheme)
+    if factory is None:
+        known = ", ".join(sorted(ID_SCHEMES))
+        raise ValueError(f"unknown id_scheme {id_scheme!r}; expected one of: {known}")
+    return factory(f"{paper_id}|{section}|".encode("utf-8"))
+
+
+def _chunk_id(
+    paper_id: str, section: str, chunk_text: str, id_scheme: str = DEFAULT_ID_SCHEME
+) -> str:
     """Build stable content-addressed chunk ID.
 
     Args:
         paper_id: Paper identifier.
         section: Section label.
         chunk_text: Normalized chunk text.
+        id_scheme: Chunk ID scheme name.
 
     Returns:
         Hex-encoded deterministic chunk ID prefix.
     """
-    payload = f"{paper_id}|{section}|{chunk_text}".encode("utf-8")
-    return hashlib.sha256(payload).hexdigest()[:16]
+    return _hash_chunk(_section_id_state(id_scheme, paper_id, section), chunk_text)
+
+
+def _hash_chunk(state: Any, chunk_text: str) -> str:
+    """Finish a chunk ID from a primed section hash state.
+
+    Args:
+        state: Hash state from `_section_id_state`; left unmodified.
+        chunk_text: Normalized chunk text.
+
+    Returns:
+        Hex-encoded chunk ID (16 characters).
+    """
+    digest = state.copy()
+    digest.update(chunk_text.encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def _collapse_near_duplicates(
+    records: list[_Record], detector: NearDuplicateDetector
+) -> tuple[list[_Record], dict[int, tuple[str, ...]]]:
+    """Drop near-duplicate chunk records in favour of their first occurrence.
+
+    Args:
+        records: Ordered chunk records.
+        detector: Near-duplicate detector.
+
+    Returns:
+        Tuple of (kept records, alias IDs keyed by kept-record position).
+    """
+    canonical = detector.canonical_indices([record[2] for record in records])
+    kept: list[_Record] = []
+    position: dict[int, int] = {}
+    aliases: dict[int, list[str]] = {}
+    for idx, record in enumerate(records):
+        target = canonical[idx]
+        if target == idx:
+            position[idx] = len(kept)
+            kept.append(record)
+            continue
+        alias_list = aliases.setdefault(position[target], [])
+        if record[0] != records[target][0] and record[0] not in alias_list:
+            alias_list.append(record[0])
+    return kept, {pos: tuple(ids) for pos, ids in aliases.items() if ids}
 
 
-def ingest_document(paper_id: str, sections: Sequence[SectionInput]) -> IngestedPaper:
-    """Ingest paper sections into deterministic paragraph chunks.
+def ingest_document(
+    paper_id: str,
+    sections: Sequence[SectionInput],
+    columnar: bool = False,
+    chunker: Chunker | None = None,
+    dedup: NearDuplicateDetector | None = None,
+    sentence_index: bool = False,
+    id_scheme: str = DEFAULT_ID_SCHEME,
+    fold_pdf_artifacts: bool = False,
+) -> IngestedPaper:
+    """Ingest paper sections into deterministic content-addressed chunks.
 
     Args:
         paper_id: Paper identifier.
         sections: Ordered section inputs.
+        columnar: Store chunks in a span-backed `ChunkStore` that references the
+            section texts instead of copying normalized chunk text.
+        chunker: Chunking strategy. Defaults to `paragraph_spans`.
+        dedup: Optional near-duplicate detector. Near-identical chunks collapse
+            into the first occurrence, which lists the others in `alias_ids`.
+        sentence_index: Record packed sentence end offsets on every chunk so
+            retrieval can point at the best-matching sentence of a hit.
+        id_scheme: Chunk ID scheme from `ID_SCHEMES`. `sha256-v1` keeps the
+            historical IDs; `blake2b-v2` is keyed BLAKE2b with an 8-byte digest.
+            The scheme is recorded on the result so caches never mix schemes.
+        fold_pdf_artifacts: Fold PDF ligatures and line breaks after hyphens
+            before hashing (see `text_utils.normalize_text`). This changes the
+            IDs of affected chunks, so it is off by default and recorded on
+            the result.
 
     Returns:
         Immutable ingested paper artifact with deterministic chunks.
@@ -65,34 +275,74 @@ def ingest_document(paper_id: str, sections: Sequence[SectionInput]) -> Ingested
     if len(set(labels)) != len(labels):
         raise ValueError("duplicate section labels are not allowed")
 
-    chunks: list[Chunk] = []
+    split = chunker or paragraph_spans
+    states = [_section_id_state(id_scheme, paper_id, label) for label in labels]
+    records: list[_Record] = []
     section_order: list[str] = []
 
     any_content = False
-    for section in sections:
+    for label_idx, section in enumerate(sections):
         section_order.append(section.label)
-        normalized_section_text = section.text.replace("\r\n", "\n")
-        paragraphs = [p for p in _PARAGRAPH_SPLIT_RE.split(normalized_section_text) if p.strip()]
-        for paragraph in paragraphs:
-            normalized_chunk = _normalize_text(paragraph)
+        for start, end in split(section.text):
+            raw = section.text[start:end]
+            scan = scan_text(raw, fold_pdf_artifacts)
+            normalized_chunk = scan.text
             if not normalized_chunk:
                 continue
             any_content = True
-            cid = _chunk_id(paper_id, section.label, normalized_chunk)
-            chunks.append(
-                Chunk(
-                    chunk_id=cid,
-                    paper_id=paper_id,
-                    section=section.label,
-                    text=normalized_chunk,
-                )
-            )
+            # Trim the span to the stripped text so it highlights exactly.
+            start += len(raw) - len(raw.lstrip())
+            end -= len(raw) - len(raw.rstrip())
+            cid = _hash_chunk(states[label_idx], normalized_chunk)
+            # Interned, so the pending records share one copy of each token.
+            tokens = tuple(map(sys.intern, set(scan.tokens)))
+            records.append((cid, label_idx, normalized_chunk, start, end, tokens))
 
     if not any_content:
         raise ValueError("paper content is empty")
 
+    aliases: dict[int, tuple[str, ...]] = {}
+    if dedup is not None:
+        records, aliases = _collapse_near_duplicates(records, dedup)
+
+    sentences = [split_sentence_ends(record[2]) if sentence_index else b"" for record in records]
+
+    chunks: Sequence[Chunk]
+    if columnar:
+        chunks = ChunkStore.from_spans(
+            paper_id,
+            sections,
+            ((cid, label_idx, start, end) for cid, label_idx, _, start, end, _ in records),
+            aliases=aliases,
+            sentence_ends=sentences if sentence_index else None,
+            fold_pdf_artifacts=fold_pdf_artifacts,
+        )
+    else:
+        chunks = tuple(
+            Chunk(
+                chunk_id=cid,
+                paper_id=paper_id,
+                section=section_order[label_idx],
+                text=text,
+                alias_ids=aliases.get(pos, ()),
+                span=(start, end),
+                sentence_ends=sentences[pos],
+            )
+            for pos, (cid, label_idx, text, start, end, _) in enumerate(records)
+        )
+
+    chunk_index: dict[str, int] = {}
+    for pos, record in enumerate(records):
+        chunk_index.setdefault(record[0], pos)
+        for alias in aliases.get(pos, ()):
+            chunk_index.setdefault(alias, pos)
+
     return IngestedPaper(
         paper_id=paper_id,
-        chunks=tuple(chunks),
+        chunks=chunks,
         section_order=tuple(section_order),
+        chunk_index=MappingProxyType(chunk_index),
+        token_index=TokenIndex.build(record[5] for record in records),
+        id_scheme=id_scheme,
+        fold_pdf_artifacts=fold_pdf_artifacts,
     )
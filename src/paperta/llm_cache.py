@@ -0,0 +1,187 @@
+"""Persistent SQLite cache of LLM completions with TTL and size-based eviction."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Mapping
+
+
+CACHE_PATH_ENV = "PAPERTA_LLM_CACHE_PATH"
+CACHE_TTL_ENV = "PAPERTA_LLM_CACHE_TTL_SECONDS"
+CACHE_MAX_BYTES_ENV = "PAPERTA_LLM_CACHE_MAX_BYTES"
+DEFAULT_TTL_S = 7 * 24 * 3600.0
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Bump when the key derivation changes, so old entries miss.
+_KEY_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    text TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    last_used REAL NOT NULL
+)
+"""
+
+
+class LLMResponseCache:
+    """Completion cache keyed by provider, model, prompts and generation params.
+
+    Entries live in one SQLite file that several processes may share. A hit
+    older than `ttl_s` is deleted and reported as a miss. Reads bump the
+    entry's last-used time, and each write evicts expired entries, then the
+    least recently used ones until the stored text fits `max_bytes`.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        ttl_s: float = DEFAULT_TTL_S,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """Initialize the cache, creating the database if needed.
+
+        Args:
+            path: SQLite database file.
+            ttl_s: Entry lifetime in seconds.
+            max_bytes: Total byte budget for cached completions.
+
+        Raises:
+            ValueError: If `ttl_s` or `max_bytes` is not positive.
+        """
+        if ttl_s <= 0:
+            raise ValueError("ttl_s must be > 0")
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be > 0")
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._ttl_s = ttl_s
+        self._max_bytes = max_bytes
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+
+    @classmethod
+    def from_env(cls) -> LLMResponseCache | None:
+        """Build a cache from `PAPERTA_LLM_CACHE_*` environment variables.
+
+        Returns:
+            Configured cache, or None when no cache path is set.
+
+        Raises:
+            ValueError: If the TTL or byte budget is not a positive number.
+        """
+        path = os.environ.get(CACHE_PATH_ENV, "").strip()
+        if not path:
+            return None
+        raw_ttl = os.environ.get(CACHE_TTL_ENV, "").strip()
+        raw_budget = os.environ.get(CACHE_MAX_BYTES_ENV, "").strip()
+        try:
+            ttl_s = float(raw_ttl) if raw_ttl else DEFAULT_TTL_S
+        except ValueError as exc:
+            raise ValueError(f"{CACHE_TTL_ENV} must be a number") from exc
+        try:
+            max_bytes = int(raw_budget) if raw_budget else DEFAULT_MAX_BYTES
+        except ValueError as exc:
+            raise ValueError(f"{CACHE_MAX_BYTES_ENV} must be an integer") from exc
+        return cls(path, ttl_s=ttl_s, max_bytes=max_bytes)
+
+    @staticmethod
+    def key(
+        provider: str,
+        model: str,
+        system_prompt: str,
+        user_prompt: str,
+        params: Mapping[str, Any],
+    ) -> str:
+        """Build the cache key of one completion request.
+
+        Args:
+            provider: LLM provider name.
+            model: Model name.
+            system_prompt: System message.
+            user_prompt: User message.
+            params: Generation parameters such as temperature and max tokens.
+
+        Returns:
+            Cache key.
+        """
+        payload = json.dumps(
+            [_KEY_VERSION, provider, model, system_prompt, user_prompt, dict(params)],
+            ensure_ascii=False,
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Look up a completion and mark it as recently used.
+
+        Args:
+            key: Cache key from `key`.
+
+        Returns:
+            Cached completion, or None on a miss or expired entry.
+        """
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT text, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            text, created = row
+            if now - created > self._ttl_s:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        """Store a completion, then evict down to the TTL and byte budget.
+
+        Completions larger than the whole budget are not stored.
+
+        Args:
+            key: Cache key from `key`.
+            text: Completion text.
+        """
+        size = len(text.encode("utf-8"))
+        if size > self._max_bytes:
+            return
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, text, size, created, last_used) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, text, size, now, now),
+            )
+            conn.execute("DELETE FROM responses WHERE created < ?", (now - self._ttl_s,))
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total <= self._max_bytes:
+                return
+            stale = []
+            for old_key, old_size in conn.execute(
+                "SELECT key, size FROM responses ORDER BY last_used, created"
+            ):
+                if total <= self._max_bytes:
+                    break
+                stale.append((old_key,))
+                total -= old_size
+            conn.executemany("DELETE FROM responses WHERE key = ?", stale)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection; each call gets its own, so threads never share one.
+
+        Returns:
+            SQLite connection.
+        """
+        return sqlite3.connect(self._path, timeout=30.0)
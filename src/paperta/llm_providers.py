@@ -6,11 +6,34 @@ deterministic pipeline when no API keys are configured.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
+import hashlib
 import json
 import os
-from dataclasses import asdict, is_dataclass
+import re
+import threading
+import weakref
+from dataclasses import asdict, dataclass, is_dataclass
 from pathlib import Path
-from typing import Any, Generator
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterable,
+    TypeVar,
+)
+
+from paperta.ingestion import SlidingWindowChunker
+
+if TYPE_CHECKING:
+    from paperta.llm_cache import LLMResponseCache
+
+T = TypeVar("T")
 
 # Auto-load .env from project root if python-dotenv is available
 _project_root = Path(__file__).resolve().parent.parent.parent
@@ -37,6 +60,140 @@ PROVIDERS: dict[str, tuple[str, ...]] = {
     "local": ("deterministic-core",),
 }
 
+# API key variable and fixed endpoint of each remote provider.
+_API_KEY_ENV: dict[str, str] = {
+    "openai": "OPENAI_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY",
+    "google": "GOOGLE_API_KEY",
+}
+_BASE_URLS: dict[str, str] = {
+    "google": "https://generativelanguage.googleapis.com/v1beta/openai/",
+}
+_BASE_URL_ENV: dict[str, str] = {
+    "openai": "OPENAI_BASE_URL",
+    "anthropic": "ANTHROPIC_BASE_URL",
+}
+
+MAX_CONNECTIONS_ENV = "PAPERTA_LLM_MAX_CONNECTIONS"
+MAX_KEEPALIVE_ENV = "PAPERTA_LLM_MAX_KEEPALIVE_CONNECTIONS"
+KEEPALIVE_EXPIRY_ENV = "PAPERTA_LLM_KEEPALIVE_EXPIRY_SECONDS"
+
+# Generation parameters per provider; part of the response cache key.
+_GENERATION_PARAMS: dict[str, dict[str, Any]] = {
+    "openai": {"temperature": 0.3, "max_tokens": 8192},
+    "anthropic": {"max_tokens": 8192},
+    "google": {"temperature": 0.3, "max_tokens": 8192},
+}
+
+# Teach walkthrough structure, for the full-paper prompt and the map-reduce reduce step.
+_TEACH_SYSTEM_PROMPT = (
+    "You are PaperTA, an expert academic paper analyst and educator. "
+    "Your task is to produce a comprehensive walkthrough of a research paper "
+    "so that a reader can fully understand the paper without reading the original. "
+    "Write in clear, accessible prose while maintaining scholarly accuracy.\n\n"
+    "Structure your walkthrough as follows:\n"
+    "## TL;DR\n2-3 sentence overview of the entire paper.\n\n"
+    "## Problem & Motivation\n"
+    "What problem is addressed and why it matters to the field.\n\n"
+    "## Background & Prerequisites\n"
+    "Key concepts and prior knowledge needed to understand this work.\n\n"
+    "## Core Approach\n"
+    "The methodology, framework, or system proposed. Explain step by step.\n\n"
+    "## Experimental Setup\n"
+    "How the approach was evaluated: datasets, baselines, metrics.\n\n"
+    "## Key Results\n"
+    "Main findings with specific numbers, tables, or comparisons when available.\n\n"
+    "## Discussion & Implications\n"
+    "What the results mean and their broader significance.\n\n"
+    "## Limitations & Future Work\n"
+    "Acknowledged shortcomings and directions for future research.\n\n"
+    "## Key Takeaways\n"
+    "3-5 bullet points summarizing the paper's contribution.\n\n"
+    "Be thorough - length is not a concern. Cover all important aspects. "
+    "Cite specific paper sections using [Section Name] notation throughout."
+)
+
+# Map step of the map-reduce teach walkthrough. The prompt carries no query or
+# label, so a digest's cache key depends only on the section text.
+_TEACH_DIGEST_SYSTEM_PROMPT = (
+    "You are PaperTA, an expert academic paper analyst. "
+    "Condense the following excerpt of a research paper into a dense digest that "
+    "will later be combined with digests of the other sections into a walkthrough "
+    "of the whole paper. Keep every definition, method step, dataset, baseline, "
+    "metric, numeric result, limitation, and stated future direction. "
+    "Do not add anything that is not in the excerpt. Use at most 300 words."
+)
+
+# Papers longer than this (whitespace tokens) are taught via section digests.
+TEACH_MAP_REDUCE_ABOVE_TOKENS = 50_000
+# Token budget of one digest request, and digest requests in flight.
+_TEACH_DIGEST_WINDOW = SlidingWindowChunker(max_tokens=3000, overlap_tokens=0)
+_TEACH_DIGEST_CONCURRENCY = 4
+
+# Evidence fields that repeat other fields or mean nothing to the model.
+_REDUNDANT_EVIDENCE_KEYS = frozenset({"mode", "retrieved_chunk_ids", "span", "sentence_span"})
+
+# Splits cached text into word-sized pieces for replay as a stream.
+_REPLAY_CHUNK_RE = re.compile(r"\s*\S+\s*|\s+")
+
+
+@dataclass(frozen=True)
+class ClientPoolLimits:
+    """HTTP connection pool limits of each shared provider client."""
+
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry_s: float = 30.0
+
+    def __post_init__(self) -> None:
+        """Validate pool limits.
+
+        Raises:
+            ValueError: If a limit is out of range.
+        """
+        if self.max_connections <= 0:
+            raise ValueError("max_connections must be > 0")
+        if not 0 <= self.max_keepalive_connections <= self.max_connections:
+            raise ValueError("max_keepalive_connections must be in [0, max_connections]")
+        if self.keepalive_expiry_s <= 0:
+            raise ValueError("keepalive_expiry_s must be > 0")
+
+    @classmethod
+    def from_env(cls) -> ClientPoolLimits:
+        """Build pool limits from `PAPERTA_LLM_*` environment variables.
+
+        Returns:
+            Configured limits; unset variables use the defaults.
+
+        Raises:
+            ValueError: If a variable is not a valid number.
+        """
+        values: dict[str, Any] = {}
+        for env, field, kind in (
+            (MAX_CONNECTIONS_ENV, "max_connections", int),
+            (MAX_KEEPALIVE_ENV, "max_keepalive_connections", int),
+            (KEEPALIVE_EXPIRY_ENV, "keepalive_expiry_s", float),
+        ):
+            raw = os.environ.get(env, "").strip()
+            if not raw:
+                continue
+            try:
+                values[field] = kind(raw)
+            except ValueError as exc:
+                raise ValueError(f"{env} must be a number") from exc
+        return cls(**values)
+
+
+# One long-lived client per (provider, base URL, API key digest), shared by all threads.
+_ClientKey = tuple[str, str, str]
+_CLIENTS: dict[_ClientKey, Any] = {}
+# Async clients hold connections bound to one event loop, so each loop gets its own.
+_ASYNC_CLIENTS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[_ClientKey, Any]] = (
+    weakref.WeakKeyDictionary()
+)
+_CLIENTS_LOCK = threading.Lock()
+_POOL_LIMITS: ClientPoolLimits | None = None
+
 
 def get_available_providers() -> dict[str, tuple[str, ...]]:
     """Return providers with their available models.
@@ -60,15 +217,144 @@ def is_provider_configured(provider: str) -> bool:
     """
     if provider == "local":
         return True
-    key_map = {
-        "openai": "OPENAI_API_KEY",
-        "anthropic": "ANTHROPIC_API_KEY",
-        "google": "GOOGLE_API_KEY",
-    }
-    env_var = key_map.get(provider, "")
+    env_var = _API_KEY_ENV.get(provider, "")
     return bool(os.environ.get(env_var, "").strip())
 
 
+def configure_client_pool(limits: ClientPoolLimits) -> None:
+    """Set the pool limits of provider clients and drop existing clients.
+
+    Args:
+        limits: Connection pool limits for clients built from now on.
+    """
+    global _POOL_LIMITS
+    with _CLIENTS_LOCK:
+        _POOL_LIMITS = limits
+    close_clients()
+
+
+def close_clients() -> None:
+    """Close all shared synchronous clients; later calls build new ones.
+
+    Async clients belong to their event loop and are closed by
+    `aclose_clients` or `async_client_scope` on that loop.
+    """
+    with _CLIENTS_LOCK:
+        clients = list(_CLIENTS.values())
+        _CLIENTS.clear()
+    for client in clients:
+        client.close()
+
+
+async def aclose_clients() -> None:
+    """Close the async clients built on the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _CLIENTS_LOCK:
+        clients = list(_ASYNC_CLIENTS.pop(loop, {}).values())
+    for client in clients:
+        await client.close()
+
+
+@contextlib.asynccontextmanager
+async def async_client_scope() -> AsyncIterator[None]:
+    """Share async clients within a block and close them when it exits.
+
+    Wrap the body of each `asyncio.run` entry point in this, since a loop's
+    clients (and their connection pools) cannot be reused once it ends.
+
+    Yields:
+        None while the block runs.
+    """
+    try:
+        yield
+    finally:
+        await aclose_clients()
+
+
+def _client(provider: str, asynchronous: bool = False) -> Any:
+    """Return the shared client of a provider, building it on first use.
+
+    Clients are keyed by provider, base URL and API key, so rotating a key
+    or pointing at another endpoint builds a new client, while every thread
+    and session using the same credentials shares one connection pool.
+    Async clients are shared per running event loop.
+
+    Args:
+        provider: Remote provider name (openai, anthropic, google).
+        asynchronous: Return the SDK's async client; needs a running loop.
+
+    Returns:
+        Provider SDK client.
+    """
+    global _POOL_LIMITS
+    api_key = os.environ.get(_API_KEY_ENV[provider], "")
+    base_url = _BASE_URLS.get(provider) or os.environ.get(_BASE_URL_ENV.get(provider, ""), "")
+    key = (provider, base_url, hashlib.sha256(api_key.encode("utf-8")).hexdigest())
+    loop = asyncio.get_running_loop() if asynchronous else None
+    with _CLIENTS_LOCK:
+        registry = _CLIENTS if loop is None else _ASYNC_CLIENTS.setdefault(loop, {})
+        client = registry.get(key)
+        if client is None:
+            if _POOL_LIMITS is None:
+                _POOL_LIMITS = ClientPoolLimits.from_env()
+            client = _build_client(provider, api_key, base_url or None, _POOL_LIMITS, asynchronous)
+            registry[key] = client
+    return client
+
+
+def _build_client(
+    provider: str,
+    api_key: str,
+    base_url: str | None,
+    limits: ClientPoolLimits,
+    asynchronous: bool = False,
+) -> Any:
+    """Build a provider SDK client with a bounded connection pool.
+
+    Args:
+        provider: Remote provider name.
+        api_key: API key.
+        base_url: Endpoint override, or None for the SDK default.
+        limits: Connection pool limits.
+        asynchronous: Build the SDK's async client.
+
+    Returns:
+        Provider SDK client.
+    """
+    import httpx
+
+    pool = httpx.Limits(
+        max_connections=limits.max_connections,
+        max_keepalive_connections=limits.max_keepalive_connections,
+        keepalive_expiry=limits.keepalive_expiry_s,
+    )
+    if provider == "anthropic":
+        import anthropic
+
+        if asynchronous:
+            return anthropic.AsyncAnthropic(
+                api_key=api_key,
+                base_url=base_url,
+                http_client=anthropic.DefaultAsyncHttpxClient(limits=pool),
+            )
+        return anthropic.Anthropic(
+            api_key=api_key,
+            base_url=base_url,
+            http_client=anthropic.DefaultHttpxClient(limits=pool),
+        )
+    import openai
+
+    if asynchronous:
+        return openai.AsyncOpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            http_client=openai.DefaultAsyncHttpxClient(limits=pool),
+        )
+    return openai.OpenAI(
+        api_key=api_key, base_url=base_url, http_client=openai.DefaultHttpxClient(limits=pool)
+    )
+
+
 def _to_primitive(value: Any) -> Any:
     """Convert dataclass outputs to JSON-serializable primitives.
 
@@ -87,6 +373,59 @@ def _to_primitive(value: Any) -> Any:
     return value
 
 
+def _compact_evidence(evidence: Any, query: str = "") -> Any:
+    """Convert pipeline output to a compact, deduplicated evidence payload.
+
+    Retrieval hits are moved into one top-level `chunks` table keyed by
+    chunk ID, so each chunk text appears once and every other place refers
+    to it by ID. Chunk IDs stay as keys because they are the citation
+    handles the app resolves. Counters derivable from lists, the mode,
+    character spans, the echoed query, and empty values are dropped.
+
+    Args:
+        evidence: Deterministic pipeline result.
+        query: User query already stated in the prompt.
+
+    Returns:
+        JSON-serializable compact payload.
+    """
+    chunks: dict[str, dict[str, Any]] = {}
+    primitive = _to_primitive(evidence)
+    root_paper = primitive.get("paper_id") if isinstance(primitive, dict) else None
+
+    def walk(value: Any, paper_id: Any) -> Any:
+        if isinstance(value, list):
+            return [walk(item, paper_id) for item in value]
+        if not isinstance(value, dict):
+            return value
+        paper_id = value.get("paper_id", paper_id)
+        if "chunk_id" in value and "text" in value:
+            entry = chunks.setdefault(value["chunk_id"], {})
+            if paper_id != root_paper:
+                entry["paper"] = paper_id
+            for key in ("section", "score", "text"):
+                if value.get(key) is not None:
+                    entry[key] = value[key]
+            return value["chunk_id"]
+        compact = {}
+        for key, item in value.items():
+            if key in _REDUNDANT_EVIDENCE_KEYS or item is None or item == "":
+                continue
+            if key.endswith("_count") and isinstance(item, int):
+                continue
+            if key == "query" and item == query:
+                continue
+            compact[key] = walk(item, paper_id)
+        return compact
+
+    body = walk(primitive, root_paper)
+    if not chunks:
+        return body
+    if isinstance(body, dict):
+        return {"chunks": chunks, **body}
+    return {"chunks": chunks, "evidence": body}
+
+
 def _build_system_prompt(mode: str) -> str:
     """Build system prompt for LLM-enhanced analysis.
 
@@ -153,10 +492,14 @@ def _build_user_prompt(mode: str, query: str, evidence: Any) -> str:
     Returns:
         User prompt string with evidence context.
     """
-    evidence_json = json.dumps(_to_primitive(evidence), indent=2)
+    evidence_json = json.dumps(
+        _compact_evidence(evidence, query), ensure_ascii=False, separators=(",", ":")
+    )
     return (
         f"Query: {query}\n\n"
-        f"Evidence from deterministic analysis:\n```json\n{evidence_json}\n```\n\n"
+        f"Evidence from deterministic analysis. Chunk texts appear once under "
+        f'"chunks", keyed by chunk ID; elsewhere chunks are referenced by ID.\n'
+        f"```json\n{evidence_json}\n```\n\n"
         f"Based on this evidence, provide an enhanced {mode} analysis. "
         f"Cite chunk IDs from the evidence in your response."
     )
@@ -168,6 +511,7 @@ def enhance_with_llm(
     deterministic_result: Any,
     provider: str = "openai",
     model: str = "gpt-4o",
+    cache: LLMResponseCache | None = None,
 ) -> str:
     """Enhance deterministic pipeline results with LLM analysis.
 
@@ -177,6 +521,7 @@ def enhance_with_llm(
         deterministic_result: Result from deterministic pipeline.
         provider: LLM provider name.
         model: Model name.
+        cache: Response cache; identical requests are answered from it.
 
     Returns:
         LLM-enhanced analysis text (Markdown).
@@ -195,15 +540,7 @@ def enhance_with_llm(
 
     system_prompt = _build_system_prompt(mode)
     user_prompt = _build_user_prompt(mode, query, deterministic_result)
-
-    if provider == "openai":
-        return _call_openai(model, system_prompt, user_prompt)
-    elif provider == "anthropic":
-        return _call_anthropic(model, system_prompt, user_prompt)
-    elif provider == "google":
-        return _call_google(model, system_prompt, user_prompt)
-    else:
-        raise ValueError(f"Unsupported provider: {provider}")
+    return _complete(provider, model, system_prompt, user_prompt, cache)
 
 
 def stream_with_llm(
@@ -212,15 +549,20 @@ def stream_with_llm(
     deterministic_result: Any,
     provider: str = "openai",
     model: str = "gpt-4o",
+    cache: LLMResponseCache | None = None,
 ) -> Generator[str, None, None]:
     """Stream LLM-enhanced analysis token by token.
 
+    A cached completion is replayed word by word. Only streams read to the
+    end are cached, so an abandoned stream never stores partial text.
+
     Args:
         mode: Pipeline mode.
         query: User's query/objective.
         deterministic_result: Result from deterministic pipeline.
         provider: LLM provider name.
         model: Model name.
+        cache: Response cache; identical requests are replayed from it.
 
     Yields:
         Text chunks as they are generated.
@@ -236,14 +578,73 @@ def stream_with_llm(
     system_prompt = _build_system_prompt(mode)
     user_prompt = _build_user_prompt(mode, query, deterministic_result)
 
+    if provider not in _GENERATION_PARAMS:
+        yield f"[Unsupported provider: {provider}]"
+        return
+
+    key = None
+    if cache is not None:
+        key = cache.key(provider, model, system_prompt, user_prompt, _GENERATION_PARAMS[provider])
+        cached = cache.get(key)
+        if cached is not None:
+            yield from _REPLAY_CHUNK_RE.findall(cached)
+            return
+
     if provider == "openai":
-        yield from _stream_openai(model, system_prompt, user_prompt)
+        stream = _stream_openai(model, system_prompt, user_prompt)
     elif provider == "anthropic":
-        yield from _stream_anthropic(model, system_prompt, user_prompt)
-    elif provider == "google":
-        yield from _stream_google(model, system_prompt, user_prompt)
+        stream = _stream_anthropic(model, system_prompt, user_prompt)
     else:
-        yield f"[Unsupported provider: {provider}]"
+        stream = _stream_google(model, system_prompt, user_prompt)
+    parts: list[str] = []
+    for text in stream:
+        parts.append(text)
+        yield text
+    if cache is not None and key is not None and parts:
+        cache.put(key, "".join(parts))
+
+
+def _complete(
+    provider: str,
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    cache: LLMResponseCache | None,
+) -> str:
+    """Run one completion, answering from and filling the response cache.
+
+    Args:
+        provider: LLM provider name.
+        model: Model name.
+        system_prompt: System message.
+        user_prompt: User message.
+        cache: Response cache, or None to always call the provider.
+
+    Returns:
+        Generated text.
+
+    Raises:
+        ValueError: If the provider is unsupported.
+    """
+    if provider not in _GENERATION_PARAMS:
+        raise ValueError(f"Unsupported provider: {provider}")
+
+    key = None
+    if cache is not None:
+        key = cache.key(provider, model, system_prompt, user_prompt, _GENERATION_PARAMS[provider])
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    if provider == "openai":
+        text = _call_openai(model, system_prompt, user_prompt)
+    elif provider == "anthropic":
+        text = _call_anthropic(model, system_prompt, user_prompt)
+    else:
+        text = _call_google(model, system_prompt, user_prompt)
+    if cache is not None and key is not None and text:
+        cache.put(key, text)
+    return text
 
 
 def _call_openai(model: str, system_prompt: str, user_prompt: str) -> str:
@@ -257,17 +658,14 @@ def _call_openai(model: str, system_prompt: str, user_prompt: str) -> str:
     Returns:
         Generated text.
     """
-    from openai import OpenAI
-
-    client = OpenAI()
+    client = _client("openai")
     response = client.chat.completions.create(
         model=model,
         messages=[
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
         ],
-        temperature=0.3,
-        max_tokens=8192,
+        **_GENERATION_PARAMS["openai"],
     )
     return response.choices[0].message.content or ""
 
@@ -285,18 +683,15 @@ def _stream_openai(
     Yields:
         Text chunks.
     """
-    from openai import OpenAI
-
-    client = OpenAI()
+    client = _client("openai")
     stream = client.chat.completions.create(
         model=model,
         messages=[
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
         ],
-        temperature=0.3,
-        max_tokens=8192,
         stream=True,
+        **_GENERATION_PARAMS["openai"],
     )
     for chunk in stream:
         if chunk.choices and chunk.choices[0].delta.content:
@@ -314,14 +709,12 @@ def _call_anthropic(model: str, system_prompt: str, user_prompt: str) -> str:
     Returns:
         Generated text.
     """
-    import anthropic
-
-    client = anthropic.Anthropic()
+    client = _client("anthropic")
     response = client.messages.create(
         model=model,
-        max_tokens=8192,
         system=system_prompt,
         messages=[{"role": "user", "content": user_prompt}],
+        **_GENERATION_PARAMS["anthropic"],
     )
     return response.content[0].text
 
@@ -339,14 +732,12 @@ def _stream_anthropic(
     Yields:
         Text chunks.
     """
-    import anthropic
-
-    client = anthropic.Anthropic()
+    client = _client("anthropic")
     with client.messages.stream(
         model=model,
-        max_tokens=8192,
         system=system_prompt,
         messages=[{"role": "user", "content": user_prompt}],
+        **_GENERATION_PARAMS["anthropic"],
     ) as stream:
         for text in stream.text_stream:
             yield text
@@ -363,20 +754,14 @@ def _call_google(model: str, system_prompt: str, user_prompt: str) -> str:
     Returns:
         Generated text.
     """
-    from openai import OpenAI
-
-    client = OpenAI(
-        api_key=os.environ.get("GOOGLE_API_KEY", ""),
-        base_url="https://generativelanguage.googleapis.com/v1beta/openai/",
-    )
+    client = _client("google")
     response = client.chat.completions.create(
         model=model,
         messages=[
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
         ],
-        temperature=0.3,
-        max_tokens=8192,
+        **_GENERATION_PARAMS["google"],
     )
     return response.choices[0].message.content or ""
 
@@ -394,21 +779,15 @@ def _stream_google(
     Yields:
         Text chunks.
     """
-    from openai import OpenAI
-
-    client = OpenAI(
-        api_key=os.environ.get("GOOGLE_API_KEY", ""),
-        base_url="https://generativelanguage.googleapis.com/v1beta/openai/",
-    )
+    client = _client("google")
     stream = client.chat.completions.create(
         model=model,
         messages=[
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
         ],
-        temperature=0.3,
-        max_tokens=8192,
         stream=True,
+        **_GENERATION_PARAMS["google"],
     )
     for chunk in stream:
         if chunk.choices and chunk.choices[0].delta.content:
@@ -420,17 +799,27 @@ def teach_enhance_with_llm(
     query: str,
     provider: str = "openai",
     model: str = "gpt-4o",
+    cache: LLMResponseCache | None = None,
+    map_reduce_above_tokens: int | None = TEACH_MAP_REDUCE_ABOVE_TOKENS,
 ) -> str:
     """Generate comprehensive teach walkthrough using full paper sections.
 
     Sends the entire paper text to the LLM for a thorough pedagogical
-    walkthrough, rather than just serialized pipeline snippets.
+    walkthrough, rather than just serialized pipeline snippets. Papers
+    longer than `map_reduce_above_tokens` are instead digested section by
+    section in parallel, each digest request staying within a token budget,
+    and the digests are reduced into the same walkthrough structure. Digest
+    prompts hold only the section text, so with a cache a re-run only
+    digests sections whose text changed.
 
     Args:
         sections: Paper sections (sequence of SectionInput or similar).
         query: Learning objective.
         provider: LLM provider name.
         model: Model name.
+        cache: Response cache; identical requests are answered from it.
+        map_reduce_above_tokens: Whitespace-token length above which the
+            map-reduce mode is used; None always sends the full paper.
 
     Returns:
         LLM-generated comprehensive walkthrough (Markdown).
@@ -447,34 +836,34 @@ def teach_enhance_with_llm(
             f"Set the appropriate API key environment variable."
         )
 
-    system_prompt = (
-        "You are PaperTA, an expert academic paper analyst and educator. "
-        "Your task is to produce a comprehensive walkthrough of a research paper "
-        "so that a reader can fully understand the paper without reading the original. "
-        "Write in clear, accessible prose while maintaining scholarly accuracy.\n\n"
-        "Structure your walkthrough as follows:\n"
-        "## TL;DR\n2-3 sentence overview of the entire paper.\n\n"
-        "## Problem & Motivation\n"
-        "What problem is addressed and why it matters to the field.\n\n"
-        "## Background & Prerequisites\n"
-        "Key concepts and prior knowledge needed to understand this work.\n\n"
-        "## Core Approach\n"
-        "The methodology, framework, or system proposed. Explain step by step.\n\n"
-        "## Experimental Setup\n"
-        "How the approach was evaluated: datasets, baselines, metrics.\n\n"
-        "## Key Results\n"
-        "Main findings with specific numbers, tables, or comparisons when available.\n\n"
-        "## Discussion & Implications\n"
-        "What the results mean and their broader significance.\n\n"
-        "## Limitations & Future Work\n"
-        "Acknowledged shortcomings and directions for future research.\n\n"
-        "## Key Takeaways\n"
-        "3-5 bullet points summarizing the paper's contribution.\n\n"
-        "Be thorough - length is not a concern. Cover all important aspects. "
-        "Cite specific paper sections using [Section Name] notation throughout."
+    parts = _section_parts(sections)
+    token_count = sum(len(text.split()) for _, text in parts)
+    if map_reduce_above_tokens is not None and token_count > map_reduce_above_tokens:
+        return asyncio.run(_teach_map_reduce(parts, query, provider, model, cache))
+
+    full_text = "\n\n".join(f"### {label}\n{text}" for label, text in parts)
+
+    user_prompt = (
+        f"Learning Objective: {query}\n\n"
+        f"=== FULL PAPER CONTENT ===\n\n{full_text}\n\n"
+        f"=== END OF PAPER ===\n\n"
+        f"Based on the complete paper above, provide a comprehensive "
+        f"walkthrough following the structure specified. Cover every important "
+        f"aspect so the reader gains complete understanding."
     )
+    return _complete(provider, model, _TEACH_SYSTEM_PROMPT, user_prompt, cache)
+
+
+def _section_parts(sections: Any) -> list[tuple[str, str]]:
+    """Collect the non-empty (label, text) pairs of paper sections.
 
-    section_parts = []
+    Args:
+        sections: Paper sections (sequence of SectionInput or dicts).
+
+    Returns:
+        Ordered (label, stripped text) pairs.
+    """
+    parts = []
     for sec in sections:
         if hasattr(sec, "label"):
             label, text = sec.label, sec.text
@@ -484,24 +873,300 @@ def teach_enhance_with_llm(
             continue
         text = str(text).strip()
         if text:
-            section_parts.append(f"### {label}\n{text}")
+            parts.append((label, text))
+    return parts
 
-    full_text = "\n\n".join(section_parts)
 
-    user_prompt = (
-        f"Learning Objective: {query}\n\n"
-        f"=== FULL PAPER CONTENT ===\n\n{full_text}\n\n"
-        f"=== END OF PAPER ===\n\n"
-        f"Based on the complete paper above, provide a comprehensive "
-        f"walkthrough following the structure specified. Cover every important "
-        f"aspect so the reader gains complete understanding."
-    )
+async def _teach_map_reduce(
+    parts: list[tuple[str, str]],
+    query: str,
+    provider: str,
+    model: str,
+    cache: LLMResponseCache | None,
+) -> str:
+    """Digest sections concurrently, then reduce the digests into a walkthrough.
 
-    if provider == "openai":
-        return _call_openai(model, system_prompt, user_prompt)
-    elif provider == "anthropic":
-        return _call_anthropic(model, system_prompt, user_prompt)
-    elif provider == "google":
-        return _call_google(model, system_prompt, user_prompt)
-    else:
+    Args:
+        parts: Ordered (label, text) section pairs.
+        query: Learning objective.
+        provider: LLM provider name.
+        model: Model name.
+        cache: Response cache for digests and the final walkthrough.
+
+    Returns:
+        LLM-generated comprehensive walkthrough (Markdown).
+    """
+    excerpts: list[tuple[str, str]] = []
+    for label, text in parts:
+        spans = _TEACH_DIGEST_WINDOW(text)
+        for idx, (start, end) in enumerate(spans, 1):
+            suffix = f" (part {idx}/{len(spans)})" if len(spans) > 1 else ""
+            excerpts.append((f"{label}{suffix}", text[start:end]))
+
+    async with async_client_scope():
+        digests = await gather_bounded(
+            [
+                functools.partial(
+                    _acomplete, provider, model, _TEACH_DIGEST_SYSTEM_PROMPT, excerpt, cache
+                )
+                for _, excerpt in excerpts
+            ],
+            limit=_TEACH_DIGEST_CONCURRENCY,
+        )
+        digest_text = "\n\n".join(
+            f"### {label}\n{digest.strip()}" for (label, _), digest in zip(excerpts, digests)
+        )
+        user_prompt = (
+            f"Learning Objective: {query}\n\n"
+            f"=== SECTION DIGESTS (in paper order) ===\n\n{digest_text}\n\n"
+            f"=== END OF DIGESTS ===\n\n"
+            f"The digests above condense every section of the paper. Based on them, "
+            f"provide a comprehensive walkthrough following the structure specified. "
+            f"Cover every important aspect so the reader gains complete understanding."
+        )
+        return await _acomplete(provider, model, _TEACH_SYSTEM_PROMPT, user_prompt, cache)
+
+
+async def aenhance_with_llm(
+    mode: str,
+    query: str,
+    deterministic_result: Any,
+    provider: str = "openai",
+    model: str = "gpt-4o",
+    cache: LLMResponseCache | None = None,
+) -> str:
+    """Enhance deterministic pipeline results with LLM analysis, asynchronously.
+
+    Async variant of `enhance_with_llm` using the SDKs' async clients, so
+    several requests can run concurrently on one event loop.
+
+    Args:
+        mode: Pipeline mode.
+        query: User's query/objective.
+        deterministic_result: Result from deterministic pipeline.
+        provider: LLM provider name.
+        model: Model name.
+        cache: Response cache; identical requests are answered from it.
+
+    Returns:
+        LLM-enhanced analysis text (Markdown).
+
+    Raises:
+        ValueError: If provider is not configured or unsupported.
+    """
+    if provider == "local":
+        return ""
+
+    if not is_provider_configured(provider):
+        raise ValueError(
+            f"Provider '{provider}' is not configured. "
+            f"Set the appropriate API key environment variable."
+        )
+
+    system_prompt = _build_system_prompt(mode)
+    user_prompt = _build_user_prompt(mode, query, deterministic_result)
+    return await _acomplete(provider, model, system_prompt, user_prompt, cache)
+
+
+async def astream_with_llm(
+    mode: str,
+    query: str,
+    deterministic_result: Any,
+    provider: str = "openai",
+    model: str = "gpt-4o",
+    cache: LLMResponseCache | None = None,
+) -> AsyncIterator[str]:
+    """Stream LLM-enhanced analysis token by token, asynchronously.
+
+    Async variant of `stream_with_llm`, with the same cache replay rules.
+
+    Args:
+        mode: Pipeline mode.
+        query: User's query/objective.
+        deterministic_result: Result from deterministic pipeline.
+        provider: LLM provider name.
+        model: Model name.
+        cache: Response cache; identical requests are replayed from it.
+
+    Yields:
+        Text chunks as they are generated.
+    """
+    if provider == "local":
+        yield ""
+        return
+
+    if not is_provider_configured(provider):
+        yield f"[Provider '{provider}' not configured - showing deterministic results only]"
+        return
+
+    system_prompt = _build_system_prompt(mode)
+    user_prompt = _build_user_prompt(mode, query, deterministic_result)
+    if provider not in _GENERATION_PARAMS:
+        yield f"[Unsupported provider: {provider}]"
+        return
+
+    key = None
+    if cache is not None:
+        key = cache.key(provider, model, system_prompt, user_prompt, _GENERATION_PARAMS[provider])
+        cached = await asyncio.to_thread(cache.get, key)
+        if cached is not None:
+            for text in _REPLAY_CHUNK_RE.findall(cached):
+                yield text
+            return
+
+    parts: list[str] = []
+    async for text in _astream(provider, model, system_prompt, user_prompt):
+        parts.append(text)
+        yield text
+    if cache is not None and key is not None and parts:
+        await asyncio.to_thread(cache.put, key, "".join(parts))
+
+
+async def _acomplete(
+    provider: str,
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    cache: LLMResponseCache | None,
+) -> str:
+    """Run one completion on an async client, using the response cache.
+
+    Args:
+        provider: LLM provider name.
+        model: Model name.
+        system_prompt: System message.
+        user_prompt: User message.
+        cache: Response cache, or None to always call the provider.
+
+    Returns:
+        Generated text.
+
+    Raises:
+        ValueError: If the provider is unsupported.
+    """
+    if provider not in _GENERATION_PARAMS:
         raise ValueError(f"Unsupported provider: {provider}")
+
+    key = None
+    if cache is not None:
+        key = cache.key(provider, model, system_prompt, user_prompt, _GENERATION_PARAMS[provider])
+        cached = await asyncio.to_thread(cache.get, key)
+        if cached is not None:
+            return cached
+
+    client = _client(provider, asynchronous=True)
+    if provider == "anthropic":
+        response = await client.messages.create(
+            model=model,
+            system=system_prompt,
+            messages=[{"role": "user", "content": user_prompt}],
+            **_GENERATION_PARAMS[provider],
+        )
+        text = response.content[0].text
+    else:
+        response = await client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            **_GENERATION_PARAMS[provider],
+        )
+        text = response.choices[0].message.content or ""
+    if cache is not None and key is not None and text:
+        await asyncio.to_thread(cache.put, key, text)
+    return text
+
+
+async def _astream(
+    provider: str, model: str, system_prompt: str, user_prompt: str
+) -> AsyncIterator[str]:
+    """Stream from a provider's async client.
+
+    Args:
+        provider: Remote provider name.
+        model: Model name.
+        system_prompt: System message.
+        user_prompt: User message.
+
+    Yields:
+        Text chunks.
+    """
+    client = _client(provider, asynchronous=True)
+    if provider == "anthropic":
+        async with client.messages.stream(
+            model=model,
+            system=system_prompt,
+            messages=[{"role": "user", "content": user_prompt}],
+            **_GENERATION_PARAMS[provider],
+        ) as stream:
+            async for text in stream.text_stream:
+                yield text
+        return
+
+    stream = await client.chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ],
+        stream=True,
+        **_GENERATION_PARAMS[provider],
+    )
+    async for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
+
+
+async def gather_bounded(
+    calls: Iterable[Callable[[], Awaitable[T]]],
+    limit: int = 4,
+    return_exceptions: bool = False,
+) -> list[Any]:
+    """Run awaitable factories concurrently, at most `limit` at a time.
+
+    Unlike `asyncio.gather`, the first failure cancels every other call,
+    waits for them to finish unwinding, and is then re-raised, so no request
+    keeps running (and billing) after the batch has failed. Cancelling the
+    caller cancels all calls the same way.
+
+    Args:
+        calls: Zero-argument callables returning awaitables, e.g. lambdas
+            around `aenhance_with_llm`.
+        limit: Maximum number of calls in flight.
+        return_exceptions: Return a failed call's exception in its result
+            slot and keep running the others, for batches of independent
+            calls where partial results are still useful.
+
+    Returns:
+        Results in the order of `calls` (exceptions included when
+        `return_exceptions` is set).
+
+    Raises:
+        ValueError: If `limit` is not positive.
+    """
+    if limit <= 0:
+        raise ValueError("limit must be > 0")
+    factories = list(calls)
+    results: list[Any] = [None] * len(factories)
+    pending = iter(enumerate(factories))
+
+    async def worker() -> None:
+        # Workers share one iterator, so a failed worker stops taking new calls.
+        for idx, factory in pending:
+            try:
+                results[idx] = await factory()
+            except Exception as exc:
+                if not return_exceptions:
+                    raise
+                results[idx] = exc
+
+    tasks = [asyncio.create_task(worker()) for _ in range(min(limit, len(factories)))]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return results
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import re
 from typing import Sequence
 
 from paperta.ingestion import ingest_document
@@ -18,10 +17,10 @@ from paperta.multi_paper_contracts import (
     PerPaperRetrieval,
 )
 from paperta.retrieval import retrieve
+from paperta.text_utils import tokenize
 
 
 NOT_STATED = "Not stated in the paper."
-_TOKEN_RE = re.compile(r"[a-z0-9]+")
 _VALID_LABELS = {"supporting", "contradicting", "mixed", "insufficient evidence"}
 
 
@@ -34,7 +33,7 @@ def _tokenize(text: str) -> tuple[str, ...]:
     Returns:
         Ordered tuple of tokens.
     """
-    return tuple(_TOKEN_RE.findall(text.lower()))
+    return tuple(tokenize(text))
 
 
 def _concept_id(name: str) -> str:
@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import hashlib
+import math
+import multiprocessing
+import os
 import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
 from io import BytesIO
-from typing import Sequence
+from typing import Any, Callable, Iterable, Iterator, Mapping, MutableMapping, Sequence
 
 from paperta.contracts import SectionInput
 
@@ -24,21 +31,267 @@ _HEADING_RE = re.compile("|".join(_HEADING_PATTERNS), re.IGNORECASE | re.MULTILI
 
 # Page number / header/footer noise
 _PAGE_NUM_RE = re.compile(r"^\s*\d{1,5}\s*$", re.MULTILINE)
+# Searched within single stripped lines; equivalent to a whole-line
+# `^.*(?:...).*$` match without its per-position backtracking.
 _PROCEEDINGS_RE = re.compile(
-    r"^.*(?:proceedings|conference|journal|volume|pages?\s+\d).*$",
+    r"proceedings|conference|journal|volume|pages?\s+\d",
+    re.IGNORECASE,
+)
+
+_CONTENT_CHAR_RE = re.compile(r"[^\s\d]")
+
+# Only lines whose lowercased text contains one of these can match
+# `_PROCEEDINGS_RE`, except for the characters below, which `str.lower` and
+# case-insensitive regex matching treat differently.
+_PROCEEDINGS_KEYWORDS = ("proceedings", "conference", "journal", "volume", "page")
+_CASE_FOLD_EXCEPTIONS = ("\u0130", "\u0131", "\u017f")
+
+# Every line matching `_HEADING_RE` starts with a decimal digit or one of these.
+_HEADING_FIRST_CHARS = frozenset("abcdefilmrsvxABCDEFILMRSVX\u0130\u0131\u017f")
+
+# Leading section numbers in outline titles: "1", "2.3", "IV.", "A.1".
+_OUTLINE_NUMBER_RE = re.compile(r"^(?:\d+(?:\.\d+)*|[IVXLC]+|[A-Z](?:\.\d+)+)\.?\s+")
+
+# A line holding only an (optionally numbered) bibliography heading.
+_REFERENCES_HEADING_RE = re.compile(
+    r"^[ \t]*(?:(?:\d+|[IVXLC]+)\.?[ \t]+)?(?:references|bibliography)[ \t]*$",
     re.IGNORECASE | re.MULTILINE,
 )
 
+# Start of back matter worth keeping after the bibliography.
+_APPENDIX_HEADING_RE = re.compile(
+    r"^[ \t]*(?:appendix|appendices|supplementary material)\b",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# `top_level_sections` keeps this many sections, rolling the rest into the last.
+_MAX_TOP_LEVEL = 20
+
+# Numbered subsection headings such as "2.1 Data" or "2.1.3. Ablations".
+_SUBHEADING_RE = re.compile(
+    r"^[ \t]*(\d+(?:\.\d+)+)\.?[ \t]+([A-Z][^\n]{0,118}?)[ \t]*$", re.MULTILINE
+)
+
+# `detect_sections` feeds text in blocks of this size to keep working memory flat.
+_DETECT_BLOCK_CHARS = 1 << 16
+
+# Below this many pages per worker, process start-up outweighs the parallel gain.
+_MIN_PAGES_PER_WORKER = 4
+
+# Running heads and feet: non-empty lines this close to a page edge that recur
+# on this share of pages (and at least this many). Alternating even/odd heads
+# each cover about half the pages, so the share stays below one half.
+_RUNNING_EDGE_LINES = 2
+_RUNNING_MIN_SHARE = 0.4
+_RUNNING_MIN_PAGES = 3
+_DIGITS_RE = re.compile(r"\d+")
+
+# Text-showing operators (Tj/TJ, and ' / " after their string or array operand)
+# and inline-image (BI) operators in a content stream.
+_TEXT_SHOW_RE = re.compile(rb"(?<![A-Za-z])T[jJ](?![A-Za-z])|[)>\]]\s*['\"]")
+_INLINE_IMAGE_RE = re.compile(rb"(?<![A-Za-z])BI(?![A-Za-z])")
+
+# Pages `scan_text_layer` inspects by default, spread evenly over the document.
+_SCAN_SAMPLE_PAGES = 8
+
+# Page digests skip embedded font programs (large, irrelevant to the text).
+_DIGEST_SKIP_KEYS = frozenset({"/Parent", "/FontFile", "/FontFile2", "/FontFile3"})
+
+
+@dataclass(frozen=True)
+class ExtractionOptions:
+    """Which pages of a PDF to extract, and how to clean them.
+
+    `page_range` is a 0-based, half-open `(start, stop)` page slice; a `stop`
+    past the last page is clipped. With `stop_at_references`, extraction ends
+    at the References/Bibliography heading and later pages are never parsed.
+    `include_appendices` then resumes at the first appendix after it instead
+    of stopping for good. `strip_running_lines` removes running headers and
+    footers with `remove_running_lines`.
+    """
+
+    page_range: tuple[int, int] | None = None
+    stop_at_references: bool = False
+    include_appendices: bool = False
+    strip_running_lines: bool = False
+
+    def __post_init__(self) -> None:
+        """Validate options.
+
+        Raises:
+            ValueError: If the page range is empty or negative.
+        """
+        if self.page_range is not None:
+            start, stop = self.page_range
+            if start < 0 or stop <= start:
+                raise ValueError("page_range must satisfy 0 <= start < stop")
+
+
+_ALL_PAGES = ExtractionOptions()
 
-def extract_text_from_pdf(content: bytes) -> str:
+
+def extract_text_from_pdf(
+    content: bytes,
+    workers: int = 1,
+    options: ExtractionOptions | None = None,
+    page_texts: MutableMapping[str, str] | None = None,
+) -> str:
     """Extract plain text from PDF bytes using pypdf.
 
+    With `workers > 1` the page range is split into contiguous blocks that a
+    process pool extracts concurrently from a shared temporary copy of the
+    file. Page order and the blank-line page join are the same in both modes.
+
+    With `page_texts`, pages are looked up by `page_digests` digest first and
+    only unseen pages are extracted (sequentially), so a revised upload of a
+    paper re-extracts just its changed pages.
+
     Args:
         content: Raw PDF file bytes.
+        workers: Maximum extraction processes. Short documents use fewer.
+        options: Page selection; all pages by default.
+        page_texts: Digest-to-text page cache; newly extracted pages are added.
 
     Returns:
         Extracted text content.
 
+    Raises:
+        ValueError: If `workers` is invalid or PDF parsing fails.
+    """
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+
+    from pypdf import PdfReader
+
+    try:
+        reader = PdfReader(BytesIO(content))
+        pages = _read_pages(
+            reader, workers, options or _ALL_PAGES, content=content, page_texts=page_texts
+        )
+        return "\n\n".join(text for _, text in pages)
+    except Exception as exc:
+        raise ValueError(f"Unable to parse PDF: {exc}") from exc
+
+
+def extract_text_from_path(
+    path: str | os.PathLike[str],
+    workers: int = 1,
+    options: ExtractionOptions | None = None,
+    page_texts: MutableMapping[str, str] | None = None,
+) -> str:
+    """Extract plain text from a PDF file without loading it into memory.
+
+    The file is parsed through an open file object, so pypdf reads objects on
+    demand instead of holding a full in-memory copy as `extract_text_from_pdf`
+    does. Prefer this for batch and command-line use on large files.
+
+    Args:
+        path: PDF file path.
+        workers: Maximum extraction processes. Short documents use fewer.
+        options: Page selection; all pages by default.
+        page_texts: Digest-to-text page cache; newly extracted pages are added.
+
+    Returns:
+        Extracted text content, identical to `extract_text_from_pdf`.
+
+    Raises:
+        ValueError: If `workers` is invalid or the file cannot be read or parsed.
+    """
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+
+    from pypdf import PdfReader
+
+    try:
+        with open(path, "rb") as handle:
+            reader = PdfReader(handle)
+            pages = _read_pages(
+                reader,
+                workers,
+                options or _ALL_PAGES,
+                path=os.fspath(path),
+                page_texts=page_texts,
+            )
+            return "\n\n".join(text for _, text in pages)
+    except Exception as exc:
+        raise ValueError(f"Unable to parse PDF: {exc}") from exc
+
+
+def extract_sections_from_pdf(
+    content: bytes,
+    workers: int = 1,
+    options: ExtractionOptions | None = None,
+    page_texts: MutableMapping[str, str] | None = None,
+) -> tuple[str, tuple[SectionInput, ...]]:
+    """Extract text and sections, taking sections from the PDF outline if any.
+
+    When the document has an outline (bookmarks), each entry is mapped to its
+    page and to the heading line on that page, and the text between entries
+    becomes a section. Heuristic `detect_sections` runs only when there is no
+    usable outline.
+
+    Args:
+        content: Raw PDF file bytes.
+        workers: Maximum extraction processes. Short documents use fewer.
+        options: Page selection; all pages by default.
+        page_texts: Digest-to-text page cache; newly extracted pages are added.
+
+    Returns:
+        Tuple of (extracted text as from `extract_text_from_pdf`, sections).
+
+    Raises:
+        ValueError: If `workers` is invalid or PDF parsing fails.
+    """
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    options = options or _ALL_PAGES
+
+    from pypdf import PdfReader
+
+    try:
+        reader = PdfReader(BytesIO(content))
+        entries = _outline_entries(reader)
+        pages = _read_pages(reader, workers, options, content=content, page_texts=page_texts)
+    except Exception as exc:
+        raise ValueError(f"Unable to parse PDF: {exc}") from exc
+    return _text_and_sections(pages, entries, options)
+
+
+def _text_and_sections(
+    pages: list[tuple[int, str]], entries: list[tuple[str, int]], options: ExtractionOptions
+) -> tuple[str, tuple[SectionInput, ...]]:
+    """Join extracted pages and cut sections at the outline or by heuristics.
+
+    Args:
+        pages: `(page_index, text)` pairs in document order.
+        entries: Outline entries of the document.
+        options: Page selection the pages were extracted with.
+
+    Returns:
+        Tuple of (extracted text, sections).
+    """
+    if options.stop_at_references:
+        ref_idx = next(
+            (idx for idx, (title, _) in enumerate(entries) if _is_references_title(title)),
+            None,
+        )
+        if ref_idx is not None:
+            tail = entries[ref_idx + 1 :] if options.include_appendices else []
+            entries = entries[:ref_idx] + tail
+    text = "\n\n".join(page for _, page in pages)
+    sections = _sections_from_outline(pages, entries) if entries else ()
+    return text, sections or detect_sections(text)
+
+
+def has_pdf_outline(content: bytes) -> bool:
+    """Check whether a PDF has outline entries usable as sections.
+
+    Args:
+        content: Raw PDF file bytes.
+
+    Returns:
+        True if `extract_sections_from_pdf` would cut sections at the outline.
+
     Raises:
         ValueError: If PDF parsing fails.
     """
@@ -46,18 +299,776 @@ def extract_text_from_pdf(content: bytes) -> str:
 
     try:
         reader = PdfReader(BytesIO(content))
-        pages = [page.extract_text() or "" for page in reader.pages]
-        return "\n\n".join(pages)
     except Exception as exc:
         raise ValueError(f"Unable to parse PDF: {exc}") from exc
+    return bool(_outline_entries(reader))
+
+
+@dataclass(frozen=True)
+class TextLayerReport:
+    """Result of `scan_text_layer`: which sampled pages carry a text layer.
+
+    Page lists hold 0-based indices. `empty_pages` are sampled pages without
+    any text-showing operator; `image_only_pages` are those of them that draw
+    an image, the signature of a scanned page.
+    """
 
+    page_count: int
+    sampled_pages: tuple[int, ...]
+    empty_pages: tuple[int, ...]
+    image_only_pages: tuple[int, ...]
+
+    @property
+    def kind(self) -> str:
+        """Classify the document from its sampled pages.
+
+        Returns:
+            "text" if every sampled page has text, "scanned" if none has,
+            "mixed" otherwise, and "empty" for a document without pages.
+        """
+        if not self.sampled_pages:
+            return "empty"
+        if not self.empty_pages:
+            return "text"
+        if len(self.empty_pages) == len(self.sampled_pages):
+            return "scanned"
+        return "mixed"
+
+
+def scan_text_layer(content: bytes, sample_size: int = _SCAN_SAMPLE_PAGES) -> TextLayerReport:
+    """Check for a text layer without extracting any text.
+
+    Inspects the content streams (and form XObjects) of up to `sample_size`
+    evenly spaced pages, always including the first and last, for
+    text-showing operators and images. This is far cheaper than text
+    extraction, so scanned documents can be rejected or rerouted up front.
+
+    Args:
+        content: Raw PDF file bytes.
+        sample_size: Maximum number of pages to inspect.
+
+    Returns:
+        Text-layer report of the sampled pages.
+
+    Raises:
+        ValueError: If `sample_size` is invalid or PDF parsing fails.
+    """
+    if sample_size < 1:
+        raise ValueError("sample_size must be >= 1")
 
-def extract_text_from_upload(name: str, content: bytes) -> str:
+    from pypdf import PdfReader
+
+    try:
+        return _scan_reader(PdfReader(BytesIO(content)), sample_size)
+    except Exception as exc:
+        raise ValueError(f"Unable to parse PDF: {exc}") from exc
+
+
+def _scan_reader(reader: Any, sample_size: int) -> TextLayerReport:
+    """Classify the sampled pages of an open document (see `scan_text_layer`).
+
+    Args:
+        reader: Open `PdfReader`.
+        sample_size: Maximum number of pages to inspect.
+
+    Returns:
+        Text-layer report of the sampled pages.
+    """
+    page_count = len(reader.pages)
+    if page_count <= sample_size:
+        sampled = tuple(range(page_count))
+    elif sample_size == 1:
+        sampled = (0,)
+    else:
+        step = (page_count - 1) / (sample_size - 1)
+        sampled = tuple(sorted({round(idx * step) for idx in range(sample_size)}))
+    empty: list[int] = []
+    image_only: list[int] = []
+    for idx in sampled:
+        has_text, has_images = _page_layers(reader.pages[idx])
+        if not has_text:
+            empty.append(idx)
+            if has_images:
+                image_only.append(idx)
+    return TextLayerReport(
+        page_count=page_count,
+        sampled_pages=sampled,
+        empty_pages=tuple(empty),
+        image_only_pages=tuple(image_only),
+    )
+
+
+def _page_layers(page: Any) -> tuple[bool, bool]:
+    """Detect text-showing operators and images on one page.
+
+    Args:
+        page: pypdf page object.
+
+    Returns:
+        Tuple of (has text, draws images), including nested form XObjects.
+    """
+    contents = page.get_contents()
+    data = contents.get_data() if contents is not None else b""
+    if _TEXT_SHOW_RE.search(data):
+        return True, False
+    has_images = bool(_INLINE_IMAGE_RE.search(data))
+    pending = [page.get("/Resources")]
+    seen: set[int] = set()
+    while pending:
+        resources = pending.pop()
+        resources = resources.get_object() if resources is not None else None
+        xobjects = resources.get("/XObject") if resources else None
+        if not xobjects:
+            continue
+        for ref in xobjects.get_object().values():
+            obj = ref.get_object()
+            key = getattr(ref, "idnum", id(obj))
+            if key in seen:
+                continue
+            seen.add(key)
+            subtype = obj.get("/Subtype")
+            if subtype == "/Image":
+                has_images = True
+            elif subtype == "/Form":
+                if _TEXT_SHOW_RE.search(obj.get_data()):
+                    return True, has_images
+                pending.append(obj.get("/Resources"))
+    return False, has_images
+
+
+def iter_pdf_pages(
+    content: bytes,
+    options: ExtractionOptions | None = None,
+    page_texts: MutableMapping[str, str] | None = None,
+) -> Iterator[str]:
+    """Yield page texts one at a time as they are extracted.
+
+    Joining the pages with a blank line reproduces `extract_text_from_pdf`.
+    Stripping running lines needs every page first, so with that option the
+    pages are yielded only after the whole selection is extracted.
+
+    Args:
+        content: Raw PDF file bytes.
+        options: Page selection; all pages by default.
+        page_texts: Digest-to-text page cache; newly extracted pages are added.
+
+    Yields:
+        Extracted text of each selected page (or page part), in document order.
+
+    Raises:
+        ValueError: If PDF parsing fails.
+    """
+    from pypdf import PdfReader
+
+    try:
+        reader = PdfReader(BytesIO(content))
+    except Exception as exc:
+        raise ValueError(f"Unable to parse PDF: {exc}") from exc
+    options = options or _ALL_PAGES
+    if options.strip_running_lines:
+        try:
+            pages = iter(_read_pages(reader, 1, options, page_texts=page_texts))
+        except Exception as exc:
+            raise ValueError(f"Unable to parse PDF: {exc}") from exc
+    else:
+        pages = _iter_selected_pages(reader, options, page_texts)
+    while True:
+        try:
+            _, text = next(pages)
+        except StopIteration:
+            return
+        except Exception as exc:
+            raise ValueError(f"Unable to parse PDF: {exc}") from exc
+        yield text
+
+
+def _read_pages(
+    reader: Any,
+    workers: int,
+    options: ExtractionOptions,
+    content: bytes | None = None,
+    path: str | None = None,
+    page_texts: MutableMapping[str, str] | None = None,
+) -> list[tuple[int, str]]:
+    """Extract selected page texts, in a process pool when worthwhile.
+
+    Stopping at References needs an ordered scan and cached pages need
+    digest lookups, so both always run in this process.
+
+    Args:
+        reader: Open `PdfReader`.
+        workers: Maximum worker processes.
+        options: Page selection.
+        content: PDF bytes, spooled to a temporary file for the pool.
+        path: PDF path the pool workers open directly.
+        page_texts: Digest-to-text page cache; newly extracted pages are added.
+
+    Returns:
+        `(page_index, text)` pairs in document order.
+    """
+    start, stop = _page_bounds(reader, options)
+    workers = min(workers, (stop - start) // _MIN_PAGES_PER_WORKER)
+    sequential = options.stop_at_references or page_texts is not None or workers <= 1
+    if sequential or (content is None and path is None):
+        pages = list(_iter_selected_pages(reader, options, page_texts))
+    elif path is None:
+        fd, tmp = tempfile.mkstemp(suffix=".pdf")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(content)
+            texts = _extract_pages_parallel(tmp, start, stop, workers)
+        finally:
+            os.unlink(tmp)
+        pages = list(zip(range(start, stop), texts))
+    else:
+        texts = _extract_pages_parallel(path, start, stop, workers)
+        pages = list(zip(range(start, stop), texts))
+    if options.strip_running_lines:
+        texts = remove_running_lines([text for _, text in pages])
+        pages = [(idx, text) for (idx, _), text in zip(pages, texts)]
+    return pages
+
+
+def remove_running_lines(pages: Sequence[str]) -> list[str]:
+    """Remove running headers and footers that recur across pages.
+
+    One pass counts, per page, the normalized lines near the top and bottom
+    edges (case and whitespace folded, digit runs masked so "Page 3" matches
+    "Page 4"). Edge lines recurring on enough pages are then dropped; lines
+    away from the edges are never touched.
+
+    Args:
+        pages: Page texts in document order.
+
+    Returns:
+        Page texts without running lines, in the same order.
+    """
+    counts: dict[str, int] = {}
+    edges: list[list[tuple[int, str]]] = []
+    for page in pages:
+        lines = page.split("\n")
+        filled = [idx for idx, line in enumerate(lines) if line.strip()]
+        near_edge = sorted(set(filled[:_RUNNING_EDGE_LINES] + filled[-_RUNNING_EDGE_LINES:]))
+        keyed = [(idx, _running_key(lines[idx])) for idx in near_edge]
+        keyed = [(idx, key) for idx, key in keyed if key]
+        for key in {key for _, key in keyed}:
+            counts[key] = counts.get(key, 0) + 1
+        edges.append(keyed)
+
+    threshold = max(_RUNNING_MIN_PAGES, math.ceil(len(pages) * _RUNNING_MIN_SHARE))
+    running = {key for key, count in counts.items() if count >= threshold}
+    if not running:
+        return list(pages)
+    result = []
+    for page, keyed in zip(pages, edges):
+        drop = {idx for idx, key in keyed if key in running}
+        if drop:
+            page = "\n".join(line for idx, line in enumerate(page.split("\n")) if idx not in drop)
+        result.append(page)
+    return result
+
+
+def _running_key(line: str) -> str:
+    """Normalize a line for running header/footer matching.
+
+    Args:
+        line: Raw line.
+
+    Returns:
+        Normalized line, or an empty string for lines too long to be running text.
+    """
+    stripped = line.strip()
+    if len(stripped) >= 200:
+        return ""
+    return _DIGITS_RE.sub("0", " ".join(stripped.lower().split()))
+
+
+def _page_bounds(reader: Any, options: ExtractionOptions) -> tuple[int, int]:
+    """Clip the requested page range to the document.
+
+    Args:
+        reader: Open `PdfReader`.
+        options: Page selection.
+
+    Returns:
+        `(start, stop)` page indices.
+    """
+    page_count = len(reader.pages)
+    start, stop = options.page_range or (0, page_count)
+    return min(start, page_count), min(stop, page_count)
+
+
+def _iter_selected_pages(
+    reader: Any,
+    options: ExtractionOptions,
+    page_texts: MutableMapping[str, str] | None = None,
+) -> Iterator[tuple[int, str]]:
+    """Extract selected pages in order, stopping at References when asked.
+
+    With an outline, the References and appendix entries locate the back
+    matter up front, so bibliography pages are skipped without being parsed.
+    A page holding the References heading contributes only the text before
+    it; an appendix resumes at its heading.
+
+    Args:
+        reader: Open `PdfReader`.
+        options: Page selection.
+        page_texts: Digest-to-text page cache; newly extracted pages are added.
+
+    Yields:
+        `(page_index, text)` pairs in document order.
+    """
+    start, stop = _page_bounds(reader, options)
+    pages = reader.pages
+    memo: dict[int, bytes] = {}
+    if not options.stop_at_references:
+        for idx in range(start, stop):
+            yield idx, _page_text(pages[idx], page_texts, memo)
+        return
+
+    ref_page, appendix_page = _back_matter_pages(_outline_entries(reader))
+    tail = ""
+    for idx in range(start, stop):
+        page = _page_text(pages[idx], page_texts, memo)
+        heading = _REFERENCES_HEADING_RE.search(page)
+        if heading is None and idx != ref_page:
+            yield idx, page
+            continue
+        # The outline may place References on a page whose heading we miss.
+        cut = heading.start() if heading else len(page)
+        yield idx, page[:cut].rstrip()
+        tail = page[heading.end() :] if heading else ""
+        break
+    else:
+        return
+    if not options.include_appendices:
+        return
+
+    resume = idx + 1
+    if appendix_page is not None and appendix_page > idx:
+        tail, resume = "", appendix_page
+    found = _APPENDIX_HEADING_RE.search(tail)
+    if found:
+        yield idx, tail[found.start() :]
+    for idx in range(resume, stop):
+        page = _page_text(pages[idx], page_texts, memo)
+        if not found:
+            found = _APPENDIX_HEADING_RE.search(page)
+            if found:
+                page = page[found.start() :]
+            elif idx == appendix_page:
+                found = True
+            else:
+                continue  # Still in the bibliography.
+        yield idx, page
+
+
+def page_digests(content: bytes) -> list[str]:
+    """Compute the content digest of every page without extracting text.
+
+    A digest covers the page's content stream, its resources (fonts, form
+    XObjects) independent of object numbering, its rotation, and the pypdf
+    version, so an unchanged page of a revised PDF keeps its digest.
+
+    Args:
+        content: Raw PDF file bytes.
+
+    Returns:
+        Per-page digests in page order.
+
+    Raises:
+        ValueError: If PDF parsing fails.
+    """
+    from pypdf import PdfReader
+
+    try:
+        reader = PdfReader(BytesIO(content))
+        memo: dict[int, bytes] = {}
+        return [_page_digest(page, memo) for page in reader.pages]
+    except Exception as exc:
+        raise ValueError(f"Unable to parse PDF: {exc}") from exc
+
+
+@dataclass(frozen=True)
+class LoadedPdf:
+    """Result of `load_pdf`: everything an upload needs from one parse.
+
+    `text` is None when the document has no text layer (`text_layer.kind` is
+    "scanned" or "empty") or extraction was left to the caller.
+    `cached_pages` are the page texts found by the lookup and `new_pages` the
+    ones this call extracted, both keyed by page digest.
+    """
+
+    text_layer: TextLayerReport
+    page_digests: tuple[str, ...] = ()
+    has_outline: bool = False
+    text: str | None = None
+    sections: tuple[SectionInput, ...] = ()
+    cached_pages: dict[str, str] = field(default_factory=dict)
+    new_pages: dict[str, str] = field(default_factory=dict)
+
+
+def load_pdf(
+    content: bytes,
+    options: ExtractionOptions | None = None,
+    page_lookup: Callable[[Sequence[str]], Mapping[str, str]] | None = None,
+    outlined_only: bool = False,
+) -> LoadedPdf:
+    """Scan, digest, and extract a PDF from a single parse.
+
+    Combines `scan_text_layer`, `page_digests`, `has_pdf_outline` and
+    `extract_sections_from_pdf`. A document without a text layer stops after
+    the scan.
+
+    Args:
+        content: Raw PDF file bytes.
+        options: Page selection; all pages by default.
+        page_lookup: Maps page digests to cached page texts, e.g.
+            `ExtractionCache.get_pages`; cached pages are not re-extracted.
+        outlined_only: Extract only documents with an outline, for callers
+            that stream heuristic sections themselves.
+
+    Returns:
+        Scan report, digests, outline flag and, if extracted, text and sections.
+
+    Raises:
+        ValueError: If PDF parsing fails.
+    """
+    options = options or _ALL_PAGES
+
+    from pypdf import PdfReader
+
+    try:
+        reader = PdfReader(BytesIO(content))
+        report = _scan_reader(reader, _SCAN_SAMPLE_PAGES)
+        if report.kind in ("scanned", "empty"):
+            return LoadedPdf(text_layer=report)
+        memo: dict[int, bytes] = {}
+        digests = tuple(_page_digest(page, memo) for page in reader.pages)
+        cached = dict(page_lookup(digests)) if page_lookup is not None else {}
+        entries = _outline_entries(reader)
+        loaded = LoadedPdf(report, digests, bool(entries), cached_pages=cached)
+        if outlined_only and not entries:
+            return loaded
+        page_texts = dict(cached) if page_lookup is not None else None
+        pages = _read_pages(reader, 1, options, page_texts=page_texts)
+    except Exception as exc:
+        raise ValueError(f"Unable to parse PDF: {exc}") from exc
+    text, sections = _text_and_sections(pages, entries, options)
+    new_pages = {k: v for k, v in (page_texts or {}).items() if k not in cached}
+    return replace(loaded, text=text, sections=sections, new_pages=new_pages)
+
+
+def _page_text(
+    page: Any, page_texts: MutableMapping[str, str] | None, memo: dict[int, bytes]
+) -> str:
+    """Extract one page's text, reusing a cached text for an unchanged page.
+
+    Args:
+        page: pypdf page object.
+        page_texts: Digest-to-text page cache, or None to always extract.
+        memo: Per-document fingerprints of shared objects, by object number.
+
+    Returns:
+        Page text.
+    """
+    if page_texts is None:
+        return page.extract_text() or ""
+    digest = _page_digest(page, memo)
+    text = page_texts.get(digest)
+    if text is None:
+        text = page.extract_text() or ""
+        page_texts[digest] = text
+    return text
+
+
+def _page_digest(page: Any, memo: dict[int, bytes]) -> str:
+    """Digest the inputs of one page's text extraction.
+
+    Args:
+        page: pypdf page object.
+        memo: Per-document fingerprints of shared objects, by object number.
+
+    Returns:
+        Hex page digest.
+    """
+    from pypdf import __version__ as pypdf_version
+
+    digest = hashlib.sha256(f"pypdf-{pypdf_version}".encode("utf-8"))
+    contents = page.get_contents()
+    digest.update(contents.get_data() if contents is not None else b"")
+    digest.update(_fingerprint(_inherited_attribute(page, "/Resources"), memo))
+    rotate = _inherited_attribute(page, "/Rotate")
+    digest.update(repr(rotate.get_object() if rotate is not None else 0).encode("utf-8"))
+    return digest.hexdigest()[:32]
+
+
+def _inherited_attribute(page: Any, key: str) -> Any:
+    """Look up an inheritable page attribute, walking up the page tree.
+
+    Args:
+        page: pypdf page object.
+        key: Inheritable attribute name, e.g. `/Resources` or `/Rotate`.
+
+    Returns:
+        Raw attribute value of the page or its nearest ancestor, or None.
+    """
+    node = page
+    seen: set[int] = set()
+    while node is not None and id(node) not in seen:
+        if key in node:
+            return node.raw_get(key)
+        seen.add(id(node))
+        parent = node.get("/Parent")
+        node = parent.get_object() if parent is not None else None
+    return None
+
+
+def _fingerprint(obj: Any, memo: dict[int, bytes], visiting: set[int] | None = None) -> bytes:
+    """Digest a PDF object canonically, ignoring object numbers.
+
+    Nested objects are hashed completely; each indirect object is hashed once
+    and a reference back to an object still being hashed is a cycle.
+
+    Args:
+        obj: PDF object, possibly an indirect reference.
+        memo: Fingerprints of indirect objects seen so far, by object number.
+        visiting: Object numbers on the current path, for cycle detection.
+
+    Returns:
+        Object fingerprint.
+    """
+    if visiting is None:
+        visiting = set()
+    idnum = getattr(obj, "idnum", None)
+    if idnum is not None:
+        if idnum in visiting:
+            return b"cycle"
+        if idnum not in memo:
+            visiting.add(idnum)
+            try:
+                memo[idnum] = _fingerprint(obj.get_object(), memo, visiting)
+            finally:
+                visiting.discard(idnum)
+        return memo[idnum]
+    if isinstance(obj, dict):
+        if obj.get("/Subtype") == "/Image":
+            return b"image"  # Pixels never reach the text layer.
+        digest = hashlib.sha256(b"dict")
+        for key in sorted(obj):
+            if key not in _DIGEST_SKIP_KEYS:
+                value = obj.raw_get(key) if hasattr(obj, "raw_get") else obj[key]
+                digest.update(str(key).encode("utf-8"))
+                digest.update(_fingerprint(value, memo, visiting))
+        if hasattr(obj, "get_data"):
+            digest.update(obj.get_data())
+        return digest.digest()
+    if isinstance(obj, list):
+        digest = hashlib.sha256(b"list")
+        for item in obj:
+            digest.update(_fingerprint(item, memo, visiting))
+        return digest.digest()
+    return repr(obj).encode("utf-8")
+
+
+def _back_matter_pages(entries: Sequence[tuple[str, int]]) -> tuple[int | None, int | None]:
+    """Find the References page and the page of the entry after it.
+
+    Args:
+        entries: `(title, page_index)` outline entries.
+
+    Returns:
+        Tuple of (References page, first appendix page), each None if unknown.
+    """
+    for idx, (title, page) in enumerate(entries):
+        if _is_references_title(title):
+            after = entries[idx + 1][1] if idx + 1 < len(entries) else None
+            return page, after
+    return None, None
+
+
+def _is_references_title(title: str) -> bool:
+    """Check whether an outline title names the bibliography.
+
+    Args:
+        title: Outline entry title.
+
+    Returns:
+        True for References/Bibliography entries.
+    """
+    return _OUTLINE_NUMBER_RE.sub("", title).strip().lower() in ("references", "bibliography")
+
+
+def _outline_entries(reader: Any) -> list[tuple[str, int]]:
+    """Read top-level outline entries with their page indices.
+
+    A lone top-level entry (typically the paper title) is replaced by its
+    children. Malformed outlines yield no entries.
+
+    Args:
+        reader: Open `PdfReader`.
+
+    Returns:
+        `(title, page_index)` pairs in outline order.
+    """
+    try:
+        items = list(reader.outline)
+        top = [item for item in items if not isinstance(item, list)]
+        if len(top) < 2:
+            nested = next((item for item in items if isinstance(item, list)), None)
+            if nested is not None:
+                items = nested
+        entries = []
+        for item in items:
+            if isinstance(item, list):
+                continue
+            title = " ".join(str(item.title or "").split())
+            page = reader.get_destination_page_number(item)
+            if title and page is not None and page >= 0:
+                entries.append((title, page))
+        return entries
+    except Exception:  # noqa: BLE001 - a broken outline only disables the fast path
+        return []
+
+
+def _sections_from_outline(
+    pages: Sequence[tuple[int, str]], entries: Sequence[tuple[str, int]]
+) -> tuple[SectionInput, ...]:
+    """Cut the joined page text into sections at outline entries.
+
+    Args:
+        pages: `(page_index, text)` pairs in document order, as from `_read_pages`.
+        entries: `(title, page_index)` outline entries.
+
+    Returns:
+        Sections, or an empty tuple if no entry could be placed.
+    """
+    text = "\n\n".join(page for _, page in pages)
+    # Page index -> (start, end) offsets in `text`; a page may span several parts.
+    spans: dict[int, tuple[int, int]] = {}
+    offset = 0
+    for idx, page in pages:
+        first = spans.get(idx, (offset, offset))[0]
+        spans[idx] = (first, offset + len(page))
+        offset += len(page) + 2
+
+    # (heading line start, body start, label) per placed entry.
+    cuts: list[tuple[int, int, str]] = []
+    floor = 0
+    for title, page in entries:
+        if page not in spans:
+            continue
+        label = _OUTLINE_NUMBER_RE.sub("", title) or title
+        start = max(floor, spans[page][0])
+        end = max(start, spans[page][1])
+        pattern = r"\s*".join(re.escape(word) for word in label.split())
+        match = re.search(pattern, text[start:end], re.IGNORECASE)
+        if match:
+            head = max(start, text.rfind("\n", 0, start + match.start()) + 1)
+            body = text.find("\n", start + match.end())
+            body = end if body < 0 or body > end else body
+        else:
+            head = body = start
+        cuts.append((head, body, _normalize_heading(label)))
+        floor = body
+    if not cuts:
+        return ()
+
+    raw_sections = [("Preamble", text[: cuts[0][0]])]
+    for idx, (_, body, label) in enumerate(cuts):
+        stop = cuts[idx + 1][0] if idx + 1 < len(cuts) else len(text)
+        raw_sections.append((label, text[body:stop]))
+
+    seen: dict[str, int] = {}
+    result: list[SectionInput] = []
+    for label, raw in raw_sections:
+        body = _strip_noise(raw)
+        if len(body) < 20:
+            continue
+        if label in seen:
+            seen[label] += 1
+            label = f"{label} ({seen[label]})"
+        else:
+            seen[label] = 1
+        result.append(SectionInput(label=label, text=body))
+    return tuple(result)
+
+
+def _strip_noise(text: str) -> str:
+    """Remove page numbers and running proceedings lines from a section body.
+
+    Args:
+        text: Raw section text.
+
+    Returns:
+        Cleaned, stripped text.
+    """
+    lines = []
+    for line in _PAGE_NUM_RE.sub("", text).splitlines():
+        stripped = line.strip()
+        if stripped and len(stripped) < 200 and _PROCEEDINGS_RE.search(stripped):
+            continue
+        lines.append(line if stripped else "")
+    return "\n".join(lines).strip()
+
+
+def _extract_pages_parallel(path: str, start: int, stop: int, workers: int) -> list[str]:
+    """Extract page texts across a process pool, preserving page order.
+
+    Args:
+        path: PDF file path every worker opens.
+        start: First page index (inclusive).
+        stop: Last page index (exclusive).
+        workers: Number of worker processes.
+
+    Returns:
+        Page texts for `start..stop` in document order.
+    """
+    # Two blocks per worker evens out pages of uneven extraction cost.
+    count = stop - start
+    blocks = min(count, workers * 2)
+    bounds = [start + count * idx // blocks for idx in range(blocks + 1)]
+    # Spawn rather than fork: the caller may be a threaded server holding locks.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = [
+            pool.submit(_extract_page_range, path, first, last)
+            for first, last in zip(bounds, bounds[1:])
+        ]
+        return [text for future in futures for text in future.result()]
+
+
+def _extract_page_range(path: str, start: int, stop: int) -> list[str]:
+    """Extract a contiguous page range in a worker process.
+
+    Args:
+        path: Path to the PDF file.
+        start: First page index (inclusive).
+        stop: Last page index (exclusive).
+
+    Returns:
+        Page texts for `start..stop`.
+    """
+    from pypdf import PdfReader
+
+    with open(path, "rb") as handle:
+        reader = PdfReader(handle)
+        return [reader.pages[idx].extract_text() or "" for idx in range(start, stop)]
+
+
+def extract_text_from_upload(
+    name: str,
+    content: bytes,
+    pdf_workers: int = 1,
+    pdf_options: ExtractionOptions | None = None,
+) -> str:
     """Extract plain text from an uploaded file.
 
     Args:
         name: File name with extension.
         content: Uploaded file bytes.
+        pdf_workers: Maximum processes for PDF page extraction.
+        pdf_options: PDF page selection; all pages by default.
 
     Returns:
         Extracted text content.
@@ -69,31 +1080,162 @@ def extract_text_from_upload(name: str, content: bytes) -> str:
     if lower.endswith((".txt", ".md")):
         return content.decode("utf-8", errors="ignore")
     if lower.endswith(".pdf"):
-        return extract_text_from_pdf(content)
+        return extract_text_from_pdf(content, workers=pdf_workers, options=pdf_options)
     raise ValueError("Unsupported file type. Use PDF, TXT, or MD.")
 
 
-def _clean_text(text: str) -> str:
-    """Remove common PDF extraction noise.
+class SectionDetector:
+    """Incremental section detector that emits sections as headings arrive.
+
+    Feed extracted text in pieces of any size (typically pages joined by a
+    blank line). A section is emitted as soon as the next heading is seen,
+    and `finish` flushes the last one. Fed the same text, the emitted
+    sections equal `detect_sections` output.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty detector."""
+        self._pending = ""
+        self._label = "Preamble"
+        self._lines: list[str] = []
+        self._seen: dict[str, int] = {}
+        self._emitted = 0
+        # Cleaned lines kept for the paragraph fallback until a section is emitted.
+        self._all_lines: list[str] | None = []
+
+    def feed(self, text: str) -> list[SectionInput]:
+        """Consume more extracted text.
+
+        Args:
+            text: Next piece of extracted text.
+
+        Returns:
+            Sections completed by this piece, in order.
+        """
+        self._pending += text
+        cut = _safe_cut(self._pending)
+        if not cut:
+            return []
+        ready, self._pending = self._pending[:cut], self._pending[cut:]
+        return self._consume(ready)
+
+    def finish(self) -> list[SectionInput]:
+        """Flush buffered text and the last open section.
+
+        Returns:
+            Remaining sections. When nothing was detected at all, the
+            paragraph-based fallback sections instead.
+        """
+        out = self._consume(self._pending)
+        self._pending = ""
+        out.extend(self._close_section())
+        if self._all_lines is not None:
+            out = list(_fallback_chunking("\n".join(self._all_lines)))
+            self._all_lines = None
+        return out
+
+    def _consume(self, text: str) -> list[SectionInput]:
+        """Clean lines, classify headings and accumulate bodies in one scan.
+
+        Args:
+            text: Raw text ending at a safe cut (or the final remainder).
+
+        Returns:
+            Sections closed by headings in `text`.
+        """
+        out: list[SectionInput] = []
+        body = self._lines
+        text = _PAGE_NUM_RE.sub("", text)
+        flagged = _proceedings_candidates(text)
+        next_flag = flagged[0] if flagged else 0
+        flag_idx = 0
+        end = 0
+        for line, raw in zip(text.splitlines(), text.splitlines(True)):
+            end += len(raw)
+            stripped = line.strip()
+            if not stripped:
+                line = ""
+            elif next_flag < end:
+                if flagged:
+                    while flagged[flag_idx] < end:
+                        flag_idx += 1
+                    next_flag = flagged[flag_idx]
+                if len(stripped) < 200 and _PROCEEDINGS_RE.search(stripped):
+                    continue
+            if self._all_lines is not None:
+                self._all_lines.append(line)
+            if stripped and _is_heading(stripped):
+                out.extend(self._close_section())
+                body = self._lines
+                self._label = _normalize_heading(stripped)
+            else:
+                body.append(line)
+        return out
+
+    def _close_section(self) -> list[SectionInput]:
+        """Close the open section and start an empty one.
+
+        Returns:
+            The closed section, unless it is too short.
+        """
+        body = "\n".join(self._lines).strip()
+        self._lines = []
+        if len(body) < 20:
+            return []
+        label = self._label
+        if label in self._seen:
+            self._seen[label] += 1
+            label = f"{label} ({self._seen[label]})"
+        else:
+            self._seen[label] = 1
+        self._emitted += 1
+        self._all_lines = None
+        return [SectionInput(label=label, text=body)]
+
+
+def _proceedings_candidates(text: str) -> list[int]:
+    """Locate positions of lines that may hold proceedings/journal noise.
 
     Args:
-        text: Raw extracted text.
+        text: Text after page-number removal.
 
     Returns:
-        Cleaned text.
+        Sorted keyword positions followed by a sentinel past the end, or an
+        empty list when every line must be checked.
     """
-    text = _PAGE_NUM_RE.sub("", text)
-    lines = text.splitlines()
-    cleaned = []
-    for line in lines:
-        stripped = line.strip()
-        if not stripped:
-            cleaned.append("")
-            continue
-        if _PROCEEDINGS_RE.match(stripped) and len(stripped) < 200:
-            continue
-        cleaned.append(line)
-    return "\n".join(cleaned)
+    if any(char in text for char in _CASE_FOLD_EXCEPTIONS):
+        return []
+    lowered = text.lower()
+    positions = []
+    for keyword in _PROCEEDINGS_KEYWORDS:
+        idx = lowered.find(keyword)
+        while idx >= 0:
+            positions.append(idx)
+            idx = lowered.find(keyword, idx + 1)
+    positions.sort()
+    positions.append(len(text) + 1)
+    return positions
+
+
+def _safe_cut(text: str) -> int:
+    """Find how much buffered text can be cleaned without the rest.
+
+    Page-number removal can span blank and digit-only lines, so text is only
+    cut right after a line holding some other character.
+
+    Args:
+        text: Buffered raw text.
+
+    Returns:
+        Length of the safe prefix (0 when none).
+    """
+    end = text.rfind("\n")
+    while end >= 0:
+        start = text.rfind("\n", 0, end) + 1
+        if _CONTENT_CHAR_RE.search(text, start, end):
+            return end + 1
+        end = start - 1
+    return 0
 
 
 def detect_sections(text: str) -> tuple[SectionInput, ...]:
@@ -108,52 +1250,30 @@ def detect_sections(text: str) -> tuple[SectionInput, ...]:
     Returns:
         Tuple of SectionInput with detected labels and text content.
     """
-    cleaned = _clean_text(text)
-    lines = cleaned.splitlines()
+    detector = SectionDetector()
+    sections: list[SectionInput] = []
+    for start in range(0, len(text), _DETECT_BLOCK_CHARS):
+        sections.extend(detector.feed(text[start : start + _DETECT_BLOCK_CHARS]))
+    sections.extend(detector.finish())
+    return tuple(sections)
 
-    sections: list[tuple[str, list[str]]] = []
-    current_label = "Preamble"
-    current_lines: list[str] = []
 
-    for line in lines:
-        stripped = line.strip()
-        if stripped and _is_heading(stripped):
-            if current_lines:
-                body = "\n".join(current_lines).strip()
-                if body:
-                    sections.append((current_label, current_lines[:]))
-            current_label = _normalize_heading(stripped)
-            current_lines = []
-        else:
-            current_lines.append(line)
-
-    if current_lines:
-        body = "\n".join(current_lines).strip()
-        if body:
-            sections.append((current_label, current_lines))
+def iter_sections(pages: Iterable[str]) -> Iterator[SectionInput]:
+    """Detect sections progressively from a stream of page texts.
 
-    if not sections:
-        return _fallback_chunking(cleaned)
+    Pages are joined with a blank line, as in `extract_text_from_pdf`, so the
+    yielded sections equal `detect_sections` over the joined text.
 
-    # Deduplicate labels
-    seen: dict[str, int] = {}
-    result: list[SectionInput] = []
-    for label, body_lines in sections:
-        body = "\n".join(body_lines).strip()
-        if not body or len(body) < 20:
-            continue
-        if label in seen:
-            seen[label] += 1
-            label = f"{label} ({seen[label]})"
-        else:
-            seen[label] = 1
-        result.append(SectionInput(label=label, text=body))
-
-    if not result:
-        return _fallback_chunking(cleaned)
+    Args:
+        pages: Page texts in document order.
 
-    # Cap at 20 sections
-    return tuple(result[:20])
+    Yields:
+        Sections as soon as they are complete.
+    """
+    detector = SectionDetector()
+    for idx, page in enumerate(pages):
+        yield from detector.feed(f"\n\n{page}" if idx else page)
+    yield from detector.finish()
 
 
 def _is_heading(line: str) -> bool:
@@ -165,9 +1285,10 @@ def _is_heading(line: str) -> bool:
     Returns:
         True if the line matches heading patterns.
     """
-    if len(line) > 120:
+    if not line or len(line) > 120:
         return False
-    if _HEADING_RE.match(line):
+    first = line[0]
+    if (first in _HEADING_FIRST_CHARS or first.isdecimal()) and _HEADING_RE.match(line):
         return True
     # Check for short all-caps lines (common heading style)
     if line.isupper() and 3 < len(line) < 60:
@@ -222,10 +1343,174 @@ def _fallback_chunking(text: str) -> tuple[SectionInput, ...]:
 
     return tuple(
         SectionInput(label=f"Section {idx}", text=part)
-        for idx, part in enumerate(merged[:20], start=1)
+        for idx, part in enumerate(merged, start=1)
     )
 
 
+class SectionNode:
+    """A section whose numbered subsections are parsed on first access.
+
+    `text` is the whole section including its subsections and `body` the part
+    before the first subsection heading. Children are the headings numbered
+    one level below this node ("2.1" under "2", "2.1.3" under "2.1"); for an
+    unnumbered top-level node, the shallowest numbered headings sharing one
+    parent number. Subtrees of long documents cost nothing until opened.
+    """
+
+    __slots__ = ("label", "number", "text", "_split")
+
+    def __init__(self, label: str, text: str, number: str = "") -> None:
+        """Initialize a node without parsing its subsections.
+
+        Args:
+            label: Section label.
+            text: Full section text, subsections included.
+            number: Section number such as "2.1", or empty when unnumbered.
+        """
+        self.label = label
+        self.number = number
+        self.text = text
+        self._split: tuple[str, tuple[SectionNode, ...]] | None = None
+
+    @property
+    def level(self) -> int:
+        """Depth of the node, 1 for top-level sections.
+
+        Returns:
+            Number of components in `number`, or 1 when unnumbered.
+        """
+        return self.number.count(".") + 1 if self.number else 1
+
+    @property
+    def body(self) -> str:
+        """Text before the first subsection heading.
+
+        Returns:
+            Section body without subsections.
+        """
+        return self._subsections()[0]
+
+    @property
+    def children(self) -> tuple[SectionNode, ...]:
+        """Direct subsections, parsed from `text` on first access.
+
+        Returns:
+            Child nodes in document order.
+        """
+        return self._subsections()[1]
+
+    def walk(self) -> Iterator[SectionNode]:
+        """Visit this node and all descendants, depth first.
+
+        Yields:
+            Nodes in document order.
+        """
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def _subsections(self) -> tuple[str, tuple[SectionNode, ...]]:
+        """Split `text` into body and child nodes once.
+
+        Returns:
+            Tuple of (body, children).
+        """
+        if self._split is None:
+            self._split = _split_subsections(self.text, self.number)
+        return self._split
+
+
+def section_tree(sections: Sequence[SectionInput]) -> tuple[SectionNode, ...]:
+    """Wrap flat sections as the top level of a lazily parsed section tree.
+
+    Args:
+        sections: Top-level sections, e.g. from `detect_sections`.
+
+    Returns:
+        One unnumbered node per section.
+    """
+    return tuple(SectionNode(label=section.label, text=section.text) for section in sections)
+
+
+def top_level_sections(
+    sections: Sequence[SectionInput], limit: int = _MAX_TOP_LEVEL
+) -> tuple[SectionInput, ...]:
+    """Bound the number of sections for display without dropping text.
+
+    Sections past `limit - 1` are merged, each under its own label line, into
+    one final "Remaining Sections" entry.
+
+    Args:
+        sections: Sections in document order.
+        limit: Maximum number of sections returned.
+
+    Returns:
+        At most `limit` sections covering all input text.
+
+    Raises:
+        ValueError: If `limit` is less than 2.
+    """
+    if limit < 2:
+        raise ValueError("limit must be >= 2")
+    if len(sections) <= limit:
+        return tuple(sections)
+    rest = sections[limit - 1 :]
+    merged = "\n\n".join(f"{section.label}\n{section.text}" for section in rest)
+    return (
+        *sections[: limit - 1],
+        SectionInput(label=f"Remaining Sections ({len(rest)})", text=merged),
+    )
+
+
+def _split_subsections(text: str, number: str) -> tuple[str, tuple[SectionNode, ...]]:
+    """Cut a section's text at its direct numbered subsection headings.
+
+    Args:
+        text: Full section text.
+        number: Section number, or empty when unknown.
+
+    Returns:
+        Tuple of (body before the first subsection, child nodes).
+    """
+    candidates = [
+        (match, match.group(1))
+        for match in _SUBHEADING_RE.finditer(text)
+        if not match.group(2).endswith((".", ",", ";", ":"))
+    ]
+    if number:
+        parent, depth = f"{number}.", number.count(".") + 2
+    elif candidates:
+        depth = min(num.count(".") + 1 for _, num in candidates)
+        first = next(num for _, num in candidates if num.count(".") + 1 == depth)
+        parent = first.rsplit(".", 1)[0] + "."
+    else:
+        return text, ()
+
+    # Keep headings at the child depth whose last component keeps increasing,
+    # which rejects stray body lines such as "3.5 Times faster than ...".
+    matches = []
+    last = 0
+    for match, num in candidates:
+        if num.startswith(parent) and num.count(".") + 1 == depth:
+            ordinal = int(num.rsplit(".", 1)[1])
+            if ordinal > last:
+                matches.append(match)
+                last = ordinal
+    if not matches:
+        return text, ()
+    children = []
+    for idx, match in enumerate(matches):
+        end = matches[idx + 1].start() if idx + 1 < len(matches) else len(text)
+        children.append(
+            SectionNode(
+                label=_normalize_heading(match.group(2)),
+                text=text[match.end() : end].strip(),
+                number=match.group(1),
+            )
+        )
+    return text[: matches[0].start()].strip(), tuple(children)
+
+
 def sections_to_display(sections: Sequence[SectionInput]) -> list[dict[str, str]]:
     """Convert sections to a display-friendly list of dicts.
 
@@ -2,12 +2,10 @@
 
 from __future__ import annotations
 
-import re
+from dataclasses import replace
 
-from paperta.contracts import IngestedPaper, RetrievalHit, RetrievalResult
-
-
-_TOKEN_RE = re.compile(r"[a-z0-9]+")
+from paperta.contracts import Chunk, IngestedPaper, RetrievalHit, RetrievalResult
+from paperta.text_utils import sentence_spans, tokenize
 
 
 def _tokenize(text: str) -> set[str]:
@@ -19,7 +17,54 @@ def _tokenize(text: str) -> set[str]:
     Returns:
         Set of unique tokens.
     """
-    return set(_TOKEN_RE.findall(text.lower()))
+    return set(tokenize(text))
+
+
+def _best_sentence(q_tokens: set[str], text: str, sentence_ends: bytes) -> tuple[int, int] | None:
+    """Pick the sentence of a chunk with the largest query-token overlap.
+
+    Args:
+        q_tokens: Query tokens.
+        text: Normalized chunk text.
+        sentence_ends: Packed sentence end offsets of the chunk.
+
+    Returns:
+        `(start, end)` offsets of the best sentence in `text`, earliest on ties.
+    """
+    best: tuple[int, int] | None = None
+    best_score = 0
+    for start, end in sentence_spans(text, sentence_ends):
+        score = len(q_tokens.intersection(_tokenize(text[start:end])))
+        if score > best_score:
+            best, best_score = (start, end), score
+    return best
+
+
+def _overlap_scores(q_tokens: set[str], ingested_paper: IngestedPaper) -> dict[int, int]:
+    """Count the query tokens each chunk contains.
+
+    Uses the ingest-time token index when present, so only the chunks that
+    share a token with the query are touched.
+
+    Args:
+        q_tokens: Query tokens.
+        ingested_paper: Ingested paper corpus.
+
+    Returns:
+        Overlap score by chunk position, for chunks with a non-zero score.
+    """
+    index = ingested_paper.token_index
+    scores: dict[int, int] = {}
+    if index is None:
+        for pos, chunk in enumerate(ingested_paper.chunks):
+            score = len(q_tokens.intersection(_tokenize(chunk.text)))
+            if score:
+                scores[pos] = score
+        return scores
+    for token in q_tokens:
+        for pos in index.positions(token):
+            scores[pos] = scores.get(pos, 0) + 1
+    return scores
 
 
 def retrieve(query: str, ingested_paper: IngestedPaper, top_k: int) -> RetrievalResult:
@@ -31,7 +76,8 @@ def retrieve(query: str, ingested_paper: IngestedPaper, top_k: int) -> Retrieval
         top_k: Maximum number of retrieval hits to return.
 
     Returns:
-        Retrieval result with ranked hits.
+        Retrieval result with ranked hits. Hits from sentence-indexed chunks
+        carry the span of their best-matching sentence.
 
     Raises:
         ValueError: If query is empty or top_k is not positive.
@@ -44,18 +90,26 @@ def retrieve(query: str, ingested_paper: IngestedPaper, top_k: int) -> Retrieval
     q_tokens = _tokenize(query)
     section_rank = {name: idx for idx, name in enumerate(ingested_paper.section_order)}
     scored: list[RetrievalHit] = []
-    for chunk in ingested_paper.chunks:
-        c_tokens = _tokenize(chunk.text)
-        score = len(q_tokens.intersection(c_tokens))
+    sentence_index: dict[str, bytes] = {}
+    chunks = ingested_paper.chunks
+    # Materialize only matching chunks, so span-backed stores never normalize
+    # chunks that do not score.
+    scores = _overlap_scores(q_tokens, ingested_paper)
+    for pos in sorted(scores):
+        score = scores[pos]
         if score > 0:
+            chunk = chunks[pos]
             scored.append(
                 RetrievalHit(
                     chunk_id=chunk.chunk_id,
                     section=chunk.section,
                     score=score,
                     text=chunk.text,
+                    span=chunk.span,
                 )
             )
+            if chunk.sentence_ends:
+                sentence_index[chunk.chunk_id] = chunk.sentence_ends
 
     scored.sort(
         key=lambda hit: (
@@ -64,4 +118,69 @@ def retrieve(query: str, ingested_paper: IngestedPaper, top_k: int) -> Retrieval
             hit.chunk_id,
         )
     )
-    return RetrievalResult(query=query, hits=tuple(scored[:top_k]))
+    hits = tuple(
+        replace(hit, sentence_span=_best_sentence(q_tokens, hit.text, sentence_index[hit.chunk_id]))
+        if hit.chunk_id in sentence_index
+        else hit
+        for hit in scored[:top_k]
+    )
+    return RetrievalResult(query=query, hits=hits)
+
+
+def expand_context(
+    ingested_paper: IngestedPaper,
+    hit: RetrievalHit,
+    radius: int = 1,
+    same_section: bool = True,
+) -> tuple[Chunk, ...]:
+    """Return a hit's chunk together with its neighbouring chunks.
+
+    Uses the ingestion-time `chunk_index`, so the cost is O(radius) per hit
+    regardless of paper length.
+
+    Args:
+        ingested_paper: Ingested paper corpus the hit was retrieved from.
+        hit: Retrieval hit to expand.
+        radius: Number of chunks to include on each side.
+        same_section: Stop expanding at section boundaries.
+
+    Returns:
+        Chunks in document order, including the hit's own chunk.
+
+    Raises:
+        ValueError: If radius is negative or the hit is not in the paper.
+    """
+    if radius < 0:
+        raise ValueError("radius must be >= 0")
+    position = ingested_paper.chunk_index.get(hit.chunk_id)
+    if position is None:
+        raise ValueError("retrieval hit references unknown chunk_id")
+
+    chunks = ingested_paper.chunks
+    center = chunks[position]
+    first = position
+    while first > 0 and position - first < radius:
+        if same_section and chunks[first - 1].section != center.section:
+            break
+        first -= 1
+    last = position
+    while last + 1 < len(chunks) and last - position < radius:
+        if same_section and chunks[last + 1].section != center.section:
+            break
+        last += 1
+    return tuple(chunks[idx] for idx in range(first, last + 1))
+
+
+def hit_excerpt(hit: RetrievalHit) -> str:
+    """Return the best-matching sentence of a hit, or its full text.
+
+    Args:
+        hit: Retrieval hit.
+
+    Returns:
+        Sentence-level excerpt when the hit carries a sentence span.
+    """
+    if hit.sentence_span is None:
+        return hit.text
+    start, end = hit.sentence_span
+    return hit.text[start:end]
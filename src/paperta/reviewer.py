@@ -6,7 +6,7 @@ from typing import Sequence
 
 from paperta.contracts import IngestedPaper, RetrievalResult, SectionInput
 from paperta.ingestion import ingest_document
-from paperta.retrieval import retrieve
+from paperta.retrieval import hit_excerpt, retrieve
 from paperta.reviewer_contracts import (
     ClaimEvidenceMatrix,
     ClaimEvidenceRow,
@@ -179,7 +179,7 @@ def generate_claim_evidence_matrix(retrieval_result: RetrievalResult) -> ClaimEv
             raise ValueError("invalid support grade")
         rows.append(
             ClaimEvidenceRow(
-                claim=f"{hit.section} claim: {_snippet(hit.text, max_len=64)}",
+                claim=f"{hit.section} claim: {_snippet(hit_excerpt(hit), max_len=64)}",
                 evidence_chunk_ids=(hit.chunk_id,),
                 support_grade=grade,
                 notes=f"Derived from {hit.section}.",
@@ -217,7 +217,7 @@ def run_phase3_reviewer_pipeline(
     if top_k <= 0:
         raise ValueError("top_k must be > 0")
 
-    ingested = ingest_document(paper_id=paper_id, sections=sections)
+    ingested = ingest_document(paper_id=paper_id, sections=sections, sentence_index=True)
     retrieval_result = retrieve(query=review_query, ingested_paper=ingested, top_k=top_k)
     _validate_retrieval_hits(ingested, retrieval_result)
 
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import re
 from typing import Sequence
 
 from paperta.contracts import IngestedPaper, RetrievalResult, SectionInput
 from paperta.ingestion import ingest_document
-from paperta.retrieval import retrieve
+from paperta.retrieval import hit_excerpt, retrieve
+from paperta.text_utils import tokenize
 from paperta.teach_contracts import (
     ConceptEdge,
     ConceptMap,
@@ -25,7 +25,6 @@ from paperta.teach_contracts import (
 
 
 NOT_STATED = "Not stated in the paper."
-_TOKEN_RE = re.compile(r"[a-z0-9]+")
 _STOPWORDS = {
     "a",
     "an",
@@ -78,7 +77,7 @@ def _tokenize(text: str) -> set[str]:
     Returns:
         Set of unique tokens.
     """
-    return set(_TOKEN_RE.findall(text.lower()))
+    return set(tokenize(text))
 
 
 def _validate_retrieval_hits(ingested_paper: IngestedPaper, retrieval_result: RetrievalResult) -> None:
@@ -244,7 +243,7 @@ def answer_socratic_question(
         hit_tokens = {token for token in _tokenize(hit.text) if token not in _STOPWORDS}
         if q_tokens.intersection(hit_tokens):
             return SocraticAnswer(
-                text=f"{hit.section}: {_snippet(hit.text)}",
+                text=f"{hit.section}: {_snippet(hit_excerpt(hit))}",
                 chunk_ids=(hit.chunk_id,),
             )
     return SocraticAnswer(text=NOT_STATED, chunk_ids=tuple())
@@ -279,7 +278,7 @@ def run_phase2_teach_pipeline(
     if top_k <= 0:
         raise ValueError("top_k must be > 0")
 
-    ingested = ingest_document(paper_id=paper_id, sections=sections)
+    ingested = ingest_document(paper_id=paper_id, sections=sections, sentence_index=True)
     retrieval_result = retrieve(query=objective, ingested_paper=ingested, top_k=top_k)
     _validate_retrieval_hits(ingested, retrieval_result)
 
@@ -0,0 +1,135 @@
+"""Shared deterministic text normalization helpers."""
+
+from __future__ import annotations
+
+import re
+from array import array
+from dataclasses import dataclass
+
+
+_TOKEN_SPACE_RE = re.compile(r"\s+")
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+# Line break after a hyphen that ends a word. Folding drops the break but keeps
+# the hyphen: "self-\nattention" must not become "selfattention".
+_HYPHEN_BREAK_RE = re.compile(r"(?<=[A-Za-z]-)[ \t]*\r?\n[ \t]*(?=[a-z])")
+_LIGATURE_RE = re.compile("[\ufb00-\ufb06]")
+_LIGATURES = {
+    "\ufb00": "ff",
+    "\ufb01": "fi",
+    "\ufb02": "fl",
+    "\ufb03": "ffi",
+    "\ufb04": "ffl",
+    "\ufb05": "st",
+    "\ufb06": "st",
+}
+_SENTENCE_BREAK_RE = re.compile(r"[.!?][\"')\]]*(?=\s)")
+_ABBREVIATIONS = frozenset(
+    {
+        "al.", "approx.", "cf.", "e.g.", "eq.", "eqs.", "etc.",
+        "fig.", "figs.", "i.e.", "no.", "sec.", "vs.",
+    }
+)
+
+
+@dataclass(frozen=True)
+class ScannedText:
+    """Normalized text with its lowercase tokens."""
+
+    text: str
+    tokens: tuple[str, ...]
+
+
+def normalize_text(text: str, fold_pdf_artifacts: bool = False) -> str:
+    """Normalize extracted text deterministically.
+
+    Strips the text and collapses whitespace runs. Folding is opt-in because
+    it changes chunk text, and so chunk IDs.
+
+    Args:
+        text: Input text segment.
+        fold_pdf_artifacts: Also fold PDF ligatures (e.g. U+FB01 to `fi`) and
+            drop line breaks after a word-final hyphen, keeping the hyphen.
+
+    Returns:
+        Normalized single-space text.
+    """
+    if fold_pdf_artifacts:
+        text = _LIGATURE_RE.sub(lambda match: _LIGATURES[match.group()], text)
+        text = _HYPHEN_BREAK_RE.sub("", text)
+    return _TOKEN_SPACE_RE.sub(" ", text.strip())
+
+
+def tokenize(text: str) -> list[str]:
+    """Tokenize text into lowercase alphanumeric terms.
+
+    Args:
+        text: Input text.
+
+    Returns:
+        Tokens in document order, duplicates included.
+    """
+    return _TOKEN_RE.findall(text.lower())
+
+
+def scan_text(text: str, fold_pdf_artifacts: bool = False) -> ScannedText:
+    """Normalize and tokenize a text segment in one call.
+
+    Ingestion scans every chunk once and caches the result, so retrieval and
+    downstream phases never re-normalize or re-tokenize chunk text.
+
+    Args:
+        text: Raw text segment.
+        fold_pdf_artifacts: Fold PDF artifacts as `normalize_text` does.
+
+    Returns:
+        Scan result for the segment.
+    """
+    normalized = normalize_text(text, fold_pdf_artifacts)
+    return ScannedText(text=normalized, tokens=tuple(tokenize(normalized)))
+
+
+def split_sentence_ends(text: str) -> bytes:
+    """Find sentence boundaries in normalized text.
+
+    A sentence ends at `.`, `!` or `?` (plus closing quotes or brackets)
+    followed by a space, unless the final word is a common abbreviation or a
+    single-letter initial.
+
+    Args:
+        text: Whitespace-normalized text.
+
+    Returns:
+        Packed unsigned 32-bit end offsets, one per sentence, the last being `len(text)`.
+    """
+    ends = array("I")
+    for match in _SENTENCE_BREAK_RE.finditer(text):
+        word = text[text.rfind(" ", 0, match.start()) + 1 : match.start() + 1].lower()
+        if word in _ABBREVIATIONS or (len(word) == 2 and word[0].isalpha()):
+            continue
+        ends.append(match.end())
+    if text:
+        ends.append(len(text))
+    return ends.tobytes()
+
+
+def sentence_spans(text: str, sentence_ends: bytes) -> list[tuple[int, int]]:
+    """Expand packed sentence end offsets into `(start, end)` spans.
+
+    Args:
+        text: Text the offsets were computed for.
+        sentence_ends: Packed offsets from `split_sentence_ends`.
+
+    Returns:
+        Ordered sentence spans with surrounding whitespace excluded.
+    """
+    ends = array("I")
+    ends.frombytes(sentence_ends)
+    spans: list[tuple[int, int]] = []
+    start = 0
+    for end in ends:
+        while start < end and text[start].isspace():
+            start += 1
+        if start < end:
+            spans.append((start, end))
+        start = end
+    return spans
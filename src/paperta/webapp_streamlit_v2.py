@@ -6,28 +6,43 @@ human-readable citations, and comprehensive teach mode walkthrough.
 
 from __future__ import annotations
 
+import asyncio
+import atexit
 import datetime
+import functools
 import json
 import re
 import urllib.parse
 import urllib.request
+from dataclasses import replace
 from typing import Any
 
 import streamlit as st
 
 from paperta.contracts import SectionInput
+from paperta.extraction_cache import CachedExtraction, ExtractionCache
+from paperta.extraction_worker import ExtractionWorker
+from paperta.llm_cache import LLMResponseCache
 from paperta.llm_providers import (
     PROVIDERS,
+    aenhance_with_llm,
+    async_client_scope,
     enhance_with_llm,
+    gather_bounded,
     is_provider_configured,
     teach_enhance_with_llm,
     _to_primitive,
 )
 from paperta.multi_paper_contracts import PaperInput
 from paperta.pdf_utils import (
+    ExtractionOptions,
+    SectionDetector,
     detect_sections,
     extract_text_from_upload,
+    remove_running_lines,
+    section_tree,
     sections_to_display,
+    top_level_sections,
 )
 from paperta.pipeline import (
     run_phase1_pipeline,
@@ -40,6 +55,10 @@ from paperta.pipeline import (
 # Constants
 # ---------------------------------------------------------------------------
 
+# Concurrent LLM requests per multi-paper run (per-paper summaries plus synthesis).
+_LLM_CONCURRENCY = 4
+
+
 # Pedagogical category ordering for teach mode
 _PEDAGOGY_ORDER: list[tuple[str, str, str]] = [
     (
@@ -100,6 +119,44 @@ _PEDAGOGY_ORDER: list[tuple[str, str, str]] = [
 ]
 
 
+# ---------------------------------------------------------------------------
+# Shared resources (built once per server process, not once per rerun)
+# ---------------------------------------------------------------------------
+
+
+@st.cache_resource
+def _pdf_worker() -> ExtractionWorker:
+    """Sandboxed PDF extraction worker shared by all sessions and reruns.
+
+    Returns:
+        Worker configured from `PAPERTA_PDF_*` variables; its child process
+        is stopped when the server exits.
+    """
+    worker = ExtractionWorker.from_env()
+    atexit.register(worker.close)
+    return worker
+
+
+@st.cache_resource
+def _extraction_cache() -> ExtractionCache | None:
+    """On-disk extraction cache shared by all sessions and reruns.
+
+    Returns:
+        Cache, or None unless PAPERTA_EXTRACTION_CACHE_DIR is set.
+    """
+    return ExtractionCache.from_env()
+
+
+@st.cache_resource
+def _llm_cache() -> LLMResponseCache | None:
+    """LLM response cache shared by all sessions and reruns.
+
+    Returns:
+        Cache, or None unless PAPERTA_LLM_CACHE_PATH is set.
+    """
+    return LLMResponseCache.from_env()
+
+
 # ---------------------------------------------------------------------------
 # Custom CSS (minimal -- let Streamlit light theme handle the rest)
 # ---------------------------------------------------------------------------
@@ -1118,12 +1175,69 @@ def _try_llm_enhance(
             deterministic_result=result,
             provider=provider,
             model=model,
+            cache=_llm_cache(),
         )
     except Exception as exc:  # noqa: BLE001
         st.warning(f"LLM enhancement failed: {exc}")
         return None
 
 
+def _try_multi_llm_enhance(
+    query: str, result: Any, provider: str, model: str
+) -> tuple[str | None, dict[str, str]]:
+    """Run the cross-paper synthesis and per-paper LLM summaries concurrently.
+
+    Each call fails on its own: a failed paper only loses its summary, and the
+    other results are still returned.
+
+    Args:
+        query: Cross-paper query.
+        result: Multi-paper pipeline result.
+        provider: LLM provider name.
+        model: Model name.
+
+    Returns:
+        Tuple of (synthesis Markdown or None, per-paper summaries by paper id).
+    """
+    if provider == "local":
+        return None, {}
+    if not is_provider_configured(provider):
+        return None, {}
+    papers = result.per_paper_retrieval
+    cache = _llm_cache()
+    calls = [
+        functools.partial(
+            aenhance_with_llm, "multi_paper", query, result, provider, model, cache
+        ),
+        *(
+            functools.partial(
+                aenhance_with_llm, "summary", query, paper, provider, model, cache
+            )
+            for paper in papers
+        ),
+    ]
+
+    async def _run() -> list[Any]:
+        async with async_client_scope():
+            return await gather_bounded(calls, limit=_LLM_CONCURRENCY, return_exceptions=True)
+
+    try:
+        synthesis, *summaries = asyncio.run(_run())
+    except Exception as exc:  # noqa: BLE001
+        st.warning(f"LLM enhancement failed: {exc}")
+        return None, {}
+    if isinstance(synthesis, Exception):
+        st.warning(f"LLM synthesis failed: {synthesis}")
+        synthesis = None
+    per_paper = {}
+    for paper, text in zip(papers, summaries):
+        if isinstance(text, Exception):
+            st.warning(f"LLM summary of {paper.paper_id} failed: {text}")
+        elif text:
+            per_paper[paper.paper_id] = text
+    return synthesis or None, per_paper
+
+
 def _try_teach_llm_enhance(
     sections: tuple[SectionInput, ...],
     query: str,
@@ -1151,6 +1265,7 @@ def _try_teach_llm_enhance(
             query=query,
             provider=provider,
             model=model,
+            cache=_llm_cache(),
         )
     except Exception as exc:  # noqa: BLE001
         st.warning(f"LLM teach enhancement failed: {exc}")
@@ -1233,6 +1348,110 @@ def _render_sidebar() -> tuple[str, str, int, bool]:
 # ---------------------------------------------------------------------------
 
 
+def _stream_pdf_sections(
+    content: bytes,
+    options: ExtractionOptions | None = None,
+    page_texts: dict[str, str] | None = None,
+) -> tuple[str, tuple[SectionInput, ...]]:
+    """Extract a PDF page by page, showing sections as they are detected.
+
+    Running headers and footers are only known once every page is in, so the
+    preview shows raw pages and sections are re-detected on the cleaned text.
+
+    Args:
+        content: Raw PDF bytes.
+        options: PDF page selection; all pages by default.
+        page_texts: Digest-to-text page cache; newly extracted pages are added.
+
+    Returns:
+        Tuple of (full extracted text, detected sections).
+
+    Raises:
+        ValueError: If PDF parsing fails.
+    """
+    options = options or ExtractionOptions()
+    placeholder = st.empty()
+    detector = SectionDetector()
+    pages: list[str] = []
+    sections: list[SectionInput] = []
+    raw_options = replace(options, strip_running_lines=False)
+    for page in _pdf_worker().iter_pages(content, raw_options, page_texts):
+        sections.extend(detector.feed(f"\n\n{page}" if pages else page))
+        pages.append(page)
+        with placeholder.container():
+            st.caption(f"Extracting... page {len(pages)}, {len(sections)} sections so far")
+            if sections:
+                st.markdown(
+                    _sections_table_html(top_level_sections(sections)), unsafe_allow_html=True
+                )
+    sections.extend(detector.finish())
+    placeholder.empty()
+    if options.strip_running_lines:
+        cleaned = remove_running_lines(pages)
+        if cleaned != pages:
+            text = "\n\n".join(cleaned)
+            return text, detect_sections(text)
+    return "\n\n".join(pages), tuple(sections)
+
+
+def _load_upload(
+    name: str,
+    content: bytes,
+    stream: bool = False,
+    skip_back_matter: bool = False,
+) -> tuple[str, tuple[SectionInput, ...]]:
+    """Extract text and sections from an upload, via the extraction cache.
+
+    Args:
+        name: Uploaded file name.
+        content: Uploaded file bytes.
+        stream: Stream PDF pages and show sections as they are detected.
+        skip_back_matter: Stop PDF extraction at the References heading.
+
+    Returns:
+        Tuple of (extracted text, detected sections).
+
+    Raises:
+        ValueError: If the file cannot be parsed or a PDF has no text layer.
+    """
+    options = ExtractionOptions(stop_at_references=skip_back_matter, strip_running_lines=True)
+    key = ExtractionCache.key(name, content, variant="body" if skip_back_matter else "")
+    worker, cache = _pdf_worker(), _extraction_cache()
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached.text, cached.sections
+    if not name.lower().endswith(".pdf"):
+        text = extract_text_from_upload(name, content)
+        sections = detect_sections(text)
+        if cache is not None:
+            cache.put(key, CachedExtraction(text=text, sections=sections))
+        return text, sections
+
+    # One parse in the worker scans, digests and (unless streaming) extracts.
+    # A revision of an earlier upload reuses the text of its unchanged pages.
+    # Outline-backed sections need no heuristic scan, so there is nothing to stream.
+    loaded = worker.load_pdf(
+        content,
+        options,
+        page_lookup=cache.get_pages if cache is not None else None,
+        outlined_only=stream,
+    )
+    if loaded.text_layer.kind in ("scanned", "empty"):
+        raise ValueError("This PDF has no text layer (scanned?). Run OCR on it and upload again.")
+    new_pages = loaded.new_pages
+    if loaded.text is None:
+        page_texts = dict(loaded.cached_pages) if cache is not None else None
+        text, sections = _stream_pdf_sections(content, options, page_texts)
+        new_pages = {d: t for d, t in (page_texts or {}).items() if d not in loaded.cached_pages}
+    else:
+        text, sections = loaded.text, loaded.sections
+    if cache is not None:
+        cache.put_pages(new_pages)
+        cache.put(key, CachedExtraction(text=text, sections=sections))
+    return text, sections
+
+
 def _render_single_tab(provider: str, model: str, top_k: int) -> None:
     """Render the single-paper analysis tab.
 
@@ -1257,13 +1476,22 @@ def _render_single_tab(provider: str, model: str, top_k: int) -> None:
         placeholder="Paste paper text here if not uploading a file...",
     )
 
+    skip_back_matter = st.checkbox(
+        "Stop at References (faster on long papers)",
+        value=False,
+        key="single_skip_back_matter",
+        help="Skip the bibliography and appendices when extracting PDFs.",
+    )
+
     # Extract text
     parse_error = None
     source_text = text_fallback
+    sections: tuple[SectionInput, ...] | None = None
     if upload is not None:
         try:
-            source_text = extract_text_from_upload(
-                upload.name, upload.getvalue()
+            # PDFs stream so sections show up before extraction finishes.
+            source_text, sections = _load_upload(
+                upload.name, upload.getvalue(), stream=True, skip_back_matter=skip_back_matter
             )
             st.markdown(
                 f'<span class="status-ok">Loaded: {upload.name} '
@@ -1273,18 +1501,22 @@ def _render_single_tab(provider: str, model: str, top_k: int) -> None:
         except Exception as exc:  # noqa: BLE001
             parse_error = str(exc)
 
-    sections = detect_sections(source_text)
+    if sections is None:
+        sections = detect_sections(source_text)
 
     if parse_error:
         st.error(parse_error)
 
-    # Section preview
+    # Section preview (bounded top level; every section is still indexed)
     with st.expander(
         f"Detected sections ({len(sections)})", expanded=False
     ):
         st.markdown(
-            _sections_table_html(sections), unsafe_allow_html=True
+            _sections_table_html(top_level_sections(sections)), unsafe_allow_html=True
         )
+        subsections = sum(len(node.children) for node in section_tree(sections))
+        if subsections:
+            st.caption(f"Includes {subsections} numbered subsections (e.g. 2.1).")
 
     # -- Analysis controls (full width) --
     st.markdown("---")
@@ -1419,9 +1651,13 @@ def _render_single_tab(provider: str, model: str, top_k: int) -> None:
                     label = trace_labels.get(
                         hit["chunk_id"], hit["chunk_id"]
                     )
+                    span = hit.get("span")
+                    where = (
+                        f", chars {span[0]:,}-{span[1]:,}" if span else ""
+                    )
                     st.markdown(
                         f"**{label}** (score: {hit['score']}, "
-                        f"section: {hit['section']})"
+                        f"section: {hit['section']}{where})"
                     )
                     st.caption(hit["text"][:300])
 
@@ -1469,8 +1705,7 @@ def _render_multi_tab(provider: str, model: str, top_k: int) -> None:
     if uploads:
         for idx, f in enumerate(uploads):
             try:
-                text = extract_text_from_upload(f.name, f.getvalue())
-                secs = detect_sections(text)
+                text, secs = _load_upload(f.name, f.getvalue())
                 pid = f.name.rsplit(".", 1)[0].replace(" ", "_")
                 paper_inputs.append(PaperInput(paper_id=pid, sections=secs))
                 st.markdown(
@@ -1541,11 +1776,11 @@ def _render_multi_tab(provider: str, model: str, top_k: int) -> None:
         if provider != "local":
             st.markdown("---")
             with st.spinner(f"Enhancing with {provider}/{model}..."):
-                llm_text = _try_llm_enhance(
-                    "multi_paper", query_multi, result, provider, model
+                llm_text, paper_summaries = _try_multi_llm_enhance(
+                    query_multi, result, provider, model
                 )
+            multi_labels = _build_multi_citation_labels(payload)
             if llm_text:
-                multi_labels = _build_multi_citation_labels(payload)
                 llm_text = _replace_hash_citations(llm_text, multi_labels)
                 st.subheader("LLM-Enhanced Analysis")
                 st.caption(f"{provider} / {model}")
@@ -1553,6 +1788,14 @@ def _render_multi_tab(provider: str, model: str, top_k: int) -> None:
                 md_export += (
                     f"\n\n---\n\n## LLM-Enhanced Analysis\n\n{llm_text}\n"
                 )
+            if paper_summaries:
+                st.subheader("Per-Paper LLM Summaries")
+                md_export += "\n\n## Per-Paper LLM Summaries\n"
+                for paper_id, summary_text in paper_summaries.items():
+                    summary_text = _replace_hash_citations(summary_text, multi_labels)
+                    with st.expander(paper_id):
+                        st.markdown(summary_text)
+                    md_export += f"\n### {paper_id}\n\n{summary_text}\n"
 
         # Per-paper retrieval traces with readable labels
         with st.expander("Per-Paper Retrieval Traces"):
@@ -3,3 +3,67 @@ from pathlib import Path
 
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+
+def build_text_pdf(pages, outline=()):
+    """Build a minimal text-layer PDF with one list of lines per page.
+
+    A `None` page draws only an image, like a scanned page without OCR.
+    `outline` entries are `(title, page_index)` or `(title, page_index, children)`.
+    """
+    from io import BytesIO
+
+    from pypdf import PdfWriter
+    from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject, NumberObject
+
+    font = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/Font"),
+            NameObject("/Subtype"): NameObject("/Type1"),
+            NameObject("/BaseFont"): NameObject("/Helvetica"),
+        }
+    )
+    writer = PdfWriter()
+    for lines in pages:
+        page = writer.add_blank_page(612, 792)
+        if lines is None:
+            image = DecodedStreamObject()
+            image.set_data(b"\x80")
+            image.update(
+                {
+                    NameObject("/Type"): NameObject("/XObject"),
+                    NameObject("/Subtype"): NameObject("/Image"),
+                    NameObject("/Width"): NumberObject(1),
+                    NameObject("/Height"): NumberObject(1),
+                    NameObject("/ColorSpace"): NameObject("/DeviceGray"),
+                    NameObject("/BitsPerComponent"): NumberObject(8),
+                }
+            )
+            stream = DecodedStreamObject()
+            stream.set_data(b"q 612 0 0 792 0 0 cm /Im0 Do Q")
+            xobjects = DictionaryObject({NameObject("/Im0"): writer._add_object(image)})
+            page[NameObject("/Resources")] = DictionaryObject({NameObject("/XObject"): xobjects})
+            page.replace_contents(stream)
+            continue
+        ops = ["BT /F1 11 Tf 14 TL 72 720 Td"]
+        for line in lines:
+            escaped = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+            ops.append(f"({escaped}) Tj T*")
+        ops.append("ET")
+        stream = DecodedStreamObject()
+        stream.set_data("\n".join(ops).encode("latin-1"))
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+        page.replace_contents(stream)
+
+    def add_outline(entries, parent=None):
+        for title, page_index, *children in entries:
+            item = writer.add_outline_item(title, page_index, parent=parent)
+            if children:
+                add_outline(children[0], item)
+
+    add_outline(outline)
+    buffer = BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
@@ -0,0 +1,30 @@
+import pytest
+
+from paperta.extraction_cache import CachedExtraction, ExtractionCache
+
+
+def test_extraction_cache_rejects_bad_budget_and_ignores_corrupt_entries(tmp_path, monkeypatch):
+    with pytest.raises(ValueError):
+        ExtractionCache(tmp_path, max_bytes=0)
+    monkeypatch.setenv("PAPERTA_EXTRACTION_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("PAPERTA_EXTRACTION_CACHE_MAX_BYTES", "lots")
+    with pytest.raises(ValueError):
+        ExtractionCache.from_env()
+
+    cache = ExtractionCache(tmp_path)
+    key = ExtractionCache.key("p.pdf", b"x")
+    path = cache._path(key)
+    path.parent.mkdir(parents=True)
+    path.write_text("{not json", encoding="utf-8")
+    assert cache.get(key) is None
+
+
+def test_extraction_cache_recomputes_a_corrupt_running_total(tmp_path):
+    cache = ExtractionCache(tmp_path, max_bytes=250)
+    cache.put(ExtractionCache.key("p.pdf", b"a"), CachedExtraction(text="a" * 40, sections=()))
+    usage = cache._root / ".usage"
+    usage.write_text("garbage", encoding="ascii")
+    key = ExtractionCache.key("p.pdf", b"b")
+    cache.put(key, CachedExtraction(text="b" * 40, sections=()))
+    entries = sum(path.stat().st_size for path in cache._root.glob("*/*.json"))
+    assert usage.read_text(encoding="ascii") == str(entries)
@@ -0,0 +1,51 @@
+import threading
+
+import pytest
+
+from conftest import build_text_pdf
+from paperta.extraction_worker import ExtractionWorker
+
+
+def test_worker_rejects_bad_limits(monkeypatch):
+    with pytest.raises(ValueError):
+        ExtractionWorker(timeout_s=0)
+    with pytest.raises(ValueError):
+        ExtractionWorker(memory_limit_bytes=0)
+    monkeypatch.setenv("PAPERTA_PDF_TIMEOUT_SECONDS", "soon")
+    with pytest.raises(ValueError):
+        ExtractionWorker.from_env()
+
+
+def test_worker_reports_parse_errors_timeouts_and_cancellation_as_value_errors():
+    content = build_text_pdf([[f"Line {j} on page {i}." for j in range(30)] for i in range(120)])
+    worker = ExtractionWorker(timeout_s=30)
+    try:
+        with pytest.raises(ValueError, match="Unable to parse PDF"):
+            worker.extract_text(b"not a pdf")
+        pid = worker.pid
+
+        timer = threading.Timer(0.05, worker.cancel)
+        timer.start()
+        with pytest.raises(ValueError, match="cancelled"):
+            worker.extract_text(content)
+        timer.join()
+        assert worker.pid is None
+
+        worker._timeout_s = 0.001
+        with pytest.raises(ValueError, match="timed out"):
+            worker.extract_text(content)
+
+        worker._timeout_s = 30
+        assert "page 119" in worker.extract_text(content)
+        assert worker.pid not in (None, pid)
+    finally:
+        worker.close()
+
+
+def test_worker_memory_limit_fails_the_call_not_the_caller():
+    worker = ExtractionWorker(timeout_s=30, memory_limit_bytes=8 * 1024 * 1024)
+    try:
+        with pytest.raises(ValueError):
+            worker.extract_text(build_text_pdf([["Tiny page."]]))
+    finally:
+        worker.close()
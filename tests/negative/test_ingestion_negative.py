@@ -1,7 +1,7 @@
 import pytest
 
 from paperta.contracts import SectionInput
-from paperta.ingestion import ingest_document
+from paperta.ingestion import SlidingWindowChunker, ingest_document
 
 
 def test_ingestion_rejects_duplicate_sections():
@@ -13,3 +13,17 @@ def test_ingestion_rejects_duplicate_sections():
                 SectionInput(label="Intro", text="b"),
             ),
         )
+
+
+def test_sliding_window_chunker_rejects_invalid_overlap():
+    with pytest.raises(ValueError):
+        SlidingWindowChunker(max_tokens=8, overlap_tokens=8)
+    with pytest.raises(ValueError):
+        SlidingWindowChunker(max_tokens=0)
+
+
+def test_ingestion_rejects_unknown_id_scheme():
+    with pytest.raises(ValueError):
+        ingest_document(
+            paper_id="p1", sections=(SectionInput(label="Intro", text="a"),), id_scheme="md5"
+        )
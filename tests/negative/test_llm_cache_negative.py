@@ -0,0 +1,21 @@
+import pytest
+
+from paperta.llm_cache import LLMResponseCache
+
+
+def test_llm_cache_rejects_bad_limits_and_skips_oversized_completions(tmp_path, monkeypatch):
+    with pytest.raises(ValueError):
+        LLMResponseCache(tmp_path / "llm.sqlite3", ttl_s=0)
+    with pytest.raises(ValueError):
+        LLMResponseCache(tmp_path / "llm.sqlite3", max_bytes=-1)
+    monkeypatch.delenv("PAPERTA_LLM_CACHE_PATH", raising=False)
+    assert LLMResponseCache.from_env() is None
+    monkeypatch.setenv("PAPERTA_LLM_CACHE_PATH", str(tmp_path / "env.sqlite3"))
+    monkeypatch.setenv("PAPERTA_LLM_CACHE_TTL_SECONDS", "forever")
+    with pytest.raises(ValueError):
+        LLMResponseCache.from_env()
+
+    cache = LLMResponseCache(tmp_path / "llm.sqlite3", max_bytes=8)
+    key = LLMResponseCache.key("openai", "gpt-4o", "system", "user", {})
+    cache.put(key, "far too long to fit")
+    assert cache.get(key) is None
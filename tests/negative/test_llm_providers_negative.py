@@ -0,0 +1,29 @@
+import asyncio
+
+import pytest
+
+from paperta.llm_providers import ClientPoolLimits, gather_bounded
+
+
+def test_client_pool_limits_reject_out_of_range_values(monkeypatch):
+    with pytest.raises(ValueError):
+        ClientPoolLimits(max_connections=0)
+    with pytest.raises(ValueError):
+        ClientPoolLimits(max_connections=4, max_keepalive_connections=5)
+    with pytest.raises(ValueError):
+        ClientPoolLimits(keepalive_expiry_s=0)
+    monkeypatch.setenv("PAPERTA_LLM_MAX_CONNECTIONS", "many")
+    with pytest.raises(ValueError):
+        ClientPoolLimits.from_env()
+    monkeypatch.setenv("PAPERTA_LLM_MAX_CONNECTIONS", "8")
+    monkeypatch.setenv("PAPERTA_LLM_MAX_KEEPALIVE_CONNECTIONS", "4")
+    monkeypatch.setenv("PAPERTA_LLM_KEEPALIVE_EXPIRY_SECONDS", "2.5")
+    assert ClientPoolLimits.from_env() == ClientPoolLimits(8, 4, 2.5)
+
+
+def test_gather_bounded_rejects_non_positive_limit():
+    async def noop():
+        return None
+
+    with pytest.raises(ValueError):
+        asyncio.run(gather_bounded([noop], limit=0))
@@ -0,0 +1,39 @@
+import pytest
+
+from paperta.pdf_utils import (
+    ExtractionOptions,
+    extract_text_from_path,
+    extract_text_from_pdf,
+    scan_text_layer,
+    top_level_sections,
+)
+
+
+def test_pdf_extraction_rejects_invalid_workers_and_bytes():
+    with pytest.raises(ValueError):
+        extract_text_from_pdf(b"%PDF-1.4", workers=0)
+    with pytest.raises(ValueError):
+        extract_text_from_pdf(b"not a pdf", workers=4)
+
+
+def test_path_extraction_rejects_missing_file(tmp_path):
+    with pytest.raises(ValueError):
+        extract_text_from_path(tmp_path / "missing.pdf")
+
+
+@pytest.mark.parametrize("page_range", [(-1, 3), (3, 3), (5, 2)])
+def test_extraction_options_reject_invalid_page_range(page_range):
+    with pytest.raises(ValueError):
+        ExtractionOptions(page_range=page_range)
+
+
+def test_scan_text_layer_rejects_bad_sample_size_and_bytes():
+    with pytest.raises(ValueError):
+        scan_text_layer(b"%PDF-1.4", sample_size=0)
+    with pytest.raises(ValueError):
+        scan_text_layer(b"not a pdf")
+
+
+def test_top_level_sections_rejects_too_small_limit():
+    with pytest.raises(ValueError):
+        top_level_sections((), limit=1)
@@ -1,8 +1,8 @@
 import pytest
 
-from paperta.contracts import SectionInput
+from paperta.contracts import RetrievalHit, SectionInput
 from paperta.ingestion import ingest_document
-from paperta.retrieval import retrieve
+from paperta.retrieval import expand_context, retrieve
 
 
 def test_retrieval_rejects_non_positive_top_k():
@@ -12,3 +12,10 @@ def test_retrieval_rejects_non_positive_top_k():
     )
     with pytest.raises(ValueError):
         retrieve(query="token", ingested_paper=paper, top_k=0)
+
+
+def test_expand_context_rejects_unknown_hit():
+    paper = ingest_document(paper_id="neg-ctx", sections=(SectionInput(label="A", text="alpha"),))
+    hit = RetrievalHit(chunk_id="deadbeefdeadbeef", section="A", score=1, text="alpha")
+    with pytest.raises(ValueError):
+        expand_context(paper, hit, radius=1)
@@ -0,0 +1,99 @@
+import gc
+import tracemalloc
+
+import pytest
+
+from paperta import chunk_store
+from paperta.chunk_store import ChunkStore, TokenIndex
+from paperta.contracts import SectionInput
+from paperta.ingestion import ingest_document
+from paperta.retrieval import retrieve
+
+
+_SECTIONS = (
+    SectionInput(label="Intro", text="Transformers use attention.\n\nÜber-efficient décoding."),
+    SectionInput(label="Method", text="Cross-attention aligns context."),
+)
+
+
+def _retained_bytes(sections, columnar):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        paper = ingest_document(paper_id="store-size", sections=sections, columnar=columnar)
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0], paper
+    finally:
+        tracemalloc.stop()
+
+
+def test_columnar_ingestion_matches_tuple_chunks():
+    plain = ingest_document(paper_id="store-1", sections=_SECTIONS)
+    compact = ingest_document(paper_id="store-1", sections=_SECTIONS, columnar=True)
+    assert isinstance(compact.chunks, ChunkStore)
+    assert tuple(compact.chunks) == plain.chunks
+    assert compact.chunks[-1] == plain.chunks[-1]
+    assert compact.chunks[1:] == plain.chunks[1:]
+    assert compact.chunks.labels == ("Intro", "Method")
+
+
+def test_columnar_store_supports_retrieval():
+    plain = ingest_document(paper_id="store-2", sections=_SECTIONS)
+    compact = ingest_document(paper_id="store-2", sections=_SECTIONS, columnar=True)
+    assert retrieve("attention", compact, top_k=3) == retrieve("attention", plain, top_k=3)
+
+
+def test_columnar_retrieval_only_normalizes_matching_chunks(monkeypatch):
+    compact = ingest_document(paper_id="store-4", sections=_SECTIONS, columnar=True)
+    assert compact.token_index.tokens(0) == frozenset({"transformers", "use", "attention"})
+    normalized = []
+    original = chunk_store.normalize_text
+
+    def counting_normalize(text, fold_pdf_artifacts=False):
+        normalized.append(text)
+        return original(text, fold_pdf_artifacts)
+
+    monkeypatch.setattr(chunk_store, "normalize_text", counting_normalize)
+    result = retrieve("transformers", compact, top_k=3)
+    assert [hit.text for hit in result.hits] == ["Transformers use attention."]
+    assert normalized == ["Transformers use attention."]
+
+
+def test_chunk_store_rejects_malformed_ids():
+    with pytest.raises(ValueError):
+        ChunkStore.build("p", ("Intro",), [("not-hex", 0, "text")])
+    with pytest.raises(ValueError):
+        ChunkStore.build("p", ("Intro",), [("0123456789abcdef", 3, "text")])
+
+
+def test_chunk_spans_point_into_original_section_text():
+    sections = (SectionInput(label="Intro", text="  First  para\r\n with break.\r\n\r\n\tSecond para.  "),)
+    plain = ingest_document(paper_id="store-3", sections=sections)
+    compact = ingest_document(paper_id="store-3", sections=sections, columnar=True)
+    for chunk in plain.chunks:
+        start, end = chunk.span
+        assert " ".join(sections[0].text[start:end].split()) == chunk.text
+    assert tuple(compact.chunks) == plain.chunks
+    hit = retrieve("second", compact, top_k=1).hits[0]
+    assert sections[0].text[hit.span[0] : hit.span[1]] == "Second para."
+
+
+def test_token_index_maps_tokens_to_chunk_positions():
+    index = TokenIndex.build([["a", "b", "a"], ["b", "c"], []])
+    assert list(index.positions("a")) == [0] and list(index.positions("b")) == [0, 1]
+    assert not index.positions("missing") and len(index) == 3
+    assert index.tokens(1) == frozenset({"b", "c"}) and index.tokens(2) == frozenset()
+    assert index.nbytes == 4 * 4 + 8 * 4
+
+
+def test_columnar_ingestion_retains_little_beyond_its_columns():
+    paragraphs = [
+        " ".join(f"w{(idx * 7 + word * 13) % 500}x" for word in range(30)) + "."
+        for idx in range(2000)
+    ]
+    sections = (SectionInput(label="Body", text="\n\n".join(paragraphs)),)
+    tuple_bytes, _ = _retained_bytes(sections, columnar=False)
+    columnar_bytes, paper = _retained_bytes(sections, columnar=True)
+    columns = paper.chunks.nbytes + paper.token_index.nbytes
+    assert columnar_bytes < 2 * columns
+    assert columnar_bytes < tuple_bytes / 2
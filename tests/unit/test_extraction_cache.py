@@ -0,0 +1,58 @@
+import os
+
+from paperta.contracts import SectionInput
+from paperta.extraction_cache import CachedExtraction, ExtractionCache
+
+
+def _entry(text):
+    return CachedExtraction(text=text, sections=(SectionInput(label="Body", text=text),))
+
+
+def test_extraction_cache_round_trips_by_content_digest(tmp_path):
+    cache = ExtractionCache(tmp_path)
+    key = ExtractionCache.key("paper.pdf", b"%PDF bytes")
+    assert cache.get(key) is None
+    cache.put(key, _entry("Extracted text."))
+    assert ExtractionCache(tmp_path).get(ExtractionCache.key("copy.PDF", b"%PDF bytes")) == _entry(
+        "Extracted text."
+    )
+    assert ExtractionCache.key("paper.txt", b"%PDF bytes") != key
+
+
+def test_extraction_cache_evicts_least_recently_used_entries(tmp_path):
+    cache = ExtractionCache(tmp_path, max_bytes=250)
+    keys = [ExtractionCache.key("p.pdf", bytes([idx])) for idx in range(3)]
+    cache.put(keys[0], _entry("a" * 40))
+    cache.put(keys[1], _entry("b" * 40))
+    old = cache._path(keys[1]).stat().st_mtime_ns - 10**9
+    os.utime(cache._path(keys[1]), ns=(old, old))
+    assert cache.get(keys[0]) is not None
+    cache.put(keys[2], _entry("c" * 40))
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None and cache.get(keys[2]) is not None
+
+
+def test_extraction_cache_stores_page_texts_in_batches(tmp_path):
+    cache = ExtractionCache(tmp_path)
+    cache.put_pages({"d1": "Page one.", "d2": ""})
+    assert ExtractionCache(tmp_path).get_pages(["d1", "d2", "d3"]) == {"d1": "Page one.", "d2": ""}
+    assert cache.get(ExtractionCache.key("p.pdf", b"d1")) is None
+
+
+def test_extraction_cache_scans_only_when_the_running_total_exceeds_the_budget(
+    tmp_path, monkeypatch
+):
+    cache = ExtractionCache(tmp_path, max_bytes=250)
+    scans = []
+    original = cache._evict_scan
+    monkeypatch.setattr(cache, "_evict_scan", lambda: scans.append(1) or original())
+    keys = [ExtractionCache.key("p.pdf", bytes([idx])) for idx in range(3)]
+    cache.put(keys[0], _entry("a" * 40))  # No running total yet: one scan seeds it.
+    cache.put(keys[1], _entry("b" * 40))
+    cache.put(keys[1], _entry("b" * 40))  # Replacing an entry does not grow the total.
+    assert len(scans) == 1
+    cache.put(keys[2], _entry("c" * 40))
+    assert len(scans) == 2 and cache.get(keys[0]) is None
+
+    sizes = sum(cache._path(key).stat().st_size for key in keys[1:])
+    assert (cache._root / ".usage").read_text(encoding="ascii") == str(sizes)
@@ -0,0 +1,52 @@
+from conftest import build_text_pdf
+from paperta.extraction_cache import ExtractionCache
+from paperta.extraction_worker import ExtractionWorker
+from paperta.pdf_utils import (
+    ExtractionOptions,
+    extract_sections_from_pdf,
+    extract_text_from_pdf,
+    iter_pdf_pages,
+)
+
+
+def test_worker_matches_in_process_extraction_and_is_reused():
+    content = build_text_pdf(
+        [
+            ["1. Introduction", "A sandboxed worker extracts this paper."],
+            ["2. Method", "The same child process serves every document.", "References"],
+            ["[1] A. Author. A cited paper."],
+        ]
+    )
+    options = ExtractionOptions(stop_at_references=True)
+    worker = ExtractionWorker(timeout_s=30)
+    try:
+        assert worker.extract_text(content) == extract_text_from_pdf(content)
+        pid = worker.pid
+        assert pid is not None
+        assert worker.extract_sections(content, options) == extract_sections_from_pdf(
+            content, options=options
+        )
+        assert list(worker.iter_pages(content)) == list(iter_pdf_pages(content))
+        assert worker.has_outline(content) is False
+        assert worker.scan_text_layer(content).kind == "text"
+        page_texts = {}
+        worker.extract_text(content, page_texts=page_texts)
+        assert sorted(page_texts) == sorted(worker.page_digests(content))
+        assert worker.pid == pid
+    finally:
+        worker.close()
+    assert worker.pid is None
+
+
+def test_worker_load_pdf_looks_up_cached_pages_in_the_child(tmp_path):
+    content = build_text_pdf([["First page."], ["Second page."]])
+    cache = ExtractionCache(tmp_path)
+    worker = ExtractionWorker(timeout_s=30)
+    try:
+        first = worker.load_pdf(content, page_lookup=cache.get_pages)
+        assert first.text == extract_text_from_pdf(content) and not first.cached_pages
+        cache.put_pages(first.new_pages)
+        second = worker.load_pdf(content, page_lookup=cache.get_pages)
+        assert second.cached_pages == first.new_pages and not second.new_pages
+    finally:
+        worker.close()
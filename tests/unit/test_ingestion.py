@@ -1,5 +1,5 @@
 from paperta.contracts import SectionInput
-from paperta.ingestion import ingest_document
+from paperta.ingestion import SlidingWindowChunker, chunk_id_to_int, ingest_document
 
 
 def test_chunking_assigns_stable_chunk_ids():
@@ -10,3 +10,52 @@ def test_chunking_assigns_stable_chunk_ids():
     first = ingest_document(paper_id="p1", sections=sections)
     second = ingest_document(paper_id="p1", sections=sections)
     assert tuple(c.chunk_id for c in first.chunks) == tuple(c.chunk_id for c in second.chunks)
+
+
+def test_sliding_window_chunker_bounds_chunk_tokens():
+    sentences = " ".join(f"Sentence {idx} has five words." for idx in range(40))
+    sections = (SectionInput(label="Body", text=sentences),)
+    chunker = SlidingWindowChunker(max_tokens=12, overlap_tokens=5)
+    paper = ingest_document(paper_id="p1", sections=sections, chunker=chunker)
+    assert len(paper.chunks) > 1
+    assert all(len(c.text.split()) <= 12 for c in paper.chunks)
+    assert all(c.text.startswith("Sentence") and c.text.endswith(".") for c in paper.chunks)
+    again = ingest_document(paper_id="p1", sections=sections, chunker=chunker)
+    assert tuple(c.chunk_id for c in paper.chunks) == tuple(c.chunk_id for c in again.chunks)
+
+
+def test_sliding_window_chunker_hard_splits_long_sentences_with_overlap():
+    text = " ".join(f"w{idx}" for idx in range(10))
+    spans = SlidingWindowChunker(max_tokens=4, overlap_tokens=1)(text)
+    windows = [text[start:end].split() for start, end in spans]
+    assert windows[0] == ["w0", "w1", "w2", "w3"]
+    assert windows[1][0] == "w3"
+    assert windows[-1][-1] == "w9"
+
+
+def test_pdf_artifact_folding_is_opt_in_and_keeps_compound_hyphens():
+    sections = (SectionInput(label="Body", text="An eﬃcient self-\nattention for\nﬁne-tuning."),)
+    plain = ingest_document(paper_id="p1", sections=sections)
+    assert plain.chunks[0].text == "An eﬃcient self- attention for ﬁne-tuning."
+    assert not plain.fold_pdf_artifacts
+
+    folded = ingest_document(paper_id="p1", sections=sections, fold_pdf_artifacts=True)
+    columnar = ingest_document(
+        paper_id="p1", sections=sections, columnar=True, fold_pdf_artifacts=True
+    )
+    for paper in (folded, columnar):
+        assert paper.chunks[0].text == "An efficient self-attention for fine-tuning."
+        assert paper.fold_pdf_artifacts and paper.chunks[0].chunk_id != plain.chunks[0].chunk_id
+    tokens = {"an", "efficient", "self", "attention", "for", "fine", "tuning"}
+    assert folded.token_index.tokens(0) == frozenset(tokens)
+
+
+def test_id_schemes_are_recorded_and_keep_legacy_ids_by_default():
+    sections = (SectionInput(label="Intro", text="A B C.\n\nD E."),)
+    legacy = ingest_document(paper_id="p1", sections=sections)
+    fast = ingest_document(paper_id="p1", sections=sections, id_scheme="blake2b-v2")
+    assert legacy.id_scheme == "sha256-v1" and fast.id_scheme == "blake2b-v2"
+    assert legacy.chunks[0].chunk_id == "e11994b3da7df6a2"
+    assert all(len(c.chunk_id) == 16 for c in fast.chunks)
+    assert {c.chunk_id for c in fast.chunks}.isdisjoint(c.chunk_id for c in legacy.chunks)
+    assert chunk_id_to_int(fast.chunks[0].chunk_id).to_bytes(8, "big").hex() == fast.chunks[0].chunk_id
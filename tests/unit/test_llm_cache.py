@@ -0,0 +1,61 @@
+from paperta import llm_providers
+from paperta.llm_cache import LLMResponseCache
+
+
+def _key(prompt, **params):
+    return LLMResponseCache.key("openai", "gpt-4o", "system", prompt, params or {"temperature": 0.3})
+
+
+def test_llm_cache_keys_on_every_request_field(tmp_path):
+    cache = LLMResponseCache(tmp_path / "llm.sqlite3")
+    cache.put(_key("summarize"), "Cached answer.")
+    assert LLMResponseCache(tmp_path / "llm.sqlite3").get(_key("summarize")) == "Cached answer."
+    assert cache.get(_key("summarize", temperature=0.7)) is None
+    assert cache.get(_key("teach")) is None
+
+
+def test_llm_cache_expires_and_evicts_least_recently_used(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("paperta.llm_cache.time.time", lambda: now[0])
+    cache = LLMResponseCache(tmp_path / "llm.sqlite3", ttl_s=100, max_bytes=25)
+    cache.put(_key("a"), "a" * 10)
+    now[0] += 1
+    cache.put(_key("b"), "b" * 10)
+    now[0] += 1
+    assert cache.get(_key("a")) is not None
+    cache.put(_key("c"), "c" * 10)
+    assert cache.get(_key("b")) is None
+    assert cache.get(_key("a")) is not None
+    now[0] += 100
+    assert cache.get(_key("a")) is None and cache.get(_key("c")) == "c" * 10
+
+
+def test_enhance_and_stream_reuse_cached_completions(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_call(model, system_prompt, user_prompt):
+        calls.append("call")
+        return "Grounded  answer [c1].\n"
+
+    def fake_stream(model, system_prompt, user_prompt):
+        calls.append("stream")
+        yield from ("Grounded ", " answer", " [c1].\n")
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(llm_providers, "_call_openai", fake_call)
+    monkeypatch.setattr(llm_providers, "_stream_openai", fake_stream)
+    cache = LLMResponseCache(tmp_path / "llm.sqlite3")
+    args = ("summary", "What is proposed?", {"chunks": ["c1"]})
+
+    first = llm_providers.enhance_with_llm(*args, cache=cache)
+    assert llm_providers.enhance_with_llm(*args, cache=cache) == first
+    replayed = list(llm_providers.stream_with_llm(*args, cache=cache))
+    assert "".join(replayed) == first and len(replayed) == 3
+    assert calls == ["call"]
+
+    # Abandoned streams are not cached; finished ones are.
+    other = ("summary", "Other question?", {"chunks": ["c1"]})
+    next(llm_providers.stream_with_llm(*other, cache=cache))
+    assert "".join(llm_providers.stream_with_llm(*other, cache=cache)) == "Grounded  answer [c1].\n"
+    assert llm_providers.enhance_with_llm(*other, cache=cache) == "Grounded  answer [c1].\n"
+    assert calls == ["call", "stream", "stream"]
@@ -0,0 +1,281 @@
+import asyncio
+import functools
+import json
+import sys
+import threading
+import types
+import weakref
+from types import SimpleNamespace
+
+import pytest
+
+from paperta import llm_providers
+from paperta.contracts import SectionInput
+from paperta.ingestion import SlidingWindowChunker
+from paperta.llm_cache import LLMResponseCache
+from paperta.llm_providers import ClientPoolLimits
+from paperta.pipeline import run_phase3_reviewer_pipeline
+
+
+class _FakeClient:
+    def __init__(self, provider, api_key, base_url, limits, asynchronous=False):
+        self.args = (provider, api_key, base_url, limits, asynchronous)
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_client_registry_shares_one_client_per_provider_endpoint_and_key(monkeypatch):
+    built = []
+
+    def fake_build(*args):
+        built.append(_FakeClient(*args))
+        return built[-1]
+
+    monkeypatch.setattr(llm_providers, "_build_client", fake_build)
+    monkeypatch.setattr(llm_providers, "_CLIENTS", {})
+    monkeypatch.setattr(llm_providers, "_POOL_LIMITS", None)
+    monkeypatch.setenv("OPENAI_API_KEY", "key-1")
+    monkeypatch.delenv("OPENAI_BASE_URL", raising=False)
+    monkeypatch.setenv("GOOGLE_API_KEY", "key-g")
+    llm_providers.configure_client_pool(ClientPoolLimits(max_connections=4, max_keepalive_connections=2))
+
+    seen = []
+    threads = [
+        threading.Thread(target=lambda: seen.append(llm_providers._client("openai")))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(built) == 1 and all(client is built[0] for client in seen)
+    assert built[0].args[2] is None and built[0].args[3].max_connections == 4
+
+    google = llm_providers._client("google")
+    assert google.args[2].startswith("https://generativelanguage") and len(built) == 2
+    monkeypatch.setenv("OPENAI_API_KEY", "key-2")
+    assert llm_providers._client("openai") is not built[0]
+    monkeypatch.setenv("OPENAI_BASE_URL", "http://127.0.0.1:9/v1")
+    assert llm_providers._client("openai").args[2] == "http://127.0.0.1:9/v1"
+    assert len(built) == 4
+
+    llm_providers.close_clients()
+    assert all(client.closed for client in built)
+    assert llm_providers._client("google") is not google
+
+
+def _fake_module(name, *classes):
+    """Module whose classes return `(class name, constructor kwargs)`."""
+    module = types.ModuleType(name)
+    for cls in classes:
+        setattr(module, cls, functools.partial(lambda cls, **kwargs: (cls, kwargs), cls))
+    return module
+
+
+def test_build_client_wires_pool_limits_into_each_sdk_http_client(monkeypatch):
+    http = ("DefaultHttpxClient", "DefaultAsyncHttpxClient")
+    monkeypatch.setitem(sys.modules, "httpx", _fake_module("httpx", "Limits"))
+    openai = _fake_module("openai", "OpenAI", "AsyncOpenAI", *http)
+    anthropic = _fake_module("anthropic", "Anthropic", "AsyncAnthropic", *http)
+    monkeypatch.setitem(sys.modules, "openai", openai)
+    monkeypatch.setitem(sys.modules, "anthropic", anthropic)
+    limits = ClientPoolLimits(max_connections=4, max_keepalive_connections=2, keepalive_expiry_s=5)
+    pool = ("Limits", {"max_connections": 4, "max_keepalive_connections": 2, "keepalive_expiry": 5})
+
+    for provider, asynchronous, sdk_class, http_class in (
+        ("openai", False, "OpenAI", "DefaultHttpxClient"),
+        ("google", True, "AsyncOpenAI", "DefaultAsyncHttpxClient"),
+        ("anthropic", False, "Anthropic", "DefaultHttpxClient"),
+        ("anthropic", True, "AsyncAnthropic", "DefaultAsyncHttpxClient"),
+    ):
+        client = llm_providers._build_client(provider, "key", "http://x", limits, asynchronous)
+        http_client = (http_class, {"limits": pool})
+        assert client == (
+            sdk_class,
+            {"api_key": "key", "base_url": "http://x", "http_client": http_client},
+        )
+
+
+def test_gather_bounded_preserves_order_and_limits_concurrency():
+    active = [0, 0]
+
+    async def work(value, delay):
+        active[0] += 1
+        active[1] = max(active[1], active[0])
+        await asyncio.sleep(delay)
+        active[0] -= 1
+        return value
+
+    calls = [functools.partial(work, idx, 0.01 * (5 - idx)) for idx in range(5)]
+    assert asyncio.run(llm_providers.gather_bounded(calls, limit=2)) == [0, 1, 2, 3, 4]
+    assert active[1] == 2
+
+
+def test_gather_bounded_cancels_siblings_on_failure():
+    cancelled = []
+
+    async def slow(idx):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(idx)
+            raise
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("provider error")
+
+    calls = [functools.partial(slow, 0), fail, functools.partial(slow, 2), functools.partial(slow, 3)]
+    with pytest.raises(ValueError, match="provider error"):
+        asyncio.run(llm_providers.gather_bounded(calls, limit=3))
+    # Running siblings are cancelled; the queued one never starts.
+    assert sorted(cancelled) == [0, 2]
+
+
+def test_gather_bounded_can_return_exceptions_in_place():
+    async def ok(value):
+        await asyncio.sleep(0.01)
+        return value
+
+    async def fail():
+        raise ValueError("provider error")
+
+    calls = [functools.partial(ok, 0), fail, functools.partial(ok, 2)]
+    results = asyncio.run(llm_providers.gather_bounded(calls, limit=2, return_exceptions=True))
+    assert results[0] == 0 and results[2] == 2 and isinstance(results[1], ValueError)
+
+
+class _FakeAsyncCompletions:
+    def __init__(self, calls):
+        self.calls = calls
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs.get("stream", False))
+        if kwargs.get("stream"):
+            return self._stream()
+        message = SimpleNamespace(content="Async answer.")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    async def _stream(self):
+        for text in ("Async", " answer."):
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+
+
+def test_async_enhance_and_stream_use_async_clients_and_cache(tmp_path, monkeypatch):
+    calls = []
+    built = []
+
+    closed = []
+
+    async def close():
+        closed.append(True)
+
+    def fake_build(provider, api_key, base_url, limits, asynchronous=False):
+        built.append(asynchronous)
+        completions = _FakeAsyncCompletions(calls)
+        return SimpleNamespace(chat=SimpleNamespace(completions=completions), close=close)
+
+    monkeypatch.setattr(llm_providers, "_build_client", fake_build)
+    monkeypatch.setattr(llm_providers, "_ASYNC_CLIENTS", weakref.WeakKeyDictionary())
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    cache = LLMResponseCache(tmp_path / "llm.sqlite3")
+
+    async def run():
+        async with llm_providers.async_client_scope():
+            stream = llm_providers.astream_with_llm("summary", "q", {}, cache=cache)
+            first = [
+                "".join([text async for text in stream]),
+                await llm_providers.aenhance_with_llm("summary", "q", {}, cache=cache),
+                await llm_providers.aenhance_with_llm("reviewer", "q", {}, cache=cache),
+            ]
+            repeat = await llm_providers.aenhance_with_llm("reviewer", "q", {}, cache=cache)
+            assert not closed
+        return first, repeat
+
+    texts, repeat = asyncio.run(run())
+    assert texts == ["Async answer."] * 3 and repeat == "Async answer."
+    assert calls == [True, False] and built == [True]
+    assert closed == [True] and not llm_providers._ASYNC_CLIENTS
+
+
+def test_long_teach_papers_are_digested_per_section_and_reduced(tmp_path, monkeypatch):
+    requests = []
+
+    def answer(model, messages, **params):
+        system, user = messages[0]["content"], messages[1]["content"]
+        requests.append(user)
+        if system == llm_providers._TEACH_DIGEST_SYSTEM_PROMPT:
+            text = f"digest of {user.split()[0]}"
+        else:
+            text = "## TL;DR\nWalkthrough."
+        message = SimpleNamespace(content=text)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    async def answer_async(**kwargs):
+        return answer(**kwargs)
+
+    closed = []
+
+    async def close():
+        closed.append(True)
+
+    def fake_build(provider, api_key, base_url, limits, asynchronous=False):
+        create = answer_async if asynchronous else answer
+        completions = SimpleNamespace(create=create)
+        return SimpleNamespace(chat=SimpleNamespace(completions=completions), close=close)
+
+    monkeypatch.setattr(llm_providers, "_build_client", fake_build)
+    monkeypatch.setattr(llm_providers, "_CLIENTS", {})
+    monkeypatch.setattr(llm_providers, "_ASYNC_CLIENTS", weakref.WeakKeyDictionary())
+    monkeypatch.setattr(
+        llm_providers,
+        "_TEACH_DIGEST_WINDOW",
+        SlidingWindowChunker(max_tokens=6, overlap_tokens=0, snap_to_sentences=False),
+    )
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    cache = LLMResponseCache(tmp_path / "llm.sqlite3")
+    sections = [
+        SectionInput(label="Intro", text="alpha " * 4),
+        SectionInput(label="Method", text="beta " * 6 + "gamma " * 3),
+    ]
+
+    text = llm_providers.teach_enhance_with_llm(
+        sections, "learn", cache=cache, map_reduce_above_tokens=10
+    )
+    assert text == "## TL;DR\nWalkthrough."
+    reduce_prompt = requests[-1]
+    assert reduce_prompt.index("### Intro\ndigest of alpha") < reduce_prompt.index(
+        "### Method (part 1/2)\ndigest of beta"
+    ) < reduce_prompt.index("### Method (part 2/2)\ndigest of gamma")
+    assert len(requests) == 4
+    # The async client built for the run is closed before asyncio.run returns.
+    assert closed == [True] and not llm_providers._ASYNC_CLIENTS
+
+    # Only the edited section is digested again, then the reduce step reruns.
+    sections[0] = SectionInput(label="Intro", text="delta " * 4)
+    llm_providers.teach_enhance_with_llm(sections, "learn", cache=cache, map_reduce_above_tokens=10)
+    assert len(requests) == 6 and requests[4].startswith("delta")
+
+    # Short papers still go out as one full-text prompt.
+    llm_providers.teach_enhance_with_llm(sections, "learn", cache=cache)
+    assert "=== FULL PAPER CONTENT ===" in requests[-1] and len(requests) == 7
+
+
+def test_user_prompt_lists_each_chunk_once_without_redundant_fields():
+    sections = (
+        SectionInput(label="Intro", text="We evaluate robustness under distribution shift."),
+        SectionInput(label="Results", text="Robustness improves F1 across shifted datasets."),
+    )
+    result = run_phase3_reviewer_pipeline("p1", sections, "robustness", top_k=4)
+    prompt = llm_providers._build_user_prompt("reviewer", "robustness", result)
+    payload = json.loads(prompt.split("```json\n", 1)[1].split("\n```", 1)[0])
+
+    hit_ids = [hit.chunk_id for hit in result.retrieval_trace.hits]
+    assert payload["retrieval_trace"] == {"hits": hit_ids}
+    assert set(payload["chunks"]) == set(hit_ids)
+    assert payload["chunks"][hit_ids[0]]["text"] == result.retrieval_trace.hits[0].text
+    assert prompt.count(json.dumps(result.retrieval_trace.hits[0].text)) == 1
+    assert not {"claim_count", "mode", "retrieved_chunk_ids"} & set(payload)
+    assert "\n " not in prompt and hit_ids[0] in json.dumps(payload["claim_matrix"])
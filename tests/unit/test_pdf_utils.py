@@ -0,0 +1,307 @@
+from io import BytesIO
+
+from conftest import build_text_pdf
+from paperta import pdf_utils
+from paperta.pdf_utils import (
+    ExtractionOptions,
+    SectionDetector,
+    detect_sections,
+    extract_sections_from_pdf,
+    extract_text_from_path,
+    extract_text_from_pdf,
+    iter_pdf_pages,
+    iter_sections,
+    load_pdf,
+    page_digests,
+    remove_running_lines,
+    scan_text_layer,
+    section_tree,
+    top_level_sections,
+)
+
+
+def test_parallel_extraction_matches_sequential_page_order():
+    pages = [[f"Page {idx} opening line.", f"Body text of page {idx}."] for idx in range(12)]
+    content = build_text_pdf(pages)
+    sequential = extract_text_from_pdf(content)
+    assert extract_text_from_pdf(content, workers=3) == sequential
+    assert sequential.index("Page 2 opening") < sequential.index("Page 11 opening")
+    assert sequential.count("\n\n") >= 11
+
+
+def test_streamed_pages_and_sections_match_batch_detection():
+    content = build_text_pdf(
+        [
+            ["Abstract", "We study streaming extraction of papers.", "1"],
+            ["1. Introduction", "Readers should see sections while pages load."],
+            ["2. Method", "Each page is fed to an incremental detector.", "3"],
+        ]
+    )
+    pages = list(iter_pdf_pages(content))
+    assert "\n\n".join(pages) == extract_text_from_pdf(content)
+    sections = tuple(iter_sections(pages))
+    assert sections == detect_sections("\n\n".join(pages))
+    assert [s.label for s in sections] == ["Abstract", "Introduction", "Method"]
+
+
+def test_section_detector_emits_sections_before_finish():
+    detector = SectionDetector()
+    assert detector.feed("Abstract\nA long enough abstract body text.\n") == []
+    emitted = detector.feed("1. Introduction\nThe introduction body text.")
+    assert [s.label for s in emitted] == ["Abstract"]
+    assert [s.text for s in detector.finish()] == ["The introduction body text."]
+
+
+def test_path_extraction_matches_bytes_extraction(tmp_path):
+    content = build_text_pdf([[f"Page {idx} of a long thesis."] for idx in range(8)])
+    path = tmp_path / "thesis.pdf"
+    path.write_bytes(content)
+    assert extract_text_from_path(path) == extract_text_from_pdf(content)
+    assert extract_text_from_path(str(path), workers=2) == extract_text_from_pdf(content)
+
+
+def test_detect_sections_drops_running_noise_in_one_pass():
+    text = (
+        "Proceedings of the 40th Conference\n1. Introduction\nWe motivate the problem here.\n"
+        "12\n\nJOURNAL OF İMAGING, PAGE 3\nStill the introduction body.\n"
+        "2. Method\nSee proceedİngs notes.\nThe method body survives cleaning."
+    )
+    sections = detect_sections(text)
+    assert [s.label for s in sections] == ["Introduction", "Method"]
+    assert sections[0].text == "We motivate the problem here.\n\nStill the introduction body."
+    assert sections[1].text == "The method body survives cleaning."
+
+
+def test_outline_entries_define_sections_without_heading_heuristics():
+    pages = [
+        ["A Study of Outlines", "We read bookmarks instead of guessing headings."],
+        ["1 Our Core Idea", "Sections come straight from the document outline."],
+        ["Results continue here with more text.", "2 What We Found", "Outlines are exact and cheap."],
+    ]
+    content = build_text_pdf(
+        pages, outline=(("Paper", 0, (("1 Our Core Idea", 1), ("2 What We Found", 2))),)
+    )
+    text, sections = extract_sections_from_pdf(content)
+    assert text == extract_text_from_pdf(content)
+    assert [s.label for s in sections] == ["Preamble", "Our Core Idea", "What We Found"]
+    assert sections[1].text.endswith("Results continue here with more text.")
+    assert sections[2].text == "Outlines are exact and cheap."
+
+    plain = build_text_pdf(pages)
+    assert extract_sections_from_pdf(plain)[1] == detect_sections(extract_text_from_pdf(plain))
+
+
+_PAPER_WITH_BACK_MATTER = [
+    ["1. Introduction", "Summaries never need the bibliography pages."],
+    ["2. Method", "The method text ends here.", "References", "[1] A. Author. A cited paper."],
+    ["[2] B. Author. Another cited paper.", "[3] C. Author. Yet another one."],
+    ["Appendix", "Proofs that reviewers may want to read."],
+]
+
+
+def test_page_range_limits_extraction():
+    content = build_text_pdf([[f"Page {idx} of a long thesis."] for idx in range(10)])
+    pages = list(iter_pdf_pages(content))
+    options = ExtractionOptions(page_range=(2, 5))
+    assert extract_text_from_pdf(content, options=options) == "\n\n".join(pages[2:5])
+    assert extract_text_from_pdf(content, workers=2, options=ExtractionOptions((4, 99))) == (
+        "\n\n".join(pages[4:])
+    )
+
+
+def test_stop_at_references_skips_bibliography_and_optionally_keeps_appendices():
+    content = build_text_pdf(_PAPER_WITH_BACK_MATTER)
+    body = extract_text_from_pdf(content, options=ExtractionOptions(stop_at_references=True))
+    assert body.endswith("The method text ends here.")
+    assert "cited paper" not in body and "Proofs" not in body
+
+    options = ExtractionOptions(stop_at_references=True, include_appendices=True)
+    pages = list(iter_pdf_pages(content, options))
+    assert pages[-1].startswith("Appendix")
+    assert not any("cited paper" in page for page in pages)
+    assert [s.label for s in detect_sections("\n\n".join(pages))] == [
+        "Introduction",
+        "Method",
+        "Appendix",
+    ]
+
+
+def test_stop_at_references_uses_outline_pages():
+    outline = (("1 Introduction", 0), ("2 Method", 1), ("References", 1), ("Appendix", 3))
+    content = build_text_pdf(_PAPER_WITH_BACK_MATTER, outline=outline)
+    options = ExtractionOptions(stop_at_references=True)
+    _, sections = extract_sections_from_pdf(content, options=options)
+    assert [s.label for s in sections] == ["Introduction", "Method"]
+    assert sections[-1].text == "The method text ends here."
+
+    options = ExtractionOptions(stop_at_references=True, include_appendices=True)
+    text, sections = extract_sections_from_pdf(content, options=options)
+    assert "cited paper" not in text
+    assert [s.label for s in sections] == ["Introduction", "Method", "Appendix"]
+
+
+def test_remove_running_lines_strips_recurring_page_edges_only():
+    words = ("alpha", "beta", "gamma", "delta", "epsilon", "zeta")
+    pages = []
+    for idx, word in enumerate(words, start=1):
+        head = "A. Author et al." if idx % 2 else "Running Title of the Paper"
+        pages.append(f"{head}\nThe {word} page body.\nA. Author et al.\nPage {idx} of 6\n")
+    cleaned = remove_running_lines(pages)
+    assert cleaned[0] == "The alpha page body.\n"
+    assert cleaned[1] == "The beta page body.\n"
+    assert remove_running_lines(pages[:2]) == pages[:2]
+
+
+def test_strip_running_lines_option_shrinks_pdf_text():
+    words = ("one", "two", "three", "four", "five", "six", "seven", "eight")
+    pages = [["Deep Running Heads, Preprint", f"Page {word} has its own text.", "7"] for word in words]
+    content = build_text_pdf(pages)
+    options = ExtractionOptions(strip_running_lines=True)
+    text = extract_text_from_pdf(content, options=options)
+    assert "Preprint" not in text and "Page eight has" in text
+    assert "\n\n".join(iter_pdf_pages(content, options)) == text
+    assert extract_text_from_pdf(content, workers=2, options=options) == text
+
+
+def test_scan_text_layer_classifies_sampled_pages_without_extraction():
+    assert scan_text_layer(build_text_pdf([["A text page."]] * 3)).kind == "text"
+    scanned = scan_text_layer(build_text_pdf([None] * 3))
+    assert scanned.kind == "scanned" and scanned.image_only_pages == (0, 1, 2)
+
+    mixed = scan_text_layer(build_text_pdf([["Cover page."], None, ["Body."]]))
+    assert mixed.kind == "mixed" and mixed.empty_pages == (1,)
+
+    # The ' and " operators also show text.
+    for operator in (b"'  T*", b'"  T*'):
+        quoted = build_text_pdf([["Hello"]]).replace(b"(Hello) Tj T*", b"(Hello) " + operator)
+        assert b"Tj" not in quoted and scan_text_layer(quoted).kind == "text"
+
+    report = scan_text_layer(build_text_pdf([None] + [["Text."]] * 19), sample_size=4)
+    assert report.page_count == 20
+    assert report.sampled_pages == (0, 6, 13, 19)
+    assert report.empty_pages == (0,)
+
+
+def test_page_cache_reextracts_only_changed_pages_of_a_revision():
+    original = build_text_pdf([["Page zero text."], ["Page one text."], ["Page two text."]])
+    revised = build_text_pdf(
+        [["A new cover page."], ["Page zero text."], ["Page one, revised."], ["Page two text."]]
+    )
+    before, after = page_digests(original), page_digests(revised)
+    assert after[1] == before[0] and after[3] == before[2] and after[2] != before[1]
+
+    page_texts = {}
+    extract_text_from_pdf(original, page_texts=page_texts)
+    assert set(page_texts) == set(before)
+    page_texts[before[2]] = "Cached page two."
+    text = extract_text_from_pdf(revised, page_texts=page_texts)
+    assert text.endswith("Cached page two.")
+    assert "Page one, revised." in text and len(page_texts) == 5
+
+
+def test_load_pdf_matches_the_separate_calls_from_one_parse():
+    content = build_text_pdf(
+        [["1. Introduction", "Loaded once."], ["2. Method", "Also once."]],
+        outline=[("Introduction", 0), ("Method", 1)],
+    )
+    options = ExtractionOptions(strip_running_lines=True)
+    loaded = load_pdf(content, options, page_lookup=lambda digests: {})
+    assert loaded.text_layer == scan_text_layer(content) and loaded.has_outline
+    assert list(loaded.page_digests) == page_digests(content)
+    assert (loaded.text, loaded.sections) == extract_sections_from_pdf(content, options=options)
+    assert set(loaded.new_pages) == set(loaded.page_digests) and not loaded.cached_pages
+
+    # Cached pages are reused, not re-extracted.
+    cached = {loaded.page_digests[0]: "1. Introduction\nFrom the cache."}
+    again = load_pdf(content, options, page_lookup=lambda digests: cached)
+    assert "From the cache." in again.text and set(again.new_pages) == {loaded.page_digests[1]}
+
+    plain = build_text_pdf([["No outline here."]])
+    assert load_pdf(plain, outlined_only=True).text is None
+    assert load_pdf(build_text_pdf([None])).text_layer.kind == "scanned"
+
+
+def _inherited_font_page(base_font):
+    from pypdf import PdfReader, PdfWriter
+    from pypdf.generic import NameObject
+
+    writer = PdfWriter(clone_from=PdfReader(BytesIO(build_text_pdf([["Same text."]]))))
+    page = writer.pages[0]
+    resources = page[NameObject("/Resources")]
+    del page[NameObject("/Resources")]
+    resources["/Font"]["/F1"][NameObject("/BaseFont")] = NameObject(base_font)
+    writer.root_object["/Pages"].get_object()[NameObject("/Resources")] = resources
+    return page
+
+
+def test_page_digest_covers_resources_inherited_from_the_page_tree():
+    # Writer pages are not flattened, so the font lives only on the /Pages node.
+    helvetica = pdf_utils._page_digest(_inherited_font_page("/Helvetica"), {})
+    assert helvetica != pdf_utils._page_digest(_inherited_font_page("/Courier"), {})
+    assert helvetica == pdf_utils._page_digest(_inherited_font_page("/Helvetica"), {})
+
+
+def _nested_form_page(depth, innermost, cyclic=False):
+    from pypdf import PdfReader, PdfWriter
+    from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+    writer = PdfWriter(clone_from=PdfReader(BytesIO(build_text_pdf([["Same text."]]))))
+    forms = []
+    for level in range(depth):
+        form = DecodedStreamObject()
+        form.update({NameObject("/Type"): NameObject("/XObject")})
+        form.update({NameObject("/Subtype"): NameObject("/Form")})
+        form.set_data(innermost if level == depth - 1 else b"/X Do")
+        forms.append(writer._add_object(form))
+    for form, child in zip(forms, forms[1:] + (forms[:1] if cyclic else [])):
+        xobjects = DictionaryObject({NameObject("/X"): child})
+        resources = DictionaryObject({NameObject("/XObject"): xobjects})
+        form.get_object()[NameObject("/Resources")] = resources
+    page = writer.pages[0]
+    page[NameObject("/Resources")][NameObject("/XObject")] = DictionaryObject(
+        {NameObject("/X"): forms[0]}
+    )
+    return page
+
+
+def test_page_digest_covers_deeply_nested_form_xobjects():
+    original = pdf_utils._page_digest(_nested_form_page(12, b"BT (old) Tj ET"), {})
+    assert original == pdf_utils._page_digest(_nested_form_page(12, b"BT (old) Tj ET"), {})
+    assert original != pdf_utils._page_digest(_nested_form_page(12, b"BT (new) Tj ET"), {})
+
+    cyclic = pdf_utils._page_digest(_nested_form_page(12, b"BT (old) Tj ET", cyclic=True), {})
+    assert cyclic != pdf_utils._page_digest(
+        _nested_form_page(12, b"BT (new) Tj ET", cyclic=True), {}
+    )
+
+
+def _thesis_text(chapters):
+    lines = ["Abstract", "A thesis long enough to have many chapters."]
+    for chapter in range(1, chapters + 1):
+        lines += [f"{chapter}. Chapter {chapter}", f"Opening remarks of chapter {chapter}."]
+        for part in (1, 2):
+            lines += [f"{chapter}.{part} Part {part}", f"Body of part {chapter}.{part} goes here."]
+            lines += ["3.5 Times faster than the baseline.", f"{chapter}.{part}.1 Detail", "Deep."]
+    return "\n".join(lines)
+
+
+def test_detect_sections_keeps_every_section_of_long_documents():
+    sections = detect_sections(_thesis_text(30))
+    assert len(sections) == 31 and sections[-1].label == "Chapter 30"
+    bounded = top_level_sections(sections)
+    assert len(bounded) == 20 and bounded[-1].label == "Remaining Sections (12)"
+    assert "Chapter 30" in bounded[-1].text and "Body of part 30.2" in bounded[-1].text
+
+
+def test_section_tree_nests_numbered_subsections_lazily():
+    node = section_tree(detect_sections(_thesis_text(3)))[2]
+    assert node._split is None
+    assert node.label == "Chapter 2" and node.body == "Opening remarks of chapter 2."
+    assert [(c.number, c.label, c.level) for c in node.children] == [
+        ("2.1", "Part 1", 2),
+        ("2.2", "Part 2", 2),
+    ]
+    part = node.children[0]
+    assert part.body.endswith("3.5 Times faster than the baseline.")
+    assert [(g.number, g.text) for g in part.children] == [("2.1.1", "Deep.")]
+    assert [n.number for n in node.walk()] == ["", "2.1", "2.1.1", "2.2", "2.2.1"]
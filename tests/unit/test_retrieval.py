@@ -1,6 +1,6 @@
 from paperta.contracts import SectionInput
 from paperta.ingestion import ingest_document
-from paperta.retrieval import retrieve
+from paperta.retrieval import expand_context, retrieve
 
 
 def test_retrieval_orders_by_overlap_score():
@@ -14,3 +14,40 @@ def test_retrieval_orders_by_overlap_score():
     result = retrieve(query="transformer attention", ingested_paper=paper, top_k=2)
     assert len(result.hits) == 2
     assert result.hits[0].score >= result.hits[1].score
+
+
+def test_retrieval_points_at_best_matching_sentence():
+    sections = (
+        SectionInput(
+            label="Method",
+            text="We train on ImageNet, e.g. with crops. Dropout regularizes the attention layers.",
+        ),
+    )
+    paper = ingest_document(paper_id="p3", sections=sections, sentence_index=True)
+    hit = retrieve(query="dropout attention", ingested_paper=paper, top_k=1).hits[0]
+    start, end = hit.sentence_span
+    assert hit.text[start:end] == "Dropout regularizes the attention layers."
+
+    compact = ingest_document(paper_id="p3", sections=sections, sentence_index=True, columnar=True)
+    assert retrieve(query="dropout attention", ingested_paper=compact, top_k=1).hits[0] == hit
+
+    plain = ingest_document(paper_id="p3", sections=sections)
+    assert retrieve(query="dropout attention", ingested_paper=plain, top_k=1).hits[0].sentence_span is None
+
+
+def test_expand_context_returns_neighbours_within_section():
+    paper = ingest_document(
+        paper_id="p4",
+        sections=(
+            SectionInput(label="Intro", text="Alpha one.\n\nBeta two.\n\nGamma three."),
+            SectionInput(label="Method", text="Delta four."),
+        ),
+    )
+    hit = retrieve(query="gamma", ingested_paper=paper, top_k=1).hits[0]
+    assert [c.text for c in expand_context(paper, hit, radius=1)] == ["Beta two.", "Gamma three."]
+    assert [c.text for c in expand_context(paper, hit, radius=1, same_section=False)] == [
+        "Beta two.",
+        "Gamma three.",
+        "Delta four.",
+    ]
+    assert len(expand_context(paper, hit, radius=5)) == 3
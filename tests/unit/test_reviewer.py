@@ -1,7 +1,13 @@
 from paperta.contracts import RetrievalResult, SectionInput
 from paperta.ingestion import ingest_document
 from paperta.retrieval import retrieve
-from paperta.reviewer import NOT_STATED, generate_claim_evidence_matrix, generate_critique, generate_reproducibility_checklist
+from paperta.reviewer import (
+    NOT_STATED,
+    generate_claim_evidence_matrix,
+    generate_critique,
+    generate_reproducibility_checklist,
+    run_phase3_reviewer_pipeline,
+)
 
 
 def test_generate_claim_matrix_has_valid_support_grades():
@@ -48,3 +54,17 @@ def test_generate_critique_handles_evidence_and_fallback():
     assert empty_critique.strengths[0].text == NOT_STATED
     assert empty_critique.weaknesses[0].text == NOT_STATED
     assert empty_critique.threats_to_validity[0].text == NOT_STATED
+
+
+def test_claim_matrix_quotes_best_matching_sentence():
+    result = run_phase3_reviewer_pipeline(
+        paper_id="rev-unit-4",
+        sections=(
+            SectionInput(
+                label="Results",
+                text="We ran many experiments over three weeks. Precision improves by four points.",
+            ),
+        ),
+        review_query="precision improves",
+    )
+    assert result.claim_matrix.rows[0].claim == "Results claim: Precision improves by four points."
@@ -0,0 +1,13 @@
+from paperta.text_utils import scan_text, sentence_spans, split_sentence_ends
+
+
+def test_scan_text_normalizes_and_tokenizes_in_one_call():
+    scan = scan_text("  Self-Attention\n\n scales   (O(n^2)). ")
+    assert scan.text == "Self-Attention scales (O(n^2))."
+    assert scan.tokens == ("self", "attention", "scales", "o", "n", "2")
+
+
+def test_sentence_spans_skip_abbreviations():
+    text = "We follow Vaswani et al. closely. Results, e.g. F1, improve!"
+    spans = sentence_spans(text, split_sentence_ends(text))
+    assert [text[s:e] for s, e in spans] == ["We follow Vaswani et al. closely.", "Results, e.g. F1, improve!"]
@@ -0,0 +1,89 @@
+import atexit
+import runpy
+import sys
+import types
+from pathlib import Path
+
+from conftest import build_text_pdf
+from paperta import llm_providers
+from paperta.extraction_worker import ExtractionWorker
+
+_WEBAPP = Path(__file__).resolve().parents[2] / "src" / "paperta" / "webapp_streamlit_v2.py"
+
+
+def _fake_streamlit(warnings=None):
+    """Streamlit stand-in whose `cache_resource` outlives reruns, like the real one."""
+    resources = {}
+    warnings = [] if warnings is None else warnings
+
+    def cache_resource(func):
+        def cached():
+            if func.__qualname__ not in resources:
+                resources[func.__qualname__] = func()
+            return resources[func.__qualname__]
+
+        return cached
+
+    return types.SimpleNamespace(cache_resource=cache_resource, warning=warnings.append)
+
+
+def test_reruns_share_one_worker_and_caches(tmp_path, monkeypatch):
+    registered = []
+    monkeypatch.setitem(sys.modules, "streamlit", _fake_streamlit())
+    monkeypatch.setattr(atexit, "register", registered.append)
+    monkeypatch.setenv("PAPERTA_EXTRACTION_CACHE_DIR", str(tmp_path / "extract"))
+    monkeypatch.setenv("PAPERTA_LLM_CACHE_PATH", str(tmp_path / "llm.sqlite3"))
+
+    # Streamlit re-executes the script on every interaction.
+    first = runpy.run_path(str(_WEBAPP), run_name="rerun")
+    second = runpy.run_path(str(_WEBAPP), run_name="rerun")
+    for factory in ("_pdf_worker", "_extraction_cache", "_llm_cache"):
+        resource = first[factory]()
+        assert resource is not None
+        assert second[factory]() is resource
+    # The one worker is stopped at server exit.
+    assert registered.count(first["_pdf_worker"]().close) == 1
+
+
+def test_one_failed_paper_keeps_the_other_llm_results(tmp_path, monkeypatch):
+    warnings = []
+    monkeypatch.setitem(sys.modules, "streamlit", _fake_streamlit(warnings))
+    monkeypatch.setenv("PAPERTA_LLM_CACHE_PATH", str(tmp_path / "llm.sqlite3"))
+
+    async def fake_enhance(mode, query, result, provider, model, cache):
+        if getattr(result, "paper_id", None) == "p2":
+            raise RuntimeError("rate limited")
+        return f"{mode} of {getattr(result, 'paper_id', 'all')}"
+
+    monkeypatch.setattr(llm_providers, "aenhance_with_llm", fake_enhance)
+    monkeypatch.setattr(llm_providers, "is_provider_configured", lambda provider: True)
+    webapp = runpy.run_path(str(_WEBAPP), run_name="rerun")
+
+    papers = [types.SimpleNamespace(paper_id=pid) for pid in ("p1", "p2", "p3")]
+    result = types.SimpleNamespace(per_paper_retrieval=papers)
+    synthesis, per_paper = webapp["_try_multi_llm_enhance"]("q", result, "openai", "gpt-4o")
+    assert synthesis == "multi_paper of all"
+    assert per_paper == {"p1": "summary of p1", "p3": "summary of p3"}
+    assert len(warnings) == 1 and "p2" in warnings[0] and "rate limited" in warnings[0]
+
+
+def test_pdf_upload_takes_one_worker_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "streamlit", _fake_streamlit())
+    monkeypatch.setattr(atexit, "register", lambda func: None)
+    monkeypatch.setenv("PAPERTA_EXTRACTION_CACHE_DIR", str(tmp_path / "extract"))
+    ops = []
+    original = ExtractionWorker._call
+
+    def recording_call(self, op, args, page_texts=None):
+        ops.append(op)
+        return original(self, op, args, page_texts)
+
+    monkeypatch.setattr(ExtractionWorker, "_call", recording_call)
+    webapp = runpy.run_path(str(_WEBAPP), run_name="rerun")
+    content = build_text_pdf([["1. Introduction", "One parse per upload."]])
+    try:
+        text, sections = webapp["_load_upload"]("paper.pdf", content)
+    finally:
+        webapp["_pdf_worker"]().close()
+    assert "One parse per upload." in text and sections
+    assert ops == ["load"]